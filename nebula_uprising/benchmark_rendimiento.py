@@ -0,0 +1,562 @@
+"""
+Benchmarks de Rendimiento - Nebula Uprising
+Este módulo mide el costo de los sistemas críticos del juego de forma aislada
+para verificar cómo escalan con el número de entidades.
+"""
+
+import time
+import random
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, DRONE_SIZE, BULLET_WIDTH, BULLET_HEIGHT, FPS, PLAYER_BULLET_POOL_SIZE
+from systems.spatial_hash import SpatialHash
+from systems.scheduler import TimerWheel
+
+def _measure(function, repeats=5):
+    """Ejecutar una función varias veces y devolver el mejor tiempo en segundos"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# =====================================================
+# BENCHMARK 1: FASE AMPLIA DE COLISIONES
+# =====================================================
+
+class _Body:
+    """Cuerpo mínimo con rectángulo de colisión para el benchmark"""
+
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+def _make_bodies(count, width, height, rng, area_width=SCREEN_WIDTH, area_height=SCREEN_HEIGHT):
+    return [_Body(rng.randint(0, area_width - width), rng.randint(0, area_height - height), width, height)
+            for _ in range(count)]
+
+def _naive_pass(bullets, enemies):
+    hits = 0
+    for bullet in bullets:
+        for enemy in enemies:
+            if bullet.rect.colliderect(enemy.rect):
+                hits += 1
+                break
+    return hits
+
+def _grid_pass(grid, bullets, enemies):
+    hits = 0
+    grid.rebuild(enemies)
+    for bullet in bullets:
+        for enemy in grid.query(bullet.rect):
+            if bullet.rect.colliderect(enemy.rect):
+                hits += 1
+                break
+    return hits
+
+def benchmark_collision_broadphase(sizes=(50, 500, 1000, 2500, 5000), density_size=500,
+                                   playfield_enemies=(60, 270)):
+    """
+    Comparar el doble bucle O(balas × enemigos) contra la rejilla espacial.
+    La mitad de las entidades son balas y la otra mitad enemigos.
+
+    La densidad es constante: el área crece con el número de entidades, con
+    `density_size` entidades ocupando la pantalla. Así los pares que realmente se
+    tocan crecen linealmente y el costo por entidad mide solo la fase amplia (en un
+    área fija los impactos mismos crecen con el cuadrado de la densidad).
+
+    Además se mide la pantalla real del juego con los enemigos de `playfield_enemies`
+    (oleada más grande de la campaña y pico del modo infinito) contra la reserva
+    completa de balas del jugador.
+    """
+    print("=" * 60)
+    print("BENCHMARK: Fase amplia de colisiones")
+    print("=" * 60)
+    print(f"Densidad constante: {density_size} entidades por pantalla de {SCREEN_WIDTH}x{SCREEN_HEIGHT}\n")
+
+    rng = random.Random(12345)
+    results = []
+
+    print(f"{'Entidades':>10} {'Ingenuo (ms)':>14} {'Rejilla (ms)':>14} {'µs/entidad':>12}")
+    for size in sizes:
+        scale = (size / density_size) ** 0.5
+        area_width = max(DRONE_SIZE, round(SCREEN_WIDTH * scale))
+        area_height = max(DRONE_SIZE, round(SCREEN_HEIGHT * scale))
+        grid = SpatialHash(area_width, area_height)
+        enemies = _make_bodies(size // 2, DRONE_SIZE, DRONE_SIZE, rng, area_width, area_height)
+        bullets = _make_bodies(size - size // 2, BULLET_WIDTH, BULLET_HEIGHT, rng, area_width, area_height)
+
+        # Ambas fases deben encontrar exactamente los mismos impactos
+        assert _naive_pass(bullets, enemies) == _grid_pass(grid, bullets, enemies)
+
+        naive_time = _measure(lambda: _naive_pass(bullets, enemies), repeats=1 if size > 1000 else 5)
+        grid_time = _measure(lambda: _grid_pass(grid, bullets, enemies))
+        per_entity = grid_time / size * 1e6
+        results.append((size, naive_time, grid_time))
+
+        print(f"{size:>10} {naive_time * 1000:>14.2f} {grid_time * 1000:>14.2f} {per_entity:>12.2f}")
+
+    # Escalamiento: con crecimiento lineal el costo por entidad se mantiene estable
+    first_size, _, first_time = results[0]
+    last_size, _, last_time = results[-1]
+    growth = (last_time / first_time) / (last_size / first_size)
+    print(f"\nCrecimiento relativo al lineal ({first_size}→{last_size}): {growth:.2f}x")
+    print(f"Escalamiento: {'CASI LINEAL' if growth < 2.0 else 'SUPERLINEAL'}")
+
+    # Pantalla real: área fija de juego con los conteos que alcanza una partida
+    print(f"\nPantalla real {SCREEN_WIDTH}x{SCREEN_HEIGHT}, {PLAYER_BULLET_POOL_SIZE} balas del jugador:")
+    print(f"{'Enemigos':>10} {'Ingenuo (ms)':>14} {'Rejilla (ms)':>14} {'% del frame':>12}")
+    frame_time = 1.0 / FPS
+    playfield = []
+    grid = SpatialHash()
+    for count in playfield_enemies:
+        enemies = _make_bodies(count, DRONE_SIZE, DRONE_SIZE, rng)
+        bullets = _make_bodies(PLAYER_BULLET_POOL_SIZE, BULLET_WIDTH, BULLET_HEIGHT, rng)
+        assert _naive_pass(bullets, enemies) == _grid_pass(grid, bullets, enemies)
+
+        naive_time = _measure(lambda: _naive_pass(bullets, enemies))
+        grid_time = _measure(lambda: _grid_pass(grid, bullets, enemies))
+        playfield.append((count, naive_time, grid_time))
+        print(f"{count:>10} {naive_time * 1000:>14.3f} {grid_time * 1000:>14.3f} {grid_time / frame_time * 100:>11.1f}%")
+
+    return {
+        'resultados': results,
+        'crecimiento_relativo': growth,
+        'casi_lineal': growth < 2.0,
+        'pantalla_real': playfield
+    }
+
+# =====================================================
+# DISPOSICIÓN ORIGINAL (REFERENCIA "ANTES")
+# =====================================================
+
+class _LegacyEntity:
+    """
+    Entidad con la disposición original, antes de __slots__, sprites compartidos y
+    EntityStore: __dict__ por instancia, rectángulo propio y sprites escalados para
+    cada instancia. Solo sirve de referencia para los benchmarks.
+    """
+
+    def __init__(self, x, y, width, height, **fields):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = None
+        self.image = None
+        self.rect = pygame.Rect(x, y, width, height)
+        self.__dict__.update(fields)
+
+def _own_surface(width, height):
+    """Superficie propia del tamaño al que cada instancia escalaba su sprite"""
+    return pygame.Surface((width, height), pygame.SRCALPHA)
+
+def _legacy_factories():
+    """Constructores con los campos y sprites por instancia de las clases originales"""
+    from config.settings import (MARKOV_SIZE, POWERUP_SIZE, DRONE_SPEED, MARKOV_SPEED,
+                                 MISSILE_SPEED, POWERUP_SPEED)
+
+    def drone(i):
+        return _LegacyEntity(i % SCREEN_WIDTH, 100, DRONE_SIZE, DRONE_SIZE, direction=1, speed=DRONE_SPEED,
+                             move_timer=0, move_interval=30 + i % 30, enemy_type="drone_tonto",
+                             current_state="deambular",
+                             images={state: _own_surface(DRONE_SIZE * 3, DRONE_SIZE * 3)
+                                     for state in ("deambular", "atacar", "patrullar")})
+
+    def markov(i):
+        return _LegacyEntity(i % SCREEN_WIDTH, 100, MARKOV_SIZE, MARKOV_SIZE, state=0, speed=MARKOV_SPEED,
+                             direction=1, state_timer=0, state_duration=60, target_x=i % SCREEN_WIDTH,
+                             bullets=[], enemy_type="drone_bravo", MARGIN=80, MIN_X=80,
+                             MAX_X=SCREEN_WIDTH - MARKOV_SIZE - 80,
+                             images={state: _own_surface(MARKOV_SIZE * 2, MARKOV_SIZE * 2) for state in range(3)})
+
+    return {
+        'Bullet': lambda i: _LegacyEntity(i % SCREEN_WIDTH, 400, BULLET_WIDTH, BULLET_HEIGHT, speed=-5,
+                                          sprite=_own_surface(BULLET_WIDTH, BULLET_HEIGHT)),
+        'HomingMissile': lambda i: _LegacyEntity(i % SCREEN_WIDTH, 100, 10, 10, target=None, speed=MISSILE_SPEED,
+                                                 angle=0, sprite=_own_surface(10, 10), locked=False,
+                                                 locked_target_pos=(0, 0), locked_direction=(0, 0)),
+        'PowerUp': lambda i: _LegacyEntity(i % SCREEN_WIDTH, 100, POWERUP_SIZE, POWERUP_SIZE, power_type="shield",
+                                           speed=POWERUP_SPEED, image=_own_surface(POWERUP_SIZE, POWERUP_SIZE)),
+        'DroneEnemy': drone,
+        'MarkovEnemy': markov
+    }
+
+def _legacy_drone_update(drone, prng, margin=15):
+    """DroneEnemy.update original sobre una entidad con __dict__ (rectángulo nuevo en cada tick)"""
+    drone.move_timer += 1
+    if drone.move_timer >= drone.move_interval:
+        if drone.x <= margin:
+            drone.direction = 1
+        elif drone.x >= SCREEN_WIDTH - drone.width - margin:
+            drone.direction = -1
+        else:
+            drone.direction = prng.next_choice([-1, 1])
+        drone.move_timer = 0
+        drone.move_interval = int(30 + prng.next() * 30)
+
+    drone.x += drone.direction * drone.speed
+    drone.x = max(0, min(drone.x, SCREEN_WIDTH - drone.width))
+    drone.rect = pygame.Rect(drone.x, drone.y, drone.width, drone.height)
+
+# =====================================================
+# BENCHMARK 2: MOVIMIENTO EN ARREGLOS (SoA)
+# =====================================================
+
+def benchmark_entity_store(sizes=(100, 1000, 10000), ticks=20):
+    """
+    Comparar la actualización objeto por objeto de los drones contra los
+    núcleos vectorizados del EntityStore (caminata aleatoria + descenso).
+    "Original" usa la disposición de antes (objetos con __dict__ y la lógica de
+    DroneEnemy.update sin cambios); "Objetos" usa las clases actuales con __slots__.
+    """
+    from entities.enemies import DroneEnemy
+    from entities.store import EntityStore, KIND_DRONE
+    from utils.random_loader import PseudoRandom
+
+    print("=" * 60)
+    print("BENCHMARK: Movimiento en arreglos (SoA)")
+    print("=" * 60)
+
+    rng = random.Random(12345)
+    results = []
+
+    legacy_drone = _legacy_factories()['DroneEnemy']
+
+    print(f"{'Drones':>10} {'Original (ms)':>14} {'Objetos (ms)':>14} {'Arreglos (ms)':>14} {'vs original':>12}")
+    for size in sizes:
+        positions = [(rng.randint(0, SCREEN_WIDTH - DRONE_SIZE), rng.randint(50, 150)) for _ in range(size)]
+        legacy = [legacy_drone(i) for i in range(size)]
+        for drone, (x, y) in zip(legacy, positions):
+            drone.x, drone.y = x, y
+        drones = [DroneEnemy(x, y) for x, y in positions]
+        store = EntityStore()
+        for x, y in positions:
+            store.add(DroneEnemy(x, y), KIND_DRONE)
+
+        def legacy_pass():
+            prng = PseudoRandom(seed=1)
+            for _ in range(ticks):
+                for drone in legacy:
+                    _legacy_drone_update(drone, prng)
+                    drone.y += 1.0
+
+        def object_pass():
+            for _ in range(ticks):
+                for drone in drones:
+                    drone.update()
+                    drone.y += 1.0
+
+        def store_pass():
+            prng = PseudoRandom(seed=1)
+            for _ in range(ticks):
+                store.step_random_walk(prng)
+                store.advance(1.0, KIND_DRONE)
+
+        legacy_time = _measure(legacy_pass, repeats=1 if size > 1000 else 3)
+        object_time = _measure(object_pass, repeats=1 if size > 1000 else 3)
+        store_time = _measure(store_pass, repeats=1 if size > 1000 else 3)
+        speedup = legacy_time / store_time
+        results.append((size, legacy_time, object_time, store_time, speedup))
+
+        print(f"{size:>10} {legacy_time * 1000:>14.2f} {object_time * 1000:>14.2f} "
+              f"{store_time * 1000:>14.2f} {speedup:>11.1f}x")
+
+    return {'resultados': results}
+
+# =====================================================
+# BENCHMARK 3: MEMORIA POR ENTIDAD
+# =====================================================
+
+def _sprite_bytes(entities):
+    """Bytes de píxeles de las superficies distintas referenciadas por las entidades"""
+    surfaces = {}
+    for entity in entities:
+        candidates = [getattr(entity, "image", None), getattr(entity, "sprite", None)]
+        images = getattr(entity, "images", None)
+        if images:
+            candidates.extend(images.values())
+        for surface in candidates:
+            if isinstance(surface, pygame.Surface):
+                surfaces[id(surface)] = surface
+    return sum(surface.get_width() * surface.get_height() * surface.get_bytesize()
+               for surface in surfaces.values())
+
+def benchmark_entity_memory(count=2000):
+    """
+    Medir los bytes por entidad de cada clase: memoria de objetos Python
+    (tracemalloc), píxeles de sprites propios de cada instancia y, en las clases
+    que guardan sus campos en columnas (EntityStore o ProjectilePool), los bytes
+    de su fila. "Antes" es la disposición original (_LegacyEntity).
+    """
+    import tracemalloc
+    import numpy as np
+    from entities.enemies import DroneEnemy, MarkovEnemy
+    from entities.powerups import PowerUp
+    from entities.projectiles import Bullet, HomingMissile
+    from entities.store import EntityStore, StoreField
+
+    print("=" * 60)
+    print("BENCHMARK: Memoria por entidad")
+    print("=" * 60)
+
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    # Una sola rueda para todos los Markov, como scheduler.wheel(ENEMY_MARKOV) en GameManager
+    markov_timers = TimerWheel()
+    markov_queue = []
+    factories = {
+        'Bullet': lambda i: Bullet(i % SCREEN_WIDTH, 400, -5),
+        'HomingMissile': lambda i: HomingMissile(i % SCREEN_WIDTH, 100, None),
+        'PowerUp': lambda i: PowerUp(i % SCREEN_WIDTH, 100, "shield"),
+        'DroneEnemy': lambda i: DroneEnemy(i % SCREEN_WIDTH, 100),
+        'MarkovEnemy': lambda i: MarkovEnemy(i % SCREEN_WIDTH, 100, None, markov_timers, markov_queue)
+    }
+
+    legacy_factories = _legacy_factories()
+
+    # Crear una instancia previa para que las cachés compartidas no cuenten por entidad
+    for factory in factories.values():
+        factory(0)
+
+    store_row = sum(np.dtype(dtype).itemsize for dtype in EntityStore.FIELDS.values()) + 1  # + tipo
+
+    def column_bytes(entity_class):
+        """Bytes de la fila que ocupa la entidad en las columnas de su almacén"""
+        if entity_class.store_kind is not None:
+            return store_row
+        fields = [name for name in dir(entity_class) if isinstance(getattr(entity_class, name), StoreField)]
+        return 8 * len(fields)
+
+    def measure(factory):
+        """Bytes Python y de sprites por entidad de una fábrica"""
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        entities = [factory(i) for i in range(count)]
+        python_bytes = (tracemalloc.get_traced_memory()[0] - before) / count
+        tracemalloc.stop()
+        return python_bytes, _sprite_bytes(entities) / count
+
+    results = {}
+    print(f"{'Clase':>14} {'Antes (B)':>12} {'Python (B)':>12} {'Sprites (B)':>12} {'Columnas (B)':>13} "
+          f"{'Después (B)':>12} {'Ahorro':>8}")
+    for name, factory in factories.items():
+        legacy_python, legacy_sprites = measure(legacy_factories[name])
+        python_bytes, sprite_bytes = measure(factory)
+        columns = column_bytes(type(factory(0)))
+        before = legacy_python + legacy_sprites
+        after = python_bytes + sprite_bytes + columns
+        results[name] = {'antes': before, 'despues': after,
+                         'python': python_bytes, 'sprites': sprite_bytes, 'columnas': columns}
+        print(f"{name:>14} {before:>12.0f} {python_bytes:>12.0f} {sprite_bytes:>12.0f} {columns:>13.0f} "
+              f"{after:>12.0f} {1 - after / before:>7.0%}")
+
+    return {'bytes_por_entidad': results}
+
+# =====================================================
+# BENCHMARK 4: TRANSICIONES MARKOV EN LOTE
+# =====================================================
+
+def benchmark_markov_transitions(sizes=(1, 100, 10000), steps=50):
+    """
+    Comparar un np.random.choice por agente contra el sorteo en lote sobre las
+    filas acumuladas de TRANSITION_MATRIX (ruta escalar cuando hay un solo agente).
+    """
+    import numpy as np
+    from entities.enemies import TRANSITION_MATRIX, markov_transition, markov_transitions
+
+    print("=" * 60)
+    print("BENCHMARK: Transiciones Markov en lote")
+    print("=" * 60)
+
+    results = []
+    print(f"{'Agentes':>10} {'choice (ms)':>14} {'Lote (ms)':>14} {'Aceleración':>12}")
+    for size in sizes:
+        initial = np.random.RandomState(size).randint(0, 3, size)
+
+        def choice_pass():
+            states = initial.tolist()
+            for _ in range(steps):
+                states = [np.random.choice(3, p=TRANSITION_MATRIX[state]) for state in states]
+
+        def batch_pass():
+            states = initial
+            for _ in range(steps):
+                states = np.array([markov_transition(states[0])]) if size == 1 else markov_transitions(states)
+
+        choice_time = _measure(choice_pass, repeats=1 if size > 1000 else 3) / steps
+        batch_time = _measure(batch_pass, repeats=1 if size > 1000 else 3) / steps
+        speedup = choice_time / batch_time
+        results.append((size, choice_time, batch_time, speedup))
+
+        print(f"{size:>10} {choice_time * 1000:>14.4f} {batch_time * 1000:>14.4f} {speedup:>11.1f}x")
+
+    return {'resultados': results}
+
+# =====================================================
+# BENCHMARK 5: GENERADORES PSEUDOALEATORIOS
+# =====================================================
+
+def benchmark_prng_backends(scalar_draws=200000, block_draws=1000000, quality_samples=100000):
+    """
+    Comparar los generadores de PRNG_BACKENDS: valores por segundo con next() y
+    con next_block(), más el chi-cuadrado y la correlación serial de utils.prng_stats.
+    """
+    import math
+    from utils.random_loader import PRNG_BACKENDS, create_prng
+    from utils.prng_stats import uniformity_chi_square, serial_correlation
+
+    print("=" * 60)
+    print("BENCHMARK: Generadores pseudoaleatorios")
+    print("=" * 60)
+
+    results = {}
+    correlation_limit = 2 / math.sqrt(quality_samples)
+    print(f"{'Generador':>10} {'next()/s':>12} {'bloque/s':>12} {'Chi-cuadrado':>13} {'Corr. serial':>13}")
+    for name in PRNG_BACKENDS:
+        prng = create_prng(12345, name)
+
+        def scalar_pass():
+            draw = prng.next
+            for _ in range(scalar_draws):
+                draw()
+
+        scalar_rate = scalar_draws / _measure(scalar_pass, repeats=3)
+        block_rate = block_draws / _measure(lambda: prng.next_block(block_draws), repeats=3)
+
+        samples = create_prng(12345, name).next_block(quality_samples)
+        _, chi_square = uniformity_chi_square(samples)
+        correlation = serial_correlation(samples)
+        results[name] = {
+            'next_por_segundo': scalar_rate,
+            'bloque_por_segundo': block_rate,
+            'chi_cuadrado': chi_square,
+            'correlacion_serial': correlation,
+            'aprobado': chi_square < 16.92 and abs(correlation) < correlation_limit
+        }
+
+        print(f"{name:>10} {scalar_rate:>12,.0f} {block_rate:>12,.0f} {chi_square:>13.2f} {correlation:>13.4f}")
+    print(f"Chi-cuadrado menor que 16.92 y |correlación| menor que {correlation_limit:.4f} = bueno")
+
+    return {'resultados': results}
+
+# =====================================================
+# BENCHMARK 6: ESTRÉS DE FRAME CON N ENEMIGOS
+# =====================================================
+
+def benchmark_stress_frame(sizes=(300, 1000, 3000), frames=120, warmup=10):
+    """
+    Sostener N enemigos en pantalla (mitad drones, mitad Markov) en un GameManager
+    real con pantalla y medir update() y draw() por frame contra el presupuesto 1/FPS.
+    Los enemigos destruidos o que cruzan la línea de las colonias se reponen arriba;
+    el jugador dispara en ráfaga con escudo para que la partida no termine.
+    """
+    from game.game_manager import GameManager
+    from entities.enemies import ENEMY_DRONE, ENEMY_MARKOV
+
+    print("=" * 60)
+    print("BENCHMARK: Estrés de frame con N enemigos en pantalla")
+    print("=" * 60)
+
+    if not pygame.get_init():
+        pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.HIDDEN)
+    frame_time = 1.0 / FPS
+    dt = frame_time
+    results = []
+
+    print(f"{'Enemigos':>10} {'update (ms)':>12} {'draw (ms)':>12} {'Frame (ms)':>12} {'% del frame':>12}")
+    for size in sizes:
+        game = GameManager(screen, seed=12345)
+        rng = random.Random(size)
+        game.score = 1  # Sin game over por inactividad
+
+        def top_up():
+            missing = size - len(game.enemies)
+            for i in range(missing):
+                enemy_type = ENEMY_DRONE if i % 2 else ENEMY_MARKOV
+                game.spawn_enemy(enemy_type, rng.randint(0, SCREEN_WIDTH - DRONE_SIZE), rng.randint(40, 400))
+
+        update_time = draw_time = 0.0
+        for frame in range(warmup + frames):
+            game.player.shield = True
+            game.player.shield_duration = FPS
+            game.colony_health = game.max_colony_health
+            if frame % 4 == 0:
+                game.player.shoot()
+            top_up()
+
+            start = time.perf_counter()
+            game.update(dt)
+            middle = time.perf_counter()
+            game.draw()
+            end = time.perf_counter()
+            if frame >= warmup:
+                update_time += middle - start
+                draw_time += end - middle
+
+        update_ms = update_time / frames * 1000
+        draw_ms = draw_time / frames * 1000
+        total_ms = update_ms + draw_ms
+        results.append((size, update_ms, draw_ms))
+        print(f"{size:>10} {update_ms:>12.2f} {draw_ms:>12.2f} {total_ms:>12.2f} "
+              f"{total_ms / (frame_time * 1000):>11.0%}")
+    print(f"Presupuesto por frame a {FPS} FPS: {frame_time * 1000:.1f} ms (sin contar el flip de pantalla)")
+
+    return {'resultados': results}
+
+# =====================================================
+# BENCHMARK 7: PILOTO AUTOMÁTICO HEADLESS
+# =====================================================
+
+def benchmark_autopilot_headless(seeds=(12345, 12346, 12347), repeats=3, min_speedup=100.0):
+    """
+    Jugar partidas headless completas con el piloto automático y medir cuántas veces
+    más rápido que el tiempo real avanzan (mejor de `repeats` por semilla).
+    Falla si alguna semilla queda por debajo de `min_speedup`.
+    """
+    from game.headless import run_headless
+    from game.autopilot import AutopilotInput
+
+    print("=" * 60)
+    print("BENCHMARK: Piloto automático headless")
+    print("=" * 60)
+
+    results = []
+    print(f"{'Semilla':>10} {'Resultado':>10} {'Ticks':>8} {'Tiempo (s)':>11} {'Velocidad':>10}")
+    for seed in seeds:
+        runs = [run_headless(AutopilotInput(), seed) for _ in range(repeats)]
+        best = max(runs, key=lambda summary: summary['speedup'])
+        results.append((seed, best['outcome'], best['ticks'], best['elapsed'], best['speedup']))
+        print(f"{seed:>10} {best['outcome']:>10} {best['ticks']:>8} {best['elapsed']:>11.3f} "
+              f"{best['speedup']:>9.0f}x")
+
+    slowest = min(speedup for *_, speedup in results)
+    print(f"Objetivo: {min_speedup:.0f}x el tiempo real (más lenta: {slowest:.0f}x)")
+    if slowest < min_speedup:
+        raise AssertionError(f"El piloto automático headless va a {slowest:.0f}x, por debajo de {min_speedup:.0f}x")
+
+    return {'resultados': results}
+
+# =====================================================
+# EJECUCIÓN PRINCIPAL
+# =====================================================
+
+def run_all_benchmarks():
+    """Ejecutar todos los benchmarks de rendimiento"""
+    results = {}
+    results['colisiones'] = benchmark_collision_broadphase()
+    results['almacen_soa'] = benchmark_entity_store()
+    results['memoria'] = benchmark_entity_memory()
+    results['transiciones_markov'] = benchmark_markov_transitions()
+    results['generadores'] = benchmark_prng_backends()
+    results['estres_frame'] = benchmark_stress_frame()
+    results['piloto_headless'] = benchmark_autopilot_headless()
+    return results
+
+if __name__ == "__main__":
+    print("BENCHMARKS DE RENDIMIENTO")
+    print("Nebula Uprising - Análisis de Escalabilidad")
+    print("=" * 60)
+
+    run_all_benchmarks()
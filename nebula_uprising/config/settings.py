@@ -2,6 +2,8 @@
 Configuraciones del juego Nebula Uprising
 """
 
+import os
+
 # Configuración de pantalla
 SCREEN_WIDTH = 650
 SCREEN_HEIGHT = 800
@@ -28,6 +30,27 @@ BULLET_WIDTH = 4
 BULLET_HEIGHT = 10
 MISSILE_SPEED = 2.0
 
+# Capacidad de las reservas de proyectiles
+PLAYER_BULLET_POOL_SIZE = 64
+ENEMY_BULLET_POOL_SIZE = 256
+MISSILE_POOL_SIZE = 32
+
+# Almacén de entidades en arreglos (movimiento vectorizado de drones, Markov y power-ups)
+USE_ENTITY_STORE = True
+
+# Escalas de tiempo durante el slow time (fracción de ticks en que avanza cada sistema;
+# los proyectiles hostiles la usan como factor de velocidad en cada tick)
+SLOW_TIME_SCALE = 0.25        # Descenso, drones, enemigos Markov y sus balas
+SLOW_TIME_BOSS_SCALE = 1 / 3  # Jefe final, sus misiles y power-ups
+SLOW_TIME_SPAWN_SCALE = 0.3   # Temporizador de aparición de enemigos
+
+# Configuración de colisiones
+COLLISION_CELL_SIZE = 64  # Tamaño inicial de celda de la rejilla espacial (px)
+COLLISION_CELL_FACTOR = 2  # La celda se ajusta a este múltiplo de la extensión media de las entidades
+PIXEL_PERFECT_COLLISIONS = False  # Fase estrecha opcional con máscaras sobre el sprite visible
+COLLISION_DIRECT_PAIRS = 256  # Con hasta tantos pares bala-enemigo se prueban todos sin rejilla
+COLLISION_SWEPT_LIST_MAX = 16  # Con hasta tantos proyectiles, sus rectángulos de barrido se calculan sin NumPy
+
 # Configuración de power-ups
 POWERUP_SIZE = 20
 POWERUP_SPEED = 2
@@ -48,34 +71,27 @@ POWERUP_PROBABILITIES = {
     "none": 0.55
 }
 
-# Configuración de oleadas
-WAVE_CONFIGS = {
-    1: {
-        "enemies": [("drone", 5)],
-        "duration": 800,
-        "spawn_rate": 120,
-        "narrative": "first_wave",
-        "name": "Reconocimiento XARN"
-    },
-    2: {
-        "enemies": [("drone", 3), ("markov", 2)],
-        "duration": 1000,
-        "spawn_rate": 100,
-        "narrative": "markov_enemy",
-        "name": "Protocolo Adaptativo"
-    },
-    3: {
-        "enemies": [("drone", 2), ("markov", 4)],
-        "duration": 1200,
-        "spawn_rate": 80,
-        "narrative": None,
-        "name": "Asalto Coordinado"
-    },
-    4: {
-        "enemies": [("boss", 1)],
-        "duration": -1,
-        "spawn_rate": -1,
-        "narrative": "boss_spawn",
-        "name": "NÚCLEO XARN DETECTADO"
-    }
-}
\ No newline at end of file
+# Generador pseudoaleatorio del juego: "lcg" (original), "pcg64" o "xorshift"
+PRNG_BACKEND = "lcg"
+RNG_SEED = 12345                    # Semilla de la partida: de ella salen todos los flujos del registro
+RNG_PREFETCH = 256                  # Valores que cada flujo precarga en bloque
+
+# Configuración de oleadas (un archivo JSON/TOML por oleada, en orden de nombre)
+WAVES_DIR = os.path.join("nebula_uprising", "assets", "waves")
+
+# Modo infinito / estrés: oleadas procedurales que crecen hasta miles de enemigos
+ENDLESS_SEED = 2077
+ENDLESS_BASE_ENEMIES = 60           # Enemigos de la primera oleada infinita
+ENDLESS_GROWTH = 1.5                # Factor de crecimiento por oleada
+ENDLESS_MAX_WAVE_ENEMIES = 5000     # Tope de enemigos por oleada
+ENDLESS_MAX_ACTIVE_ENEMIES = 3000   # Tope de enemigos vivos (el spawn se aplaza al alcanzarlo)
+ENDLESS_SPAWN_WINDOW = 600          # Ticks en los que se reparten las apariciones de una oleada
+FAST_SPRITE_THRESHOLD = 300         # Enemigos vivos a partir de los que se dibujan en lote con colorkey
+
+# Presupuesto de entidades (los proyectiles usan la capacidad de su reserva como tope)
+ENTITY_BUDGET_GLOBAL_CAP = 4000     # Tope de entidades vivas sumando todas las categorías
+BOSS_DRONE_CAP = 40                 # Drones invocados por el jefe vivos a la vez
+POWERUP_CAP = 32                    # Power-ups cayendo a la vez
+
+# Simulación headless (sin ventana, audio ni ritmo de fotogramas)
+HEADLESS_MAX_TICKS = FPS * 60 * 15  # Tope de ticks por partida simulada (15 minutos de juego)
@@ -2,4 +2,7 @@ from .base import Entity
 from .player import Player
 from .enemies import DroneEnemy, MarkovEnemy, BossFinalAgent
 from .projectiles import Bullet, HomingMissile
-from .powerups import PowerUp
\ No newline at end of file
+from .powerups import PowerUp
+from .pool import ProjectilePool
+from .collection import EntityList, EntityBuckets
+from .store import EntityStore, StoreField
\ No newline at end of file
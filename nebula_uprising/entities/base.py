@@ -1,9 +1,87 @@
 import pygame
 
+# Imágenes cargadas por ruta (una sola lectura de disco por proceso)
+_IMAGE_CACHE = {}
+
+def load_image(path):
+    """
+    Cargar una imagen una sola vez. Solo se convierte al formato de la pantalla si hay
+    ventana; sin ella (simulación headless) se usa tal cual, con el mismo alfa y máscaras.
+    """
+    converted = pygame.display.get_surface() is not None
+    key = (path, converted)
+    image = _IMAGE_CACHE.get(key)
+    if image is None:
+        image = pygame.image.load(path)
+        if converted:
+            image = image.convert_alpha()
+        _IMAGE_CACHE[key] = image
+    return image
+
+# Máscaras de colisión compartidas por sprite y estado
+_MASK_CACHE = {}
+
+def get_cached_mask(key, surface):
+    """Obtener la máscara de un sprite, calculada una sola vez por clave"""
+    mask = _MASK_CACHE.get(key)
+    if mask is None:
+        mask = pygame.mask.from_surface(surface)
+        _MASK_CACHE[key] = mask
+    return mask
+
+def get_solid_mask(size):
+    """Obtener una máscara completamente llena para entidades sin sprite"""
+    key = ("solid", size)
+    mask = _MASK_CACHE.get(key)
+    if mask is None:
+        mask = pygame.mask.Mask(size, fill=True)
+        _MASK_CACHE[key] = mask
+    return mask
+
+_FAST_SPRITE_CACHE = {}
+FAST_SPRITE_COLORKEY = (255, 0, 255)
+
+def get_fast_sprite(image):
+    """
+    Versión opaca con colorkey (RLE) de un sprite con alfa, calculada una sola vez.
+    Con miles de enemigos en pantalla el blit con alfa por píxel domina el frame;
+    el colorkey RLE solo copia los píxeles visibles (bordes sin suavizado).
+    """
+    fast = _FAST_SPRITE_CACHE.get(id(image))
+    if fast is None:
+        fast = pygame.Surface(image.get_size()).convert()
+        fast.fill((0, 0, 0))
+        fast.blit(image, (0, 0))
+        transparent = pygame.mask.from_surface(image)
+        transparent.invert()
+        transparent.to_surface(fast, setcolor=FAST_SPRITE_COLORKEY, unsetcolor=None)
+        fast.set_colorkey(FAST_SPRITE_COLORKEY, pygame.RLEACCEL)
+        # La imagen original queda referenciada para que su id no se reutilice
+        _FAST_SPRITE_CACHE[id(image)] = fast = (fast, image)
+    return fast[0]
+
 class Entity:
     """Clase base para todas las entidades del juego"""
 
+    # Atributos fijos (sin __dict__ por instancia)
+    __slots__ = ("x", "y", "width", "height", "color", "image", "_rect",
+                 "alive", "list_index", "_store", "_slot")
+
+    # Tipo dentro del EntityStore (None = la entidad no se almacena en arreglos)
+    store_kind = None
+
+    # Capacidades declaradas por cada clase
+    bucket = None         # Contenedor de EntityBuckets al que pertenece
+    colony_damage = 0     # Daño a las colonias si cruza la línea de defensa
+    slow_time_scale = 1.0 # Fracción de ticks en que se actualiza durante el slow time
+
     def __init__(self, x, y, width, height, color=None, image=None):
+        # Estado dentro de un EntityStore y de una EntityList
+        self._store = None
+        self._slot = -1
+        self.alive = True
+        self.list_index = -1
+
         self.x = x
         self.y = y
         self.width = width
@@ -11,14 +89,26 @@ class Entity:
         self.color = color
         self.image = None  # 🔧 Inicializar siempre
 
-        # Si se proporciona imagen, se escala y se asigna
+        # Si se proporciona imagen, se escala (solo si hace falta) y se asigna
         if image is not None:
-            self.image = pygame.transform.scale(image, (width, height))
+            if image.get_size() != (width, height):
+                image = pygame.transform.scale(image, (width, height))
+            self.image = image
 
-        # Crear el rectángulo de colisión
-        self.rect = pygame.Rect(x, y, width, height)
-        if self.image:
-            self.rect = self.image.get_rect(topleft=(x, y))
+        # Crear el rectángulo de colisión (único por entidad, se modifica en el lugar)
+        self._rect = pygame.Rect(x, y, width, height)
+
+    @property
+    def rect(self):
+        """Rectángulo de colisión, sincronizado con (x, y) solo cuando se lee"""
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        return rect
+
+    @rect.setter
+    def rect(self, value):
+        self._rect = value
 
     def draw(self, screen):
         """Dibujar la entidad en pantalla"""
@@ -28,11 +118,16 @@ class Entity:
             pygame.draw.rect(screen, self.color, self.rect)
 
     def update_rect(self):
-        """Actualizar el rectángulo de colisión"""
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        if self.image:
-            self.rect.topleft = (self.x, self.y)
+        """Actualizar el tamaño del rectángulo de colisión (la posición se sincroniza al leerlo)"""
+        self._rect.size = (self.width, self.height)
+
+    def get_hitbox(self):
+        """Rectángulo del área visible, usado por la fase amplia precisa"""
+        return self.rect
+
+    def get_mask(self):
+        """Máscara de colisión alineada con get_hitbox() (None = rectángulo sólido)"""
+        return None
 
     def update(self):
         """Actualizar la entidad (puede ser extendida)"""
-        self.update_rect()
@@ -0,0 +1,114 @@
+"""
+Colección de entidades con eliminación diferida
+"""
+
+class EntityList:
+    """
+    Lista de entidades con eliminación en O(1).
+    remove() solo marca la entidad como muerta; compact() la saca de la lista
+    (intercambio con la última) una sola vez al final del tick.
+    """
+
+    def __init__(self):
+        self.items = []   # Entidades (vivas y muertas pendientes de compactar)
+        self.dead = []    # Entidades marcadas como muertas en este tick
+
+    def append(self, entity):
+        """Agregar una entidad al final de la lista"""
+        entity.alive = True
+        entity.list_index = len(self.items)
+        self.items.append(entity)
+
+    def remove(self, entity):
+        """Marcar una entidad como muerta (se elimina en compact())"""
+        if entity.alive:
+            entity.alive = False
+            self.dead.append(entity)
+
+    def compact(self):
+        """Sacar de la lista todas las entidades muertas en O(1) cada una"""
+        items = self.items
+        for entity in self.dead:
+            index = entity.list_index
+            last = items.pop()
+            if last is not entity:
+                items[index] = last
+                last.list_index = index
+            entity.list_index = -1
+        self.dead.clear()
+
+    def clear(self):
+        """Quitar todas las entidades"""
+        for entity in self.items:
+            entity.alive = False
+            entity.list_index = -1
+        self.items.clear()
+        self.dead.clear()
+
+    def __iter__(self):
+        """
+        Recorrer las entidades vivas sin copiar la lista.
+        Es seguro llamar a remove() durante el recorrido; lo que se agregue
+        durante el recorrido se visita a partir del siguiente.
+        """
+        items = self.items
+        for index in range(len(items)):
+            entity = items[index]
+            if entity.alive:
+                yield entity
+
+    def __contains__(self, entity):
+        index = getattr(entity, "list_index", -1)
+        return entity.alive and 0 <= index < len(self.items) and self.items[index] is entity
+
+    def __len__(self):
+        return len(self.items) - len(self.dead)
+
+class EntityBuckets:
+    """
+    Entidades agrupadas en una EntityList por tipo (atributo de clase `bucket`).
+    Cada subsistema recorre solo el contenedor que necesita, sin isinstance.
+    El total de vivas se lleva en un contador (len() se consulta varias veces por tick).
+    """
+
+    def __init__(self, *kinds):
+        self.buckets = {kind: EntityList() for kind in kinds}
+        self.count = 0
+
+    def get_bucket(self, kind):
+        """Obtener el contenedor de un tipo de entidad"""
+        return self.buckets[kind]
+
+    def append(self, entity):
+        """Agregar una entidad al contenedor de su tipo"""
+        self.buckets[entity.bucket].append(entity)
+        self.count += 1
+
+    def remove(self, entity):
+        """Marcar una entidad como muerta en el contenedor de su tipo"""
+        if entity.alive:
+            self.count -= 1
+        self.buckets[entity.bucket].remove(entity)
+
+    def compact(self):
+        """Compactar todos los contenedores"""
+        for bucket in self.buckets.values():
+            bucket.compact()
+
+    def clear(self):
+        """Quitar todas las entidades"""
+        for bucket in self.buckets.values():
+            bucket.clear()
+        self.count = 0
+
+    def __iter__(self):
+        """Recorrer las entidades vivas de todos los contenedores"""
+        for bucket in self.buckets.values():
+            yield from bucket
+
+    def __contains__(self, entity):
+        bucket = self.buckets.get(entity.bucket)
+        return bucket is not None and entity in bucket
+
+    def __len__(self):
+        return self.count
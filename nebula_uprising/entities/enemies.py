@@ -3,18 +3,27 @@ Clases de enemigos
 """
 
 import pygame
-import random
 import math
+import bisect
 import numpy as np
-from utils.random_loader import PseudoRandom
+from utils.rng_registry import RNG, STREAM_AI, STREAM_SPAWN
 from enum import Enum
-from entities.base import Entity
-from entities.projectiles import Bullet, HomingMissile
+from entities.base import Entity, get_cached_mask, load_image
+from entities.store import StoreField, KIND_DRONE, KIND_MARKOV
+from entities.projectiles import ENEMY_BULLET, HOMING_MISSILE
 from config.settings import *
 from config.colors import *
 import os
 
-PRNG = PseudoRandom(seed=12345)
+# Flujos del registro de la partida: IA (caminatas, objetivos, Markov, ráfagas) y apariciones
+PRNG = RNG.stream(STREAM_AI)
+SPAWN_RNG = RNG.stream(STREAM_SPAWN)
+
+# Tipos de enemigo (contenedores de GameManager.enemies)
+ENEMY_DRONE = "drone"
+ENEMY_MARKOV = "markov"
+ENEMY_BOSS = "boss"
+
 # Estados para Cadenas de Markov
 class EnemyState(Enum):
     DEAMBULAR = 0
@@ -28,25 +37,93 @@ TRANSITION_MATRIX = np.array([
     [0.1, 0.3, 0.6]   # Desde ATACAR
 ])
 
+# Filas acumuladas (normalizadas igual que np.random.choice) para muestrear con un solo uniforme
+TRANSITION_CUMULATIVE = np.cumsum(TRANSITION_MATRIX, axis=1)
+TRANSITION_CUMULATIVE /= TRANSITION_CUMULATIVE[:, -1:]
+TRANSITION_CUMULATIVE_ROWS = [tuple(row) for row in TRANSITION_CUMULATIVE.tolist()]
+ENEMY_STATES = tuple(EnemyState)  # Índice -> estado
+
+def markov_transition(state_index):
+    """Siguiente estado de un solo agente (ruta escalar, sin validación ni arreglos)"""
+    return bisect.bisect_right(TRANSITION_CUMULATIVE_ROWS[state_index], PRNG.next())
+
+def markov_transitions(state_indices):
+    """
+    Siguiente estado de muchos agentes con un único sorteo vectorizado.
+    Consume los mismos uniformes del flujo de IA, en el mismo orden, que llamar a
+    markov_transition agente por agente.
+    """
+    states = np.asarray(state_indices)
+    uniforms = PRNG.next_block(states.size)
+    return (TRANSITION_CUMULATIVE[states] <= uniforms[:, None]).sum(axis=1)
+
+def _wander_draws(stream, count):
+    """
+    Sorteos de DEAMBULAR de `count` enemigos seguidos: cada uno consume un uniforme y,
+    si es menor que 0.02, otro más para su nuevo objetivo (random() y randint() de update).
+    
+    Returns:
+        (retarget, draws): máscara de enemigos con objetivo nuevo y el uniforme de su randint
+    """
+    retarget = np.zeros(count, dtype=bool)
+    draws = np.zeros(count)
+    values = stream.peek(count + count // 8 + 2)
+    cursor = 0
+    enemy = 0
+    while enemy < count:
+        remaining = count - enemy
+        if cursor + remaining + 1 > values.size:
+            values = stream.peek(cursor + remaining + count // 8 + 2)
+        hits = np.flatnonzero(values[cursor:cursor + remaining] < 0.02)
+        if not hits.size:
+            cursor += remaining
+            break
+        hit = int(hits[0])
+        retarget[enemy + hit] = True
+        draws[enemy + hit] = values[cursor + hit + 1]
+        cursor += hit + 2
+        enemy += hit + 1
+    stream.skip(cursor)
+    return retarget, draws
+
 class DroneEnemy(Entity):
     """Enemigo básico con caminata aleatoria (Dron XARN)"""
     
+    __slots__ = ("_x", "_y", "_speed", "_direction", "_move_timer", "_move_interval", "summoned")
+    
+    enemy_type = "drone_tonto"
+    bucket = ENEMY_DRONE
+    colony_damage = 10
+    slow_time_scale = SLOW_TIME_SCALE
+    # Estado actual del dron (solo deambular para el dron básico)
+    current_state = "deambular"
+    
+    # Sprites por estado compartidos por todos los drones
+    images = {}
+    
+    # Campos que pasan al EntityStore cuando el dron se registra en él
+    store_kind = KIND_DRONE
+    x = StoreField("x")
+    y = StoreField("y")
+    speed = StoreField("speed")
+    direction = StoreField("direction")
+    move_timer = StoreField("move_timer")
+    move_interval = StoreField("move_interval")
+    
     def __init__(self, x, y):
         super().__init__(x, y, DRONE_SIZE, DRONE_SIZE, DRONE_COLOR)
         self.direction = PRNG.next_choice([-1, 1])
         self.speed = DRONE_SPEED
         self.move_timer = 0
         self.move_interval = int(30 + PRNG.next() * 30)
-        self.enemy_type = "drone_tonto"
-        # Estado actual del dron (solo deambular para el dron básico)
-        self.current_state = "deambular"
-        
-        # Cargar imágenes para todos los estados
-        self.images = {}
+        self.summoned = False  # Invocado por el jefe (sin puntos al destruirlo)
         self.load_images()
     
     def load_images(self):
-        """Cargar las imágenes para todos los estados del dron"""
+        """Cargar las imágenes para todos los estados del dron (una sola vez por clase)"""
+        if self.images:
+            return
+        
         image_paths = {
             "deambular": os.path.join("nebula_uprising", "assets", "images", "Drones", "Enemigo1.png"),
             "atacar": os.path.join("nebula_uprising", "assets", "images", "Drones", "Enemigo1Atacar.png"),
@@ -55,7 +132,7 @@ class DroneEnemy(Entity):
         
         for state, path in image_paths.items():
             try:
-                image = pygame.image.load(path)
+                image = load_image(path)
                 # Escalar la imagen 80% más grande que el tamaño original del dron
                 new_width = int(self.width * 3.0)
                 new_height = int(self.height * 3.0)
@@ -64,8 +141,8 @@ class DroneEnemy(Entity):
                 print(f"No se pudo cargar la imagen {path}: {e}")
                 self.images[state] = None
     
-    def update(self):
-        """Actualizar comportamiento del dron"""
+    def update(self, player=None):
+        """Actualizar comportamiento del dron (el jugador no influye en la caminata aleatoria)"""
         # Caminata aleatoria
         self.move_timer += 1
         if self.move_timer >= self.move_interval:
@@ -90,9 +167,27 @@ class DroneEnemy(Entity):
         
         super().update()
     
+    def get_hitbox(self):
+        """Área del sprite escalado, centrada en el dron"""
+        current_image = self.images.get(self.current_state)
+        if not current_image:
+            return self.rect
+        return current_image.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+    
+    def get_mask(self):
+        """Máscara del sprite del estado actual"""
+        current_image = self.images.get(self.current_state)
+        if not current_image:
+            return None
+        return get_cached_mask(("drone", self.current_state), current_image)
+    
+    def current_sprite(self):
+        """Sprite del estado actual (None si no se pudo cargar)"""
+        return self.images.get(self.current_state)
+    
     def draw(self, screen):
         """Dibujar dron con imagen según su estado o diseño hexagonal como respaldo"""
-        current_image = self.images.get(self.current_state)
+        current_image = self.current_sprite()
         if current_image:
             # Centrar la imagen más grande en la posición original del dron
             image_rect = current_image.get_rect()
@@ -117,32 +212,59 @@ class DroneEnemy(Entity):
 class MarkovEnemy(Entity):
     """Enemigo con comportamiento basado en Cadenas de Markov - CORREGIDO"""
     
-    def __init__(self, x, y):
+    __slots__ = ("_x", "_y", "_speed", "_direction", "_state_index", "state_duration", "_target_x",
+                 "_state_start", "projectiles", "timers", "transitions", "_state_timer", "summoned")
+    
+    enemy_type = "drone_bravo"
+    bucket = ENEMY_MARKOV
+    colony_damage = 15
+    slow_time_scale = SLOW_TIME_SCALE
+    
+    # NUEVO: Márgenes de seguridad más estrictos
+    MARGIN = 80  # Margen más grande para evitar que se peguen
+    MIN_X = MARGIN
+    MAX_X = SCREEN_WIDTH - MARKOV_SIZE - MARGIN
+    
+    # Sprites por estado compartidos por todos los enemigos Markov
+    images = {}
+    
+    # Con menos Markov, step_batch los recorre uno por uno (el lote cuesta más que el bucle)
+    BATCH_MIN = 20
+    
+    store_kind = KIND_MARKOV
+    x = StoreField("x")
+    y = StoreField("y")
+    speed = StoreField("speed")
+    direction = StoreField("direction")
+    state_index = StoreField("state_index")
+    target_x = StoreField("target_x")
+    state_start = StoreField("state_start")
+    
+    def __init__(self, x, y, projectiles, timers, transitions):
         super().__init__(x, y, MARKOV_SIZE, MARKOV_SIZE, MARKOV_COLOR)
         self.state = EnemyState.DEAMBULAR
         self.speed = MARKOV_SPEED
-        self.direction = random.choice([-1, 1]) 
-        self.state_timer = 0
+        self.direction = PRNG.choice([-1, 1]) 
+        self.timers = timers  # Rueda que avanza un tick por cada update() del enemigo
+        self.transitions = transitions  # Cola de la partida con los enemigos cuyo estado venció
+        self.summoned = False  # Invocado por el jefe (sin puntos al destruirlo)
+        self._state_timer = None
         self.state_duration = 60
+        self.state_timer = 0
         self.target_x = x
-        self.bullets = []
-        self.enemy_type = "drone_bravo"
-        
-        # NUEVO: Márgenes de seguridad más estrictos
-        self.MARGIN = 80  # Margen más grande para evitar que se peguen
-        self.MIN_X = self.MARGIN
-        self.MAX_X = SCREEN_WIDTH - self.width - self.MARGIN
+        self.projectiles = projectiles  # Gestor global de proyectiles
         
         # Asegurar posición inicial válida
         self.x = max(self.MIN_X, min(self.x, self.MAX_X))
         self.target_x = self.x
         
-        # Cargar imágenes para todos los estados
-        self.images = {}
         self.load_images()
     
     def load_images(self):
-        """Cargar las imágenes para todos los estados del enemigo Markov"""
+        """Cargar las imágenes para todos los estados del enemigo Markov (una sola vez por clase)"""
+        if self.images:
+            return
+        
         image_paths = {
             EnemyState.DEAMBULAR: os.path.join("nebula_uprising", "assets", "images", "Drones", "Enemigo2.png"),
             EnemyState.ATACAR: os.path.join("nebula_uprising", "assets", "images", "Drones", "Enemigo2Atacar.png"),
@@ -151,7 +273,7 @@ class MarkovEnemy(Entity):
         
         for state, path in image_paths.items():
             try:
-                image = pygame.image.load(path)
+                image = load_image(path)
                 # Escalar la imagen 80% más grande que el tamaño original del enemigo
                 new_width = int(self.width * 2.0)
                 new_height = int(self.height * 2.0)
@@ -160,33 +282,147 @@ class MarkovEnemy(Entity):
                 print(f"No se pudo cargar la imagen {path}: {e}")
                 self.images[state] = None
     
+    @property
+    def state(self):
+        """Estado Markov actual (el almacén guarda su índice)"""
+        return ENEMY_STATES[self.state_index]
+    
+    @state.setter
+    def state(self, state):
+        self.state_index = state.value
+    
     def change_state(self):
         """Cambiar estado usando matriz de transición"""
-        current_state_index = self.state.value
-        probabilities = TRANSITION_MATRIX[current_state_index]
-        new_state_index = np.random.choice(3, p=probabilities)
-        self.state = EnemyState(new_state_index)
+        self.state_index = markov_transition(self.state_index)
+    
+    @staticmethod
+    def step_transitions(pending):
+        """
+        Cambiar de estado, en lote, a todos los enemigos cuyo temporizador venció.
+        Se llama después de avanzar la rueda de temporizadores de los Markov.
+        
+        Args:
+            pending: Cola de transiciones de la partida (se vacía)
+        """
+        if not pending:
+            return
+        due = pending[:]
+        pending.clear()
+        
+        if len(due) == 1:
+            due[0].change_state()
+        else:
+            new_states = markov_transitions([enemy.state_index for enemy in due]).tolist()
+            for enemy, state_index in zip(due, new_states):
+                enemy.state_index = state_index
+        for enemy in due:
+            enemy.state_timer = 0
+    
+    @property
+    def state_timer(self):
+        """Pasos transcurridos en el estado actual (derivado del vencimiento del temporizador)"""
+        return self.timers.now - self.state_start
+    
+    @state_timer.setter
+    def state_timer(self, steps):
+        timers = self.timers
+        timers.cancel(self._state_timer)
+        self._state_timer = timers.schedule(self.state_duration - steps, self._on_state_timer)
+        self.state_start = self._state_timer.due - self.state_duration
+    
+    @staticmethod
+    def step_batch(store, timers):
+        """
+        Mover en lote a todos los Markov del almacén, con la misma lógica que update()
+        pero sobre las columnas. Los sorteos del flujo de IA se consumen en orden de slot,
+        igual que llamando a update() enemigo por enemigo en ese orden.
+        Se llama después de avanzar la rueda y de step_transitions.
+        
+        Args:
+            store: EntityStore de la partida
+            timers: Rueda de temporizadores de los Markov
+        """
+        slots = store.slots_of(KIND_MARKOV)
+        entities = store.entities
+        if slots.size < MarkovEnemy.BATCH_MIN:
+            for slot in slots.tolist():
+                entities[slot].update(None)
+            return
+        columns = store.columns
+        min_x, max_x = MarkovEnemy.MIN_X, MarkovEnemy.MAX_X
+        x = columns["x"][slots]
+        state = columns["state_index"][slots]
+        patrol = state == EnemyState.PATRULLAR.value
+        
+        # Fuera de los límites seguros, el reajuste sortea un objetivo intercalado con los
+        # sorteos de los demás: ese caso (raro, p. ej. drones invocados) va objeto por objeto
+        if (((x < min_x) | (x > max_x)) & ~patrol).any():
+            for slot in slots.tolist():
+                entities[slot].update(None)
+            return
+        
+        elapsed = timers.now - columns["state_start"][slots]
+        
+        # DEAMBULAR: objetivo nuevo ocasional y avance del 3% de la distancia
+        wanderers = np.flatnonzero(state == EnemyState.DEAMBULAR.value)
+        if wanderers.size:
+            wander_slots = slots[wanderers]
+            target = columns["target_x"][wander_slots]
+            retarget, draws = _wander_draws(PRNG, wanderers.size)
+            if retarget.any():
+                span = max_x - min_x
+                target[retarget] = min_x + np.minimum((draws[retarget] * (span + 1)).astype(np.int64), span)
+                columns["target_x"][wander_slots] = target
+            current = x[wanderers]
+            distance = target - current
+            moving = np.abs(distance) > 5
+            x[wanderers[moving]] = current[moving] + distance[moving] * 0.03
+        
+        # PATRULLAR: oscilación; si se saldría de los límites no se mueve y adelanta el cambio
+        patrollers = np.flatnonzero(patrol)
+        if patrollers.size:
+            moved = x[patrollers] + np.sin(elapsed[patrollers] * 0.05) * columns["speed"][slots[patrollers]]
+            inside = (moved >= min_x) & (moved <= max_x)
+            x[patrollers[inside]] = moved[inside]
+            for slot in slots[patrollers[~inside]].tolist():
+                entities[slot].state_timer += 30
+        
+        # ATACAR: disparo cada 30 pasos y acercamiento lento al centro
+        attackers = np.flatnonzero(state == EnemyState.ATACAR.value)
+        if attackers.size:
+            current = x[attackers]
+            firing = attackers[elapsed[attackers] % 30 == 0]
+            for slot, shooter_x in zip(slots[firing].tolist(), x[firing].tolist()):
+                enemy = entities[slot]
+                enemy.projectiles.fire(ENEMY_BULLET, shooter_x + enemy.width // 2, enemy.y + enemy.height, 5, enemy)
+            center_screen = SCREEN_WIDTH // 2
+            far = np.abs(current - center_screen) > 100
+            x[attackers[far]] = current[far] + np.where(current[far] < center_screen, 0.5, -0.5)
+        
+        # Mantener el rectángulo dentro de la pantalla
+        columns["x"][slots] = np.clip(x, 0, SCREEN_WIDTH - columns["width"][slots])
+    
+    def _on_state_timer(self):
+        """Encolar el cambio de estado al vencer el temporizador (solo si el enemigo sigue vivo)"""
+        if self.alive:
+            self.transitions.append(self)
     
     def update(self, player):
         """Actualizar comportamiento del enemigo Markov - CORREGIDO"""
-        self.state_timer += 1
-        if self.state_timer >= self.state_duration:
-            self.change_state()
-            self.state_timer = 0
-
         # COMPORTAMIENTO CORREGIDO según estado
         if self.state == EnemyState.DEAMBULAR:
             # ARREGLADO: Lógica de deambulación más controlada
-            if random.random() < 0.02:  # Ocasionalmente cambiar objetivo
+            if PRNG.random() < 0.02:  # Ocasionalmente cambiar objetivo
                 # Generar nueva posición objetivo VÁLIDA
-                self.target_x = random.randint(self.MIN_X, self.MAX_X)
+                self.target_x = PRNG.randint(self.MIN_X, self.MAX_X)
             
-            # Mover gradualmente hacia el objetivo
-            distance_to_target = self.target_x - self.x
+            # Mover gradualmente hacia el objetivo (x se lee una vez: vive en el almacén)
+            x = self.x
+            distance_to_target = self.target_x - x
             if abs(distance_to_target) > 5:
                 # Movimiento más controlado - no tan agresivo
                 move_amount = distance_to_target * 0.03  # Reducido de 0.05 a 0.03
-                self.x += move_amount
+                self.x = x + move_amount
             
             # IMPORTANTE: Verificación de límites después de cada movimiento
             self._clamp_to_screen_bounds()
@@ -195,38 +431,33 @@ class MarkovEnemy(Entity):
             # ARREGLADO: Patrullaje con límites estrictos
             old_x = self.x
             # Movimiento sinusoidal pero controlado
-            self.x += math.sin(self.state_timer * 0.05) * self.speed
+            x = old_x + math.sin(self.state_timer * 0.05) * self.speed
             
             # IMPORTANTE: Verificar límites y revertir si es necesario
-            if self.x < self.MIN_X or self.x > self.MAX_X:
-                self.x = old_x  # Revertir movimiento inválido
-                # Cambiar dirección de patrullaje
+            if x < self.MIN_X or x > self.MAX_X:
+                # Revertir movimiento inválido y cambiar dirección de patrullaje
                 self.state_timer += 30  # Acelerar cambio de patrón
+            else:
+                self.x = x
             
         elif self.state == EnemyState.ATACAR:
             # Disparar hacia el jugador sin moverse mucho
+            x = self.x
             if self.state_timer % 30 == 0:
-                bullet = Bullet(self.x + self.width // 2, self.y + self.height, 5)
-                self.bullets.append(bullet)
+                self.projectiles.fire(ENEMY_BULLET, x + self.width // 2, self.y + self.height, 5, self)
             
             # Movimiento mínimo durante ataque para evitar salirse
             # Solo moverse si está muy lejos del centro
             center_screen = SCREEN_WIDTH // 2
-            if abs(self.x - center_screen) > 100:
-                if self.x < center_screen:
-                    self.x += 0.5  # Movimiento muy lento hacia el centro
+            if abs(x - center_screen) > 100:
+                if x < center_screen:
+                    self.x = x + 0.5  # Movimiento muy lento hacia el centro
                 else:
-                    self.x -= 0.5
+                    self.x = x - 0.5
             
             # Verificar límites
             self._clamp_to_screen_bounds()
         
-        # Actualizar balas
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.y > SCREEN_HEIGHT:
-                self.bullets.remove(bullet)
-
         # CRÍTICO: Siempre actualizar rectángulo después de mover
         super().update()
         
@@ -236,37 +467,46 @@ class MarkovEnemy(Entity):
     def _clamp_to_screen_bounds(self):
         """NUEVO: Función para asegurar que el enemigo esté dentro de límites seguros"""
         old_x = self.x
-        self.x = max(self.MIN_X, min(self.x, self.MAX_X))
+        if self.MIN_X <= old_x <= self.MAX_X:
+            return
         
-        # Si la posición cambió, significa que estaba fuera de límites
-        if old_x != self.x:
-            # Ajustar target_x para evitar que trate de volver al borde
-            if self.x == self.MIN_X:
-                self.target_x = random.randint(self.MIN_X + 50, self.MAX_X)
-            elif self.x == self.MAX_X:
-                self.target_x = random.randint(self.MIN_X, self.MAX_X - 50)
+        # Estaba fuera de límites: ajustar target_x para evitar que trate de volver al borde
+        if old_x < self.MIN_X:
+            self.x = self.MIN_X
+            self.target_x = PRNG.randint(self.MIN_X + 50, self.MAX_X)
+        else:
+            self.x = self.MAX_X
+            self.target_x = PRNG.randint(self.MIN_X, self.MAX_X - 50)
     
     def _ensure_rect_validity(self):
-        """NUEVO: Asegurar que el rectángulo de colisión sea válido y esté actualizado"""
-        # Forzar actualización del rectángulo
-        self.update_rect()
-        
-        # Verificar que el rectángulo no esté fuera de pantalla
-        if self.rect.left < 0:
+        """Asegurar que el enemigo no quede fuera de pantalla (el rectángulo se deriva de x, y)"""
+        x = self.x
+        if x < 0:
             self.x = 0
-            self.update_rect()
-        elif self.rect.right > SCREEN_WIDTH:
+        elif x > SCREEN_WIDTH - self.width:
             self.x = SCREEN_WIDTH - self.width
-            self.update_rect()
-        
-        # Debug: Verificar que las coordenadas estén sincronizadas
-        if abs(self.rect.x - self.x) > 1 or abs(self.rect.y - self.y) > 1:
-            print(f"ADVERTENCIA: Desincronización detectada - Enemy pos: ({self.x}, {self.y}), Rect pos: ({self.rect.x}, {self.rect.y})")
-            self.update_rect()  # Forzar corrección
+    
+    def get_hitbox(self):
+        """Área del sprite escalado, centrada en el enemigo"""
+        current_image = self.images.get(self.state)
+        if not current_image:
+            return self.rect
+        return current_image.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+    
+    def get_mask(self):
+        """Máscara del sprite del estado Markov actual"""
+        current_image = self.images.get(self.state)
+        if not current_image:
+            return None
+        return get_cached_mask(("markov", self.state), current_image)
         
+    def current_sprite(self):
+        """Sprite del estado actual (None si no se pudo cargar)"""
+        return self.images.get(self.state)
+    
     def draw(self, screen):
         """Dibujar enemigo Markov con imagen según su estado"""
-        current_image = self.images.get(self.state)
+        current_image = self.current_sprite()
         if current_image:
             # Centrar la imagen más grande en la posición original del enemigo
             image_rect = current_image.get_rect()
@@ -278,28 +518,36 @@ class MarkovEnemy(Entity):
         
         # DEBUG: Dibujar rectángulo de colisión (quitar en versión final)
         # pygame.draw.rect(screen, (255, 0, 0), self.rect, 2)  # Rectángulo rojo para debug
-        
-        # Dibujar las balas
-        for bullet in self.bullets:
-            bullet.draw(screen)
 
 class BossFinalAgent(Entity):
     """Jefe final con simulación basada en agentes"""
     
-    def __init__(self, x, y):
+    bucket = ENEMY_BOSS
+    slow_time_scale = SLOW_TIME_BOSS_SCALE
+    summoned = False  # Nunca es invocado (ver GameManager.summoned_alive)
+    
+    # Ticks entre misiles y entre invocaciones de drones según el comportamiento
+    ATTACK_FREQUENCY = {"aggressive": 40, "balanced": 80, "defensive": 120}
+    DRONE_SPAWN_INTERVAL = {"aggressive": 120, "balanced": 180, "defensive": 240}
+    DRONE_BUDGET = "boss_drones"  # Categoría de los drones invocados en el presupuesto de entidades
+    
+    def __init__(self, x, y, projectiles, timers, budget=None, spawn_enemy=None):
         super().__init__(x, y, BOSS_WIDTH, BOSS_HEIGHT, BOSS_COLOR)
         self.health = BOSS_HEALTH
         self.max_health = BOSS_HEALTH
-        self.missiles = []
-        self.attack_timer = 0
+        self.projectiles = projectiles  # Gestor global de proyectiles
+        self.timers = timers            # Rueda que avanza un tick por cada think_and_act()
+        self.budget = budget            # Presupuesto de entidades (limita los drones invocados)
+        self.spawn_enemy = spawn_enemy  # Registra los drones invocados como enemigos normales
+        self.target = None
         self.behavior_state = "defensive"
         self.speed = 2
         self.xarn_core_active = True
         self.corruption_level = 0
-        # NUEVO: Lista de drones y temporizador
-        self.spawned_drones = []
-        self.drone_spawn_timer = 0
-        self.drone_spawn_interval = 180  # cada 3 segundos aprox (60 FPS)
+        # Temporizadores de ataque e invocación de drones
+        self.attack_timer = self.timers.schedule(self.ATTACK_FREQUENCY[self.behavior_state], self._on_attack_timer)
+        self.drone_spawn_timer = self.timers.schedule(self.DRONE_SPAWN_INTERVAL[self.behavior_state],
+                                                      self._on_drone_spawn_timer)
         
         # Cargar imagen del jefe final
         self.image = None
@@ -309,7 +557,7 @@ class BossFinalAgent(Entity):
         """Cargar la imagen del jefe final"""
         try:
             image_path = os.path.join("nebula_uprising", "assets", "images", "Drones", "FinalBoss.png")
-            self.image = pygame.image.load(image_path)
+            self.image = load_image(image_path)
             # Escalar la imagen  más grande que el tamaño original del jefe
             new_width = int(self.width * 1.0)
             new_height = int(self.height * 1.0)
@@ -355,7 +603,7 @@ class BossFinalAgent(Entity):
             self.y += 0.1
         
         # Usar un patrón sinusoidal para movimiento horizontal constante
-        movement_time = pygame.time.get_ticks() / 1000.0  # Tiempo en segundos
+        movement_time = game_state.clock.seconds  # Tiempo simulado en segundos
         
         if self.behavior_state == "aggressive":
             # Movimiento agresivo: zigzag rápido siguiendo al jugador
@@ -410,78 +658,64 @@ class BossFinalAgent(Entity):
         # Limitar movimiento vertical para que no suba demasiado
         self.y = max(30, self.y)  # No subir más allá del tope
         
-        # Sistema de ataque mejorado con variación
-        self.attack_timer += 1
-        
-        # Variar la frecuencia de ataque según el estado
-        if self.behavior_state == "aggressive":
-            attack_frequency = 40  # Muy rápido
-        elif self.behavior_state == "balanced":
-            attack_frequency = 80  # Moderado
-        else:
-            attack_frequency = 120  # Lento
+        # El ataque y la invocación de drones los disparan sus temporizadores
+        self.target = player
+
+        # Aumentar corrupción con el tiempo
+        self.corruption_level = min(100, self.corruption_level + 0.1)
         
-        # Agregar variación aleatoria al ataque
-        if self.attack_timer >= attack_frequency:
-            self.launch_missile(player)
-            self.attack_timer = 0
+        super().update()
+    
+    def _on_attack_timer(self):
+        """Lanzar un misil y programar el siguiente según el comportamiento actual"""
+        if not self.alive:
+            return
+        delay = self.ATTACK_FREQUENCY[self.behavior_state]
+        if self.target is not None:
+            self.launch_missile(self.target)
             
             # En modo agresivo, a veces dispara ráfagas
             if self.behavior_state == "aggressive" and PRNG.next() < 0.3:
                 # Disparo adicional con pequeño retraso
-                self.attack_timer = -20  # Próximo disparo será más rápido
-        
-        # Actualizar misiles
-        for missile in self.missiles[:]:
-            missile.update(player)
-            if missile.y > SCREEN_HEIGHT:
-                self.missiles.remove(missile)
-        
-        # NUEVO: Variar el intervalo de spawn de drones según el estado
-        if self.behavior_state == "aggressive":
-            self.drone_spawn_interval = 120  # Más rápido
-        elif self.behavior_state == "balanced":
-            self.drone_spawn_interval = 180  # Normal
-        else:
-            self.drone_spawn_interval = 240  # Más lento
-        
-        # Invocar drones cada cierto tiempo
-        self.drone_spawn_timer += 1
-        if self.drone_spawn_timer >= self.drone_spawn_interval:
+                delay += 20
+        self.attack_timer = self.timers.schedule(delay, self._on_attack_timer)
+    
+    def _on_drone_spawn_timer(self):
+        """Invocar un dron y programar la siguiente invocación según el comportamiento actual"""
+        if not self.alive:
+            return
+        if self.spawn_enemy is not None and (self.budget is None or self.budget.allow(self.DRONE_BUDGET)):
             self.spawn_drone()
-            self.drone_spawn_timer = 0
-
-        # Actualizar drones invocados
-        for drone in self.spawned_drones[:]:
-            if isinstance(drone, MarkovEnemy):
-                drone.update(player)
-            else:
-                drone.update()
-            if drone.y > SCREEN_HEIGHT:
-                self.spawned_drones.remove(drone)
-
-        # Aumentar corrupción con el tiempo
-        self.corruption_level = min(100, self.corruption_level + 0.1)
-        
-        super().update()
+        self.drone_spawn_timer = self.timers.schedule(self.DRONE_SPAWN_INTERVAL[self.behavior_state],
+                                                      self._on_drone_spawn_timer)
     
     def launch_missile(self, player):
         """Lanzar misil teledirigido"""
-        missile = HomingMissile(self.x + self.width // 2, self.y + self.height, player)
-        self.missiles.append(missile)
+        self.projectiles.fire(HOMING_MISSILE, self.x + self.width // 2, self.y + self.height, player, self)
     
     def spawn_drone(self):
-        """Invoca un dron aliado (básico o Markov) en una posición aleatoria cerca del jefe"""
-        from entities.enemies import DroneEnemy, MarkovEnemy  # Importación local para evitar ciclos
-        spawn_x = int(self.x + self.width // 2 + random.randint(-60, 60))
+        """
+        Invoca un dron aliado (básico o Markov) en una posición aleatoria cerca del jefe.
+        El dron se registra como un enemigo más: se mueve, colisiona y se dibuja con el resto.
+        """
+        spawn_x = int(self.x + self.width // 2 + SPAWN_RNG.randint(-60, 60))
         spawn_x = max(0, min(spawn_x, SCREEN_WIDTH - DRONE_SIZE))
         spawn_y = int(self.y + self.height + 10)
         # 50% de probabilidad de invocar cada tipo
-        if random.random() < 0.5:
-            drone = DroneEnemy(spawn_x, spawn_y)
-        else:
-            drone = MarkovEnemy(spawn_x, spawn_y)
-        self.spawned_drones.append(drone)
+        enemy_type = ENEMY_DRONE if SPAWN_RNG.random() < 0.5 else ENEMY_MARKOV
+        self.spawn_enemy(enemy_type, spawn_x, spawn_y, summoned=True)
+    
+    def get_hitbox(self):
+        """Área del sprite del jefe, centrada en su posición"""
+        if not self.image:
+            return self.rect
+        return self.image.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2))
+    
+    def get_mask(self):
+        """Máscara del sprite del jefe"""
+        if not self.image:
+            return None
+        return get_cached_mask(("boss",), self.image)
     
     def draw(self, screen):
         """Dibujar jefe final con imagen o diseño del núcleo XARN como respaldo"""
@@ -511,14 +745,6 @@ class BossFinalAgent(Entity):
         
         # Indicador de comportamiento y corrupción
         self._draw_status_text(screen)
-        
-        # Dibujar misiles
-        for missile in self.missiles:
-            missile.draw(screen)
-
-        # Dibujar drones invocados
-        for drone in self.spawned_drones:
-            drone.draw(screen)
     
     def _draw_health_bar(self, screen):
         """Dibujar barra de vida del jefe"""
@@ -4,18 +4,21 @@ Clase del jugador (Comandante Nova)
 
 import pygame
 import os
-from entities.base import Entity
-from entities.projectiles import Bullet
+from entities.base import Entity, get_cached_mask, load_image
+from entities.projectiles import PLAYER_BULLET
 from config.settings import *
 from config.colors import *
 
 class Player(Entity):
     """Clase del jugador principal"""
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, projectiles, timers):
         super().__init__(x, y, PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_COLOR)
         self.speed = PLAYER_SPEED
-        self.bullets = []
+        self.projectiles = projectiles  # Gestor global de proyectiles
+        self.timers = timers            # Rueda de temporizadores de la simulación
+        self._shield_timer = None
+        self._slow_time_timer = None
         self.max_health = PLAYER_MAX_HEALTH
         self.health = PLAYER_MAX_HEALTH
         self.shield = False
@@ -26,8 +29,8 @@ class Player(Entity):
         self.damage_taken_this_wave = False
 
         # Cargar sprites
-        self.sprite_idle = pygame.image.load(os.path.join("nebula_uprising", "assets", "images", "Nave", "Nave2.png")).convert_alpha()
-        self.sprite_moving = pygame.image.load(os.path.join("nebula_uprising", "assets", "images", "Nave", "Nave2Movimiento.png")).convert_alpha()
+        self.sprite_idle = load_image(os.path.join("nebula_uprising", "assets", "images", "Nave", "Nave2.png"))
+        self.sprite_moving = load_image(os.path.join("nebula_uprising", "assets", "images", "Nave", "Nave2Movimiento.png"))
         self.current_sprite = self.sprite_idle
 
         # Ajustar tamaño del sprite
@@ -36,7 +39,11 @@ class Player(Entity):
 
         self.is_moving = False
         
-        # Cargar sonidos
+        # Cargar sonidos (sin mezclador, p. ej. en simulación headless, no hay sonido)
+        self.shoot_sound = None
+        self.power_sound = None
+        if not pygame.mixer.get_init():
+            return
         try:
             self.shoot_sound = pygame.mixer.Sound(os.path.join("nebula_uprising", "assets", "Sonido", "DisparosSFX.mp3"))
             self.power_sound = pygame.mixer.Sound(os.path.join("nebula_uprising", "assets", "Sonido", "PoderSFX.mp3"))
@@ -62,33 +69,49 @@ class Player(Entity):
     
     def shoot(self):
         """Disparar una bala"""
-        bullet = Bullet(self.x + self.width // 2 - 2, self.y, -BULLET_SPEED)
-        self.bullets.append(bullet)
+        bullet = self.projectiles.fire(PLAYER_BULLET, self.x + self.width // 2 - 2, self.y, -BULLET_SPEED)
         
         # Reproducir sonido de disparo
-        if self.shoot_sound:
+        if bullet and self.shoot_sound:
             self.shoot_sound.play()
     
     def update(self):
-        """Actualizar estado del jugador"""
+        """Actualizar estado del jugador (los power-ups expiran por temporizador)"""
         super().update()
-        
-        # Actualizar power-ups
-        if self.shield_duration > 0:
-            self.shield_duration -= 1
-            if self.shield_duration == 0:
-                self.shield = False
-        
-        if self.slow_time_duration > 0:
-            self.slow_time_duration -= 1
-            if self.slow_time_duration == 0:
-                self.slow_time = False
-        
-        # Actualizar balas
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.y < 0:
-                self.bullets.remove(bullet)
+    
+    @property
+    def shield_duration(self):
+        """Ticks que le quedan al escudo"""
+        return self.timers.remaining(self._shield_timer)
+    
+    @shield_duration.setter
+    def shield_duration(self, ticks):
+        self.timers.cancel(self._shield_timer)
+        self._shield_timer = self.timers.schedule(ticks, self._end_shield) if ticks > 0 else None
+    
+    def _end_shield(self):
+        self.shield = False
+    
+    @property
+    def slow_time_duration(self):
+        """Ticks que le quedan al tiempo lento"""
+        return self.timers.remaining(self._slow_time_timer)
+    
+    @slow_time_duration.setter
+    def slow_time_duration(self, ticks):
+        self.timers.cancel(self._slow_time_timer)
+        self._slow_time_timer = self.timers.schedule(ticks, self._end_slow_time) if ticks > 0 else None
+    
+    def _end_slow_time(self):
+        self.slow_time = False
+    
+    def get_hitbox(self):
+        """Área del sprite de la nave"""
+        return self.sprite_idle.get_rect(topleft=(self.x, self.y))
+    
+    def get_mask(self):
+        """Máscara del sprite de la nave en reposo"""
+        return get_cached_mask(("player",), self.sprite_idle)
     
     def draw(self, screen):
         """Dibujar jugador en pantalla"""
@@ -104,10 +127,6 @@ class Player(Entity):
         
         # Barra de salud
         self._draw_health_bar(screen)
-        
-        # Dibujar balas
-        for bullet in self.bullets:
-            bullet.draw(screen)
     
     def _draw_health_bar(self, screen):
         """Dibujar barra de salud del jugador"""
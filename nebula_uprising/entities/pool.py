@@ -0,0 +1,145 @@
+"""
+Reserva de proyectiles (object pool)
+"""
+
+import numpy as np
+from entities.store import StoreField
+
+class ProjectilePool:
+    """
+    Reserva de proyectiles de capacidad fija con lista libre.
+    Los proyectiles liberados se reutilizan en lugar de crear objetos nuevos por disparo.
+    Los campos StoreField de los proyectiles en vuelo viven en columnas NumPy alineadas
+    con `active` (la posición en la lista es el slot), como en el EntityStore.
+    """
+
+    def __init__(self, projectile_class, capacity):
+        self.projectile_class = projectile_class
+        self.capacity = capacity
+        self.active = []      # Proyectiles en vuelo (almacenamiento contiguo)
+        self.free = []        # Proyectiles liberados listos para reutilizar
+        self.allocated = 0
+        self.high_water_mark = 0
+        self.rejected = 0
+        self.columns = {name: np.zeros(capacity, dtype=np.float64) for name in dir(projectile_class)
+                        if isinstance(getattr(projectile_class, name), StoreField)}
+
+    def acquire(self, *args):
+        """
+        Obtener un proyectil inicializado con los argumentos dados.
+
+        Returns:
+            El proyectil activado, o None si la reserva está llena
+        """
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(*args)
+        elif self.allocated < self.capacity:
+            projectile = self.projectile_class(*args)
+            self.allocated += 1
+        else:
+            self.rejected += 1
+            return None
+
+        slot = len(self.active)
+        for name, column in self.columns.items():
+            column[slot] = getattr(projectile, name)
+        projectile._slot = slot
+        projectile._store = self
+        self.active.append(projectile)
+        if len(self.active) > self.high_water_mark:
+            self.high_water_mark = len(self.active)
+        return projectile
+
+    def _detach(self, projectile):
+        """Devolver al proyectil los valores de sus columnas"""
+        slot = projectile._slot
+        for name, column in self.columns.items():
+            setattr(projectile, "_" + name, column.item(slot))
+        projectile._store = None
+        projectile._slot = -1
+
+    def release(self, projectile):
+        """Devolver un proyectil a la lista libre en O(1) (intercambio con el último)"""
+        index = projectile._slot
+        self._detach(projectile)
+        last = self.active.pop()
+        if last is not projectile:
+            self.active[index] = last
+            moved = len(self.active)
+            for column in self.columns.values():
+                column[index] = column[moved]
+            last._slot = index
+        self.free.append(projectile)
+
+    def release_where(self, mask):
+        """
+        Liberar los proyectiles activos marcados en un arreglo booleano alineado con `active`.
+        Se liberan de mayor a menor índice, igual que al liberar durante __iter__.
+        """
+        active = self.active
+        for index in mask.nonzero()[0][::-1].tolist():
+            self.release(active[index])
+
+    def clear(self):
+        """Liberar todos los proyectiles activos"""
+        for projectile in self.active:
+            self._detach(projectile)
+        self.free.extend(self.active)
+        self.active.clear()
+
+    def column(self, name):
+        """Vista de una columna restringida a los proyectiles en vuelo (orden de `active`)"""
+        return self.columns[name][:len(self.active)]
+
+    def motion(self):
+        """Posición y desplazamiento del último paso de los proyectiles en vuelo, en arreglos"""
+        x = self.column("x")
+        y = self.column("y")
+        return x, y, x - self.column("prev_x"), y - self.column("prev_y")
+
+    def hold(self):
+        """Dejar quietos los proyectiles en vuelo este tick (la posición anterior pasa a ser la actual)"""
+        count = len(self.active)
+        columns = self.columns
+        columns["prev_x"][:count] = columns["x"][:count]
+        columns["prev_y"][:count] = columns["y"][:count]
+
+    def step_linear(self, factor=1.0):
+        """
+        Avanzar en una pasada todos los proyectiles según su velocidad (lógica de Bullet.update).
+        `factor` escala el paso (fracción de paso con slow time).
+        """
+        self.hold()
+        count = len(self.active)
+        columns = self.columns
+        if factor == 1.0:
+            columns["y"][:count] += columns["speed"][:count]
+        else:
+            columns["y"][:count] += columns["speed"][:count] * factor
+
+    def __iter__(self):
+        """
+        Recorrer los proyectiles activos sin copiar la lista.
+        Se recorre del final al inicio, por lo que es seguro liberar el proyectil actual.
+        """
+        active = self.active
+        index = len(active) - 1
+        while index >= 0:
+            if index < len(active):
+                yield active[index]
+            index -= 1
+
+    def __len__(self):
+        return len(self.active)
+
+    def get_stats(self):
+        """Obtener estadísticas de uso de la reserva"""
+        return {
+            'active': len(self.active),
+            'free': len(self.free),
+            'allocated': self.allocated,
+            'capacity': self.capacity,
+            'high_water_mark': self.high_water_mark,
+            'rejected': self.rejected
+        }
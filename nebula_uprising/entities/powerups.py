@@ -3,36 +3,55 @@ Clase de Power-Ups
 """
 
 import pygame
-from entities.base import Entity
+from entities.base import Entity, get_cached_mask, load_image
+from entities.store import StoreField, KIND_POWERUP
 from config.settings import *
 from config.colors import *
 import os
 
+# Sprites compartidos por tipo de power-up (se cargan una sola vez)
+_SPRITE_CACHE = {}
+
 class PowerUp(Entity):
     """Clase de power-up con método Monte Carlo"""
     
+    __slots__ = ("_x", "_y", "_speed", "power_type")
+    
+    store_kind = KIND_POWERUP
+    slow_time_scale = SLOW_TIME_BOSS_SCALE
+    x = StoreField("x")
+    y = StoreField("y")
+    speed = StoreField("speed")
+    
     def __init__(self, x, y, power_type):
         self.power_type = power_type
-        self.speed = POWERUP_SPEED
 
-         # Ruta y carga del sprite (dentro del constructor)
-        image_path = {
-            "shield": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "ArmorBonus.png"),
-            "extra_life": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "HP_Bonus.png"),
-            "slow_time": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "SlowMotion.png")
-        }
+        image = _SPRITE_CACHE.get(power_type)
+        if image is None:
+            # Ruta y carga del sprite (solo la primera vez por tipo)
+            image_path = {
+                "shield": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "ArmorBonus.png"),
+                "extra_life": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "HP_Bonus.png"),
+                "slow_time": os.path.join("nebula_uprising", "assets", "images", "PowerUps", "SlowMotion.png")
+            }
 
-        image = pygame.image.load(image_path[power_type]).convert_alpha()
-        image = pygame.transform.scale(image, (POWERUP_SIZE, POWERUP_SIZE))
+            image = load_image(image_path[power_type])
+            image = pygame.transform.scale(image, (POWERUP_SIZE, POWERUP_SIZE))
+            _SPRITE_CACHE[power_type] = image
 
         # Llama al constructor base con la imagen
         super().__init__(x, y, POWERUP_SIZE, POWERUP_SIZE, image=image)
+        self.speed = POWERUP_SPEED
     
     def update(self):
         """Actualizar posición del power-up"""
         self.y += self.speed
         super().update()
     
+    def get_mask(self):
+        """Máscara del sprite según el tipo de power-up"""
+        return get_cached_mask(("powerup", self.power_type), self.image)
+    
     def apply_effect(self, player, narrative_system):
         """Aplicar efecto del power-up al jugador"""
         if self.power_type == "slow_time":
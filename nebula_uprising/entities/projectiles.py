@@ -5,29 +5,78 @@ Clases de proyectiles (balas y misiles)
 import pygame
 import math
 import os
-from entities.base import Entity
+from entities.base import Entity, get_cached_mask, load_image
+from entities.store import StoreField
 from config.settings import *
 from config.colors import *
 
+# Tipos de proyectil (contenedores del gestor de proyectiles)
+PLAYER_BULLET = "player_bullet"
+ENEMY_BULLET = "enemy_bullet"
+HOMING_MISSILE = "homing_missile"
+
+# Sprites compartidos por todas las instancias (se cargan una sola vez)
+_SPRITE_CACHE = {}
+
+def load_projectile_sprite(width, height):
+    """Cargar y escalar el sprite del disparo una sola vez por tamaño"""
+    key = (width, height)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        image_path = os.path.join("nebula_uprising", "assets", "images", "Nave", "Disparo2.png")
+        sprite = load_image(image_path)
+        sprite = pygame.transform.scale(sprite, (width, height))
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
 class Bullet(Entity):
     """Clase de bala básica"""
     
-    def __init__(self, x, y, speed):
+    __slots__ = ("_x", "_y", "_speed", "_prev_x", "_prev_y", "owner", "sprite")
+    
+    # Campos que viven en las columnas de la ProjectilePool mientras la bala está en vuelo
+    x = StoreField("x")
+    y = StoreField("y")
+    speed = StoreField("speed")
+    prev_x = StoreField("prev_x")
+    prev_y = StoreField("prev_y")
+    
+    def __init__(self, x, y, speed, owner=None):
         super().__init__(x, y, BULLET_WIDTH, BULLET_HEIGHT, BULLET_COLOR)
         self.speed = speed
+        self.owner = owner  # Enemigo que la disparó (None para el jugador)
+        
+        # Posición del tick anterior para la colisión continua
+        self.prev_x = x
+        self.prev_y = y
 
-            # Cargar sprite del disparo
-        image_path = os.path.join("nebula_uprising", "assets", "images", "Nave", "Disparo2.png")
-        self.sprite = pygame.image.load(image_path).convert_alpha()
-
-        # Escalar sprite si es necesario (ajústalo a lo que se vea bien en pantalla)
-        self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
+        # Sprite del disparo compartido
+        self.sprite = load_projectile_sprite(self.width, self.height)
+    
+    def reset(self, x, y, speed, owner=None):
+        """Reinicializar una bala reutilizada desde la reserva"""
+        self.x = x
+        self.y = y
+        self.prev_x = x
+        self.prev_y = y
+        self.speed = speed
+        self.owner = owner
     
     def update(self):
         """Actualizar posición de la bala"""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.y += self.speed
         super().update()
         
+    def get_hitbox(self):
+        """Área del sprite de la bala (el sprite tiene el tamaño de la bala)"""
+        return self.rect
+    
+    def get_mask(self):
+        """Máscara del sprite de la bala"""
+        return get_cached_mask(("bullet",), self.sprite)
+        
     def draw(self, screen):
      screen.blit(self.sprite, (self.x, self.y))
 
@@ -35,24 +84,52 @@ class Bullet(Entity):
 class HomingMissile(Entity):
       """Clase de misil teledirigido"""
     
-      def __init__(self, x, y, target):
+      __slots__ = ("_x", "_y", "_prev_x", "_prev_y", "target", "owner", "speed", "angle", "sprite",
+                   "locked", "locked_target_pos", "locked_direction")
+
+      # Campos que viven en las columnas de la ProjectilePool mientras el misil está en vuelo
+      x = StoreField("x")
+      y = StoreField("y")
+      prev_x = StoreField("prev_x")
+      prev_y = StoreField("prev_y")
+    
+      def __init__(self, x, y, target, owner=None):
             super().__init__(x, y, 10, 10, BULLET_COLOR)
             self.target = target
+            self.owner = owner  # Jefe que lo lanzó
             self.speed = MISSILE_SPEED
             self.angle = 0
 
-            # ✅ Cargar el sprite
-            image_path = os.path.join("nebula_uprising", "assets", "images", "Nave", "Disparo2.png")
-            self.sprite = pygame.image.load(image_path).convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (self.width, self.height))
+            # Posición del tick anterior para la colisión continua
+            self.prev_x = x
+            self.prev_y = y
+
+            # ✅ Sprite compartido
+            self.sprite = load_projectile_sprite(self.width, self.height)
 
             # Inicializar atributos de seguimiento
             self.locked = False
             self.locked_target_pos = (0, 0)
             self.locked_direction = (0, 0)
+
+      def reset(self, x, y, target, owner=None):
+            """Reinicializar un misil reutilizado desde la reserva"""
+            self.x = x
+            self.y = y
+            self.prev_x = x
+            self.prev_y = y
+            self.target = target
+            self.owner = owner
+            self.angle = 0
+            self.locked = False
+            self.locked_target_pos = (0, 0)
+            self.locked_direction = (0, 0)
         
-      def update(self, target=None):
-            """Actualizar posición del misil hacia el objetivo"""
+      def update(self, target=None, factor=1.0):
+            """
+            Actualizar posición del misil hacia el objetivo.
+            `factor` escala el paso (fracción de paso con slow time).
+            """
             if target:
                 self.target = target
 
@@ -73,12 +150,23 @@ class HomingMissile(Entity):
                     self.locked_direction = (dx / distance, dy / distance)
 
             dx, dy = self.locked_direction
-            self.x += dx * self.speed
-            self.y += dy * self.speed
+            self.prev_x = self.x
+            self.prev_y = self.y
+            step = self.speed * factor
+            self.x += dx * step
+            self.y += dy * step
             self.angle = math.atan2(dy, dx)
 
             super().update()
         
+      def get_hitbox(self):
+            """Área del sprite del misil (el sprite tiene el tamaño del misil)"""
+            return self.rect
+
+      def get_mask(self):
+            """Máscara del sprite del misil"""
+            return get_cached_mask(("missile",), self.sprite)
+        
       def draw(self, screen):
             """Dibujar el misil como sprite"""
             screen.blit(self.sprite, (self.x, self.y))
\ No newline at end of file
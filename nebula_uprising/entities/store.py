@@ -0,0 +1,238 @@
+"""
+Almacén de entidades en estructura de arreglos (SoA)
+Guarda posición, tamaño, velocidad, dirección y tipo de cada entidad en arreglos NumPy
+para que el movimiento de miles de entidades se resuelva en pasadas vectorizadas.
+"""
+
+import numpy as np
+from config.settings import SCREEN_WIDTH
+
+# Tipos de entidad dentro del almacén
+KIND_DRONE = 0
+KIND_MARKOV = 1
+KIND_POWERUP = 2
+
+class StoreField:
+    """
+    Descriptor de un campo numérico de la entidad.
+    Si la entidad está registrada en un EntityStore, el valor vive en la columna del almacén;
+    si no, se guarda en la propia instancia, en el slot "_<campo>" que declara la clase.
+    """
+
+    def __init__(self, column):
+        self.column = column
+
+    def __set_name__(self, owner, name):
+        self.name = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.name)
+        # ndarray.item(i) devuelve el valor Python sin crear un escalar NumPy intermedio
+        return store.columns[self.column].item(obj._slot)
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            setattr(obj, self.name, value)
+        else:
+            store.columns[self.column][obj._slot] = value
+
+class EntityStore:
+    """Almacén SoA con núcleos vectorizados de movimiento"""
+
+    FIELDS = {
+        "x": np.float64,
+        "y": np.float64,
+        "width": np.float64,
+        "height": np.float64,
+        "speed": np.float64,
+        "direction": np.float64,
+        "move_timer": np.int32,
+        "move_interval": np.int32,
+        "state_index": np.int8,     # Estado Markov (índice en ENEMY_STATES)
+        "target_x": np.float64,     # Objetivo de DEAMBULAR
+        "state_start": np.int64     # Paso de la rueda de los Markov en que empezó el estado
+    }
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self.FIELDS.items()}
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.entities = []
+        self._slots = {}  # Índices por combinación de tipos; se invalidan al añadir o quitar
+
+    def __getattr__(self, name):
+        # Acceso directo a las columnas: store.x, store.y, ...
+        columns = self.__dict__.get("columns")
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def _grow(self):
+        """Duplicar la capacidad de todas las columnas"""
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+        kind = np.zeros(self.capacity, dtype=np.int8)
+        kind[:self.count] = self.kind[:self.count]
+        self.kind = kind
+
+    def add(self, entity, kind):
+        """Registrar una entidad: sus campos pasan a vivir en las columnas del almacén"""
+        if self.count == self.capacity:
+            self._grow()
+
+        slot = self.count
+        for name, column in self.columns.items():
+            column[slot] = getattr(entity, name, 0)
+        self.kind[slot] = kind
+        self.entities.append(entity)
+        self.count += 1
+        self._slots.clear()
+
+        entity._slot = slot
+        entity._store = self
+
+    def remove(self, entity):
+        """Quitar una entidad en O(1) (intercambio con la última) devolviéndole sus valores"""
+        slot = entity._slot
+        entity_class = type(entity)
+        for name, column in self.columns.items():
+            if isinstance(getattr(entity_class, name, None), StoreField):
+                setattr(entity, "_" + name, column[slot].item())
+        entity._store = None
+        entity._slot = -1
+
+        last = self.count - 1
+        if slot != last:
+            moved = self.entities[last]
+            for column in self.columns.values():
+                column[slot] = column[last]
+            self.kind[slot] = self.kind[last]
+            self.entities[slot] = moved
+            moved._slot = slot
+        self.entities.pop()
+        self.count -= 1
+        self._slots.clear()
+
+    def clear(self):
+        """Quitar todas las entidades"""
+        for entity in self.entities[::-1]:
+            self.remove(entity)
+
+    def slots_of(self, *kinds):
+        """Índices de las entidades de los tipos indicados (se reutilizan mientras no cambie el almacén)"""
+        slots = self._slots.get(kinds)
+        if slots is None:
+            kind = self.kind[:self.count]
+            mask = kind == kinds[0]
+            for other in kinds[1:]:
+                mask |= kind == other  # Más barato que np.isin con tan pocos tipos
+            slots = self._slots[kinds] = np.flatnonzero(mask)
+        return slots
+
+    # ----- Núcleos vectorizados -----
+
+    def step_random_walk(self, prng, margin=15):
+        """
+        Caminata aleatoria de todos los drones en una pasada (lógica de DroneEnemy.update).
+        Solo los drones cuyo temporizador vence consumen números del LCG, en orden de slot.
+        """
+        slots = self.slots_of(KIND_DRONE)
+        if not slots.size:
+            return
+
+        x = self.columns["x"]
+        width = self.columns["width"]
+        direction = self.columns["direction"]
+        timer = self.columns["move_timer"]
+        interval = self.columns["move_interval"]
+
+        timer[slots] += 1
+        due = slots[timer[slots] >= interval[slots]]
+        if due.size:
+            near_left = x[due] <= margin
+            near_right = x[due] >= SCREEN_WIDTH - width[due] - margin
+            new_direction = np.where(near_left, 1.0, -1.0)
+            free = ~(near_left | near_right)
+            new_interval = np.empty(due.size, dtype=np.int32)
+
+            # El LCG es secuencial: solo los drones que vencen este tick consumen valores
+            free_list = free.tolist()
+            for i in range(due.size):
+                if free_list[i]:
+                    new_direction[i] = prng.next_choice([-1, 1])
+                new_interval[i] = int(30 + prng.next() * 30)
+
+            direction[due] = new_direction
+            timer[due] = 0
+            interval[due] = new_interval
+
+        # minimum/maximum en vez de np.clip: mismo resultado sin su sobrecoste por llamada
+        x[slots] = np.minimum(np.maximum(x[slots] + direction[slots] * self.columns["speed"][slots], 0),
+                              SCREEN_WIDTH - width[slots])
+
+    def advance(self, amount, *kinds):
+        """Desplazar verticalmente a todas las entidades de los tipos dados"""
+        slots = self.slots_of(*kinds)
+        if slots.size:
+            self.columns["y"][slots] += amount
+        return slots
+
+    def advance_by_speed(self, *kinds):
+        """Desplazar verticalmente según la velocidad propia de cada entidad"""
+        slots = self.slots_of(*kinds)
+        if slots.size:
+            self.columns["y"][slots] += self.columns["speed"][slots]
+        return slots
+
+    def beyond(self, limit, *kinds):
+        """Entidades de los tipos dados cuya coordenada y supera el límite"""
+        slots = self.slots_of(*kinds)
+        if not slots.size:
+            return []
+        hits = slots[self.columns["y"][slots] > limit]
+        return [self.entities[slot] for slot in hits.tolist()]
+
+    def centers(self, *kinds):
+        """
+        Centros de las entidades de los tipos dados en una pasada (para dibujar en lote).
+
+        Returns:
+            tuple: (entidades, lista de x, lista de y)
+        """
+        slots = self.slots_of(*kinds)
+        columns = self.columns
+        center_x = columns["x"][slots] + columns["width"][slots] // 2
+        center_y = columns["y"][slots] + columns["height"][slots] // 2
+        return [self.entities[slot] for slot in slots.tolist()], center_x.tolist(), center_y.tolist()
+
+    def bounds(self, *kinds, margin=0):
+        """
+        Rectángulos de colisión de las entidades de los tipos dados en una pasada (mismo
+        truncado que Entity.rect), agrandados `margin` píxeles por lado.
+
+        Returns:
+            tuple: (entidades, arreglo int64 de filas x, y, ancho, alto), en orden de slot
+        """
+        slots = self.slots_of(*kinds)
+        columns = self.columns
+        bounds = np.empty((slots.size, 4), dtype=np.int64)
+        bounds[:, 0] = columns["x"][slots]
+        bounds[:, 1] = columns["y"][slots]
+        bounds[:, 2] = columns["width"][slots]
+        bounds[:, 3] = columns["height"][slots]
+        if margin:
+            bounds[:, :2] -= margin
+            bounds[:, 2:] += 2 * margin
+        return [self.entities[slot] for slot in slots.tolist()], bounds
+
+    def __len__(self):
+        return self.count
@@ -10,6 +10,9 @@ import random
 from collections import defaultdict, Counter
 from enum import Enum
 import math
+from utils.alias_sampler import AliasSampler
+from utils.random_loader import lcg_block, lcg_jump
+from utils.prng_stats import uniformity_chi_square, serial_correlation
 
 # =====================================================
 # MODELO 1: GENERADOR LCG (Linear Congruential Generator)
@@ -70,6 +73,33 @@ class PseudoRandom:
         index = int(rand * len(choices)) % len(choices)
         return choices[index]
     
+    def next_states(self, n):
+        """Los n estados siguientes en un arreglo uint64 (mismo avance que n llamadas a next())."""
+        states = lcg_block(self.multiplier, self.increment, self.current, n)
+        self.current = int(states[-1])
+        self.call_count += n
+        return states
+    
+    def next_block(self, n):
+        """Generar n números normalizados [0,1) de una vez, idénticos a n llamadas a next()."""
+        return self.next_states(n) / float(self.modulus)
+    
+    def advance(self, n):
+        """Saltar n pasos en O(log n) (mismo estado que n llamadas a next())."""
+        jump_a, jump_c = lcg_jump(self.multiplier, self.increment, n, self.modulus)
+        self.current = (jump_a * self.current + jump_c) % self.modulus
+        self.call_count += n
+    
+    def split(self, k):
+        """k generadores en subsecuencias disjuntas del periodo (mismo reparto que el del juego)."""
+        stride = (self.modulus // k - 1) | 1
+        streams = []
+        for index in range(k):
+            stream = PseudoRandom(seed=self.current)
+            stream.advance(index * stride)
+            streams.append(stream)
+        return streams
+    
     def reset(self, new_seed=None):
         """Resetear el generador con una nueva semilla o la original."""
         if new_seed is not None:
@@ -91,32 +121,35 @@ def test_lcg_model():
     # Test 1: Uniformidad de distribución
     print("\n1. Test de Uniformidad:")
     prng = PseudoRandom(seed=12345)
-    samples = [prng.next() for _ in range(10000)]
+    samples = prng.next_block(10000)
     
     # Dividir en 10 bins y verificar uniformidad
-    bins = [0] * 10
-    for sample in samples:
-        bin_index = min(int(sample * 10), 9)
-        bins[bin_index] += 1
-    
-    expected = 1000  # 10000/10
-    chi_square = sum((observed - expected)**2 / expected for observed in bins)
+    bins, chi_square = uniformity_chi_square(samples)
     
     print(f"Distribución por bins: {bins}")
     print(f"Chi-cuadrado: {chi_square:.2f} (menor que 16.92 = bueno)")
     print(f"Uniformidad: {'APROBADO' if chi_square < 16.92 else 'REPROBADO'}")
     
+    # Correlación serial: |r| < 2/sqrt(n) es compatible con independencia (95%)
+    correlation = serial_correlation(samples)
+    correlation_limit = 2 / math.sqrt(len(samples))
+    print(f"Correlación serial (lag 1): {correlation:.4f} (|r| menor que {correlation_limit:.3f} = bueno)")
+    
     # Test 2: Periodo del generador
     print("\n2. Test de Periodo:")
     prng.reset()
     initial_state = prng.current
     period = 0
     
-    for i in range(100000):  # Límite para evitar bucle infinito
-        prng.next()
-        period += 1
-        if prng.current == initial_state:
+    limit = 100000  # Límite para evitar bucle infinito
+    block = 10000
+    while period < limit:
+        states = prng.next_states(min(block, limit - period))
+        matches = np.flatnonzero(states == initial_state)
+        if len(matches):
+            period += int(matches[0]) + 1
             break
+        period += len(states)
     
     print(f"Periodo encontrado: {period} iteraciones")
     print(f"Período teórico máximo: {2**32}")
@@ -126,8 +159,8 @@ def test_lcg_model():
     prng1 = PseudoRandom(seed=67890)
     prng2 = PseudoRandom(seed=67890)
     
-    sequence1 = [prng1.next() for _ in range(100)]
-    sequence2 = [prng2.next() for _ in range(100)]
+    sequence1 = prng1.next_block(100).tolist()
+    sequence2 = prng2.next_block(100).tolist()
     
     reproducible = sequence1 == sequence2
     print(f"Secuencias idénticas con misma semilla: {'SÍ' if reproducible else 'NO'}")
@@ -147,10 +180,51 @@ def test_lcg_model():
     print(f"Izquierda: {left_count}, Derecha: {right_count}")
     print(f"Desbalance: {balance:.3f} (menor que 0.1 = bueno)")
     
+    # Test 5: Salto O(log n) equivalente a n pasos secuenciales (falla la evaluación si no)
+    print("\n5. Test de Salto:")
+    for steps in (0, 1, 2, 1000, 65537):
+        sequential = PseudoRandom(seed=12345)
+        for _ in range(steps):
+            sequential.next()
+        jumped = PseudoRandom(seed=12345)
+        jumped.advance(steps)
+        if jumped.current != sequential.current or jumped.next() != sequential.next():
+            raise AssertionError(f"advance({steps}) no coincide con {steps} llamadas a next()")
+    full_period = PseudoRandom(seed=12345)
+    full_period.advance(2**32)
+    if full_period.current != 12345:
+        raise AssertionError("advance(2**32) no vuelve a la semilla tras un periodo completo")
+    jump_ok = True
+    print("advance(n) coincide con n pasos: SÍ")
+    
+    # Test 6: split(k) da subsecuencias disjuntas que son tramos de la secuencia original
+    print("\n6. Test de Reparto (split):")
+    parent = PseudoRandom(seed=12345)
+    first_values = 1000
+    for k in (2, 5, 16):
+        streams = parent.split(k)
+        stride = (parent.modulus // k - 1) | 1
+        seen = set()
+        for index, stream in enumerate(streams):
+            values = stream.next_states(first_values).tolist()
+            seen.update(values)
+            # El flujo i es el tramo de la secuencia original que empieza i * stride pasos después
+            origin = PseudoRandom(seed=parent.current)
+            origin.advance(index * stride)
+            if origin.next_states(first_values).tolist() != values:
+                raise AssertionError(f"El flujo {index} de split({k}) no sigue la secuencia original")
+        if len(seen) != k * first_values:
+            raise AssertionError(f"Los {first_values} primeros valores de split({k}) se solapan")
+        print(f"split({k}): {k} flujos x {first_values} valores, disjuntos y en la secuencia original")
+    split_ok = True
+    
     return {
         'uniformidad': chi_square < 16.92,
         'reproducibilidad': reproducible,
-        'balance_direcciones': balance < 0.1
+        'balance_direcciones': balance < 0.1,
+        'correlacion_serial': abs(correlation) < correlation_limit,
+        'salto': jump_ok,
+        'reparto': split_ok
     }
 
 # =====================================================
@@ -331,28 +405,22 @@ class MonteCarloModel:
         self.powerup_probabilities = [0.15, 0.10, 0.05, 0.70]
         self.powerup_cumulative = np.cumsum(self.powerup_probabilities)
         
-        # Usar el LCG del juego
+        # Usar el LCG del juego como fuente de uniformes de la tabla alias
         self.prng = PseudoRandom(seed=seed)
+        self.sampler = AliasSampler(self.powerup_types, self.powerup_probabilities, self.prng.next)
         
         # Estadísticas
         self.generation_history = []
         self.call_count = 0
         
     def generate_powerup(self):
-        """Determina power-up usando secuencia pseudoaleatoria y matriz acumulativa."""
-        rand = self.prng.next()
+        """Determina power-up usando secuencia pseudoaleatoria y tabla alias (O(1) por muestra)."""
+        chosen = self.sampler.sample()
         self.call_count += 1
         
-        for i, threshold in enumerate(self.powerup_cumulative):
-            if rand <= threshold:
-                chosen = self.powerup_types[i]
-                result = None if chosen == "none" else chosen
-                self.generation_history.append(result)
-                return result
-        
-        # Fallback (no debería llegar aquí)
-        self.generation_history.append(None)
-        return None
+        result = None if chosen == "none" else chosen
+        self.generation_history.append(result)
+        return result
     
     def simulate_drops(self, enemy_kills=1000, drop_rate=0.15):
         """Simular drops de power-ups por matar enemigos."""
@@ -1180,4 +1248,5 @@ if __name__ == "__main__":
         print("Cada modelo puede extraerse y utilizarse en otros proyectos.")
         print("Los resultados validan la implementación teórica y práctica.")
     else:
-        print("Error en la evaluación. Revisar implementación de modelos.")
\ No newline at end of file
+        print("Error en la evaluación. Revisar implementación de modelos.")
+        raise SystemExit(1)
\ No newline at end of file
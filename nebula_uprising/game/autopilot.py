@@ -0,0 +1,144 @@
+"""
+Piloto Automático - Nebula Uprising
+Jugador automático determinista para partidas headless: persigue al enemigo que más
+ha descendido, esquiva balas y misiles hostiles y recoge power-ups alcanzables.
+Las amenazas se puntúan sobre arreglos; los enemigos (pocos a la vez), sobre listas.
+"""
+
+import numpy as np
+from config.settings import SCREEN_WIDTH, PLAYER_SPEED, BULLET_WIDTH, POWERUP_SIZE
+from entities.enemies import ENEMY_BOSS
+from entities.projectiles import ENEMY_BULLET, HOMING_MISSILE
+from entities.store import KIND_DRONE, KIND_MARKOV, KIND_POWERUP
+from game.headless import ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT
+
+# Movimientos candidatos de cada tick; en empate gana el primero (quedarse quieto)
+MOVE_STEPS = (0.0, -1.0, 1.0)
+MOVES = np.array(MOVE_STEPS)
+MOVE_ACTIONS = ((), (ACTION_LEFT,), (ACTION_RIGHT,))
+
+class AutopilotInput:
+    """
+    Fuente de entrada para run_headless. En cada tick lee get_game_state() y elige
+    entre quedarse, ir a la izquierda o a la derecha minimizando el peligro previsto
+    y la distancia a su objetivo; dispara cuando tiene un enemigo encima.
+    """
+
+    DANGER_HORIZON = 90     # Ticks hacia adelante en que un proyectil cuenta como amenaza
+    DODGE_MARGIN = 12       # Holgura lateral (px) que se exige a cada lado del jugador
+    DANGER_WEIGHT = 1000.0  # Peso del peligro frente a la distancia al objetivo
+    CHASE_BIAS = 0.5        # Cuánto pesa la distancia horizontal al elegir enemigo
+    SHOOT_INTERVAL = 2      # Ticks mínimos entre disparos
+    AIM_TOLERANCE = 0.5     # Fracción del ancho del enemigo que cuenta como alineado
+
+    def __init__(self):
+        self.cooldown = 0
+
+    def __call__(self, game):
+        state = game.get_game_state()
+        player = state['player']
+        half_width = player.width / 2
+        center = player.x + half_width
+
+        enemy_x, enemy_y, enemy_width = self._enemies(state)
+        danger = self._danger(state['projectiles'], player, center, half_width)
+
+        # Objetivo: un power-up alcanzable o, si no hay, el enemigo más bajo y cercano
+        target = self._reachable_powerup(state, player, center)
+        if target is None and enemy_x:
+            # max devuelve el primero entre iguales, como argmax
+            target = max(zip(enemy_y, enemy_x), key=lambda enemy: enemy[0] - self.CHASE_BIAS * abs(enemy[1] - center))[1]
+        if target is None:
+            target = SCREEN_WIDTH / 2
+
+        # Coste de cada movimiento: peligro previsto + distancia al objetivo tras un paso
+        # (solo 3 candidatos: se puntúan con floats, sin arreglos)
+        low, high = half_width, SCREEN_WIDTH - half_width
+        cost = [self.DANGER_WEIGHT * threat + abs(target - min(max(center + move * PLAYER_SPEED, low), high))
+                for move, threat in zip(MOVE_STEPS, danger)]
+        actions = MOVE_ACTIONS[cost.index(min(cost))]
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+        elif any(abs(x - center) < width * self.AIM_TOLERANCE for x, width in zip(enemy_x, enemy_width)):
+            self.cooldown = self.SHOOT_INTERVAL
+            actions += (ACTION_SHOOT,)
+        return actions
+
+    def _enemies(self, state):
+        """
+        Centro x, posición y y ancho de los enemigos vivos, en listas.
+        Sin almacén (USE_ENTITY_STORE apagado) se leen de los objetos, uno por uno.
+        """
+        store = state['entity_store']
+        if store is None:
+            enemies = list(state['enemies'])
+            return ([enemy.x + enemy.width / 2 for enemy in enemies], [enemy.y for enemy in enemies],
+                    [enemy.width for enemy in enemies])
+
+        slots = store.slots_of(KIND_DRONE, KIND_MARKOV)
+        columns = store.columns
+        width = columns["width"][slots].tolist()
+        y = columns["y"][slots].tolist()
+        x = [left + size / 2 for left, size in zip(columns["x"][slots].tolist(), width)]
+
+        # El jefe no vive en el almacén, pero hay a lo sumo uno
+        for boss in state['enemies'].get_bucket(ENEMY_BOSS):
+            x.append(boss.x + boss.width / 2)
+            y.append(boss.y)
+            width.append(boss.width)
+        return x, y, width
+
+    def _danger(self, projectiles, player, center, half_width):
+        """
+        Peligro previsto de cada movimiento candidato (lista de 3).
+        Cada proyectil hostil se extrapola con su velocidad del último tick hasta la
+        altura del jugador; si cae dentro del ancho del jugador tras mantener el
+        movimiento ese tiempo, suma 1 / (1 + ticks) (las amenazas cercanas pesan más).
+        """
+        bullets = projectiles.get_bucket(ENEMY_BULLET)
+        missiles = projectiles.get_bucket(HOMING_MISSILE)
+        if not missiles:
+            if not bullets:
+                return [0.0] * len(MOVE_STEPS)
+            x, y, vx, vy = bullets.motion()
+        elif not bullets:
+            x, y, vx, vy = missiles.motion()
+        else:
+            x, y, vx, vy = (np.concatenate(pair) for pair in zip(bullets.motion(), missiles.motion()))
+
+        gap = player.y - y
+        incoming = (vy > 0) & (gap > -player.height)
+        ticks = np.where(incoming, np.maximum(gap, 0.0) / np.where(vy > 0, vy, 1.0), 0.0)
+        incoming &= ticks <= self.DANGER_HORIZON
+
+        landing_x = x + BULLET_WIDTH / 2 + vx * ticks
+        future = np.minimum(np.maximum(center + MOVES[:, None] * (PLAYER_SPEED * ticks), half_width),
+                            SCREEN_WIDTH - half_width)
+        hits = (np.abs(landing_x - future) < half_width + self.DODGE_MARGIN) & incoming
+        return (hits @ (1.0 / (1.0 + ticks))).tolist()
+
+    def _reachable_powerup(self, state, player, center):
+        """
+        Centro x del power-up más bajo al que se llega antes de que pase de largo (o None).
+        Sin almacén se leen de los objetos, uno por uno.
+        """
+        store = state['entity_store']
+        if store is None:
+            power_ups = [(power_up.x, power_up.y, power_up.speed) for power_up in state['power_ups']]
+        else:
+            slots = store.slots_of(KIND_POWERUP)
+            if not slots.size:
+                return None
+            columns = store.columns
+            power_ups = zip(columns["x"][slots].tolist(), columns["y"][slots].tolist(),
+                            columns["speed"][slots].tolist())
+
+        best = None
+        for x, y, speed in power_ups:
+            x += POWERUP_SIZE / 2
+            ticks_left = (player.y - y) / max(speed, 1e-9)
+            # Ante empate en y gana el primero, como argmax
+            if ticks_left > 0 and abs(x - center) / PLAYER_SPEED <= ticks_left and (best is None or y > best[0]):
+                best = (y, x)
+        return None if best is None else best[1]
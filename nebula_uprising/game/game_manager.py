@@ -1,15 +1,21 @@
-import numpy as np
 import pygame
-import random
 from config.settings import *
 from config.colors import *
 from entities.player import Player
-from entities.enemies import DroneEnemy, MarkovEnemy, BossFinalAgent
+from entities.enemies import DroneEnemy, MarkovEnemy, BossFinalAgent, PRNG, ENEMY_DRONE, ENEMY_MARKOV, ENEMY_BOSS
+from entities.store import EntityStore, KIND_DRONE, KIND_MARKOV, KIND_POWERUP
 from entities.powerups import PowerUp
+from entities.base import get_fast_sprite
+from entities.collection import EntityList, EntityBuckets
 from systems.narrative import NarrativeSystem
 from systems.waves import WaveQueue
 from systems.collision import CollisionSystem
-from utils.random_loader import PseudoRandom
+from systems.projectile_manager import ProjectileManager
+from systems.clock import SimulationClock
+from systems.scheduler import Scheduler
+from systems.budget import EntityBudget, BUDGET_ENEMIES, BUDGET_POWER_UPS, POLICY_DEFER, POLICY_REJECT
+from utils.rng_registry import RNG, STREAM_LOOT, STREAM_NARRATIVE
+from utils.alias_sampler import AliasSampler
 
 class GameManager:
     """
@@ -17,20 +23,43 @@ class GameManager:
     Coordina todos los sistemas y entidades del juego.
     """
        
-    def __init__(self, screen):
+    def __init__(self, screen, endless=False, seed=RNG_SEED):
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.endless = endless  # Modo infinito / estrés
+        
+        # Sembrar el registro antes de crear nada: la partida se reproduce desde esta semilla
+        self.seed = seed
+        RNG.reseed(seed)
+        
+        # Temporizadores: "frame" avanza cada tick de pantalla, "sim" cada tick de simulación
+        self.scheduler = Scheduler()
+        self.timers = self.scheduler.wheel("frame")
+        self.sim_timers = self.scheduler.wheel("sim")
+        
+        # Enemigos Markov cuyo temporizador de estado venció (se resuelven en lote en update)
+        self.markov_transitions = []
+        
+        # Presupuesto global de entidades (topes por categoría y métricas de intervención)
+        self.budget = EntityBudget()
         
         # Inicializar entidades principales
-        self.player = Player(SCREEN_WIDTH // 2 - 20, SCREEN_HEIGHT - 60)
-        self.enemies = []
-        self.power_ups = []
+        self.projectiles = ProjectileManager(self.budget)
+        self.player = Player(SCREEN_WIDTH // 2 - 20, SCREEN_HEIGHT - 60, self.projectiles, self.sim_timers)
+        self.enemies = EntityBuckets(ENEMY_DRONE, ENEMY_MARKOV, ENEMY_BOSS)
+        self.summoned_alive = 0  # Drones del jefe vivos (tope BOSS_DRONE_CAP)
+        self.power_ups = EntityList()
+        
+        # Almacén SoA opcional para el movimiento vectorizado
+        self.entity_store = EntityStore() if USE_ENTITY_STORE else None
         
         # Inicializar sistemas
-        self.wave_system = WaveQueue()
-        self.narrative_system = NarrativeSystem()
+        self.clock = SimulationClock()
+        self.wave_system = WaveQueue(endless=endless)
+        self.budget.register(BUDGET_ENEMIES, self.enemies.__len__, ENDLESS_MAX_ACTIVE_ENEMIES, POLICY_DEFER)
+        self.budget.register(BossFinalAgent.DRONE_BUDGET, self._count_boss_drones, BOSS_DRONE_CAP, POLICY_REJECT)
+        self.budget.register(BUDGET_POWER_UPS, self.power_ups.__len__, POWERUP_CAP, POLICY_REJECT)
+        self.narrative_system = NarrativeSystem(self.sim_timers)
         self.collision_system = CollisionSystem(self)
-        self.wave_transition_timer = 0
 
         #entre oleadas
         self.showing_wave_transition = False
@@ -44,8 +73,8 @@ class GameManager:
         self.paused = False
         
         # NUEVO: Control de input para evitar salir accidentalmente de pantallas finales
-        self.victory_input_delay = 0  # Contador para retrasar la aceptación de input en victoria
-        self.game_over_input_delay = 0  # Lo mismo para game over
+        self._victory_input_timer = None  # Plazo antes de aceptar input en victoria
+        self._game_over_input_timer = None  # Lo mismo para game over
         self.input_delay_duration = 120  # 2 segundos de espera antes de aceptar input (60 FPS * 2)
         
         #Sistema de defensa de colonias
@@ -57,20 +86,19 @@ class GameManager:
         self.inactivity_timer = 0
         self.max_inactivity = 600  # 10 segundos a 60 FPS
         
-        # Control de spawning
-        self.spawn_timer = 0
-        self.enemies_spawned = {}
-        
-        # Fuentes
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.tiny_font = pygame.font.Font(None, 18)
+        # Fuentes (sin pantalla, en simulación headless, no se dibuja nada)
+        self.font = self.small_font = self.tiny_font = None
+        if screen is not None:
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 24)
+            self.tiny_font = pygame.font.Font(None, 18)
         
         # Monte Carlo para power-ups
-        self.prng = PseudoRandom(seed=67890)
+        self.prng = RNG.stream(STREAM_LOOT)
         self.powerup_types = ["slow_time", "shield", "extra_life", "none"]
         self.powerup_probabilities = [0.15, 0.10, 0.05, 0.70]
-        self.powerup_cumulative = np.cumsum(self.powerup_probabilities)
+        self.powerup_sampler = AliasSampler(self.powerup_types, self.powerup_probabilities, self.prng.next,
+                                            self.prng.next_block)
 
         
         #Control de fragmentos narrativos
@@ -84,62 +112,118 @@ class GameManager:
         """Inicializar el estado inicial del juego"""
         self.narrative_system.queue_message("intro")
         self.wave_system.get_next_wave()
-        self.spawn_timer = 0
-        self.enemies_spawned = {}
+        self._announce_wave()
     
-    def monte_carlo_powerup(self):
-        """Determina power-up usando secuencia pseudoaleatoria generada por LCG" "PRNG"""
-        rand = self.prng.next()
-
-        for i, threshold in enumerate(self.powerup_cumulative):
-            if rand <= threshold:
-                chosen = self.powerup_types[i]
-                return None if chosen == "none" else chosen
-        
-        return None
+    @property
+    def victory_input_delay(self):
+        """Ticks que faltan para aceptar input en la pantalla de victoria"""
+        return self.timers.remaining(self._victory_input_timer)
     
-    def spawn_enemies(self):
-        """Generar enemigos según la oleada actual"""
-        if not self.wave_system.current_wave:
-            return
-        
+    @victory_input_delay.setter
+    def victory_input_delay(self, ticks):
+        self.timers.cancel(self._victory_input_timer)
+        self._victory_input_timer = self.timers.schedule(ticks) if ticks > 0 else None
+    
+    @property
+    def game_over_input_delay(self):
+        """Ticks que faltan para aceptar input en la pantalla de game over"""
+        return self.timers.remaining(self._game_over_input_timer)
+    
+    @game_over_input_delay.setter
+    def game_over_input_delay(self, ticks):
+        self.timers.cancel(self._game_over_input_timer)
+        self._game_over_input_timer = self.timers.schedule(ticks) if ticks > 0 else None
+    
+    def _end_wave_transition(self):
+        """Ocultar el mensaje de transición entre oleadas"""
+        self.showing_wave_transition = False
+        self._announce_wave()
+    
+    def _announce_wave(self):
+        """Mostrar el mensaje narrativo de la oleada actual (una sola vez)"""
         wave = self.wave_system.current_wave
-        
-        # Mostrar mensaje narrativo de la oleada
-        if wave.get("narrative") and wave["narrative"] not in self.wave_system.narrative_triggered:
+        if wave and wave.get("narrative") and wave["narrative"] not in self.wave_system.narrative_triggered:
             self.narrative_system.queue_message(wave["narrative"])
             self.wave_system.narrative_triggered[wave["narrative"]] = True
-        
-        if wave["spawn_rate"] < 0:  # Jefe final
-            if not self.enemies:  # Solo generar si no hay enemigos
-                boss_x = SCREEN_WIDTH // 2 - BOSS_WIDTH // 2
-                boss_y = 50  
-                boss = BossFinalAgent(boss_x, boss_y)
-                self.enemies.append(boss)
+    
+    def get_pending_timers(self):
+        """Temporizadores pendientes por dominio (para depuración)"""
+        return self.scheduler.pending()
+    
+    def monte_carlo_powerup(self):
+        """Determina power-up con la tabla alias, usando el LCG como fuente de uniformes"""
+        chosen = self.powerup_sampler.sample()
+        return None if chosen == "none" else chosen
+    
+    def spawn_enemies(self):
+        """Generar los enemigos cuyo evento vence en la línea de tiempo de la oleada"""
+        if self.wave_system.all_spawned():
             return
         
-        # Aplicar factor de tiempo lento al spawn timer
-        time_factor = 0.3 if self.player.slow_time else 1.0
+        # Con el tope de enemigos alcanzado el spawn se aplaza (el reloj de spawn se detiene)
+        room = self.budget.room(BUDGET_ENEMIES)
+        if not room:
+            return
         
-        self.spawn_timer += time_factor
-        if self.spawn_timer >= wave["spawn_rate"]:
-            self.spawn_timer = 0
-            
-            for enemy_type, count in wave["enemies"]:
-                if enemy_type not in self.enemies_spawned:
-                    self.enemies_spawned[enemy_type] = 0
-                
-                if self.enemies_spawned[enemy_type] < count:
-                    if enemy_type == "drone":
-                        enemy = DroneEnemy(random.randint(0, SCREEN_WIDTH - 30), 
-                                         random.randint(50, 150))
-                        self.enemies.append(enemy)
-                    elif enemy_type == "markov":
-                        enemy = MarkovEnemy(random.randint(0, SCREEN_WIDTH - 35),
-                                          random.randint(50, 150))
-                        self.enemies.append(enemy)
-                    
-                    self.enemies_spawned[enemy_type] += 1
+        # Aplicar factor de tiempo lento al reloj de spawn; en un tick denso solo salen los
+        # que caben en el presupuesto y el resto queda vencido para los ticks siguientes
+        for enemy_type, x, y in self.wave_system.pop_due_spawns(self.clock.scale(SLOW_TIME_SPAWN_SCALE), room):
+            self.spawn_enemy(enemy_type, x, y)
+    
+    def spawn_enemy(self, enemy_type, x, y, summoned=False):
+        """
+        Crear y registrar un enemigo del tipo indicado.
+
+        Args:
+            summoned: True para los drones invocados por el jefe
+
+        Returns:
+            El enemigo creado, o None si el tipo no existe o (invocado) no cabe en el tope de enemigos
+        """
+        # Los invocados cuentan contra el mismo tope que la oleada (los de la oleada ya lo consultaron)
+        if summoned and not self.budget.allow(BUDGET_ENEMIES):
+            return None
+        if enemy_type == ENEMY_DRONE:
+            enemy = DroneEnemy(x, y)
+        elif enemy_type == ENEMY_MARKOV:
+            enemy = MarkovEnemy(x, y, self.projectiles, self.scheduler.wheel(ENEMY_MARKOV), self.markov_transitions)
+        elif enemy_type == ENEMY_BOSS:  # Jefe final
+            enemy = BossFinalAgent(x, y, self.projectiles, self.scheduler.wheel(ENEMY_BOSS),
+                                   self.budget, self.spawn_enemy)
+        else:
+            return None
+        if summoned:
+            enemy.summoned = True
+        self.add_enemy(enemy)
+        return enemy
+    
+    def add_enemy(self, enemy):
+        """Agregar un enemigo a la lista y, si su tipo lo permite, al almacén"""
+        self.enemies.append(enemy)
+        if enemy.summoned:
+            self.summoned_alive += 1
+        if self.entity_store is not None and enemy.store_kind is not None:
+            self.entity_store.add(enemy, enemy.store_kind)
+    
+    def remove_enemy(self, enemy):
+        """Quitar un enemigo de la lista y del almacén"""
+        if enemy.summoned and enemy.alive:
+            self.summoned_alive -= 1
+        self.enemies.remove(enemy)
+        if enemy._store is not None:
+            self.entity_store.remove(enemy)
+    
+    def add_power_up(self, power_up):
+        """Agregar un power-up a la lista y al almacén"""
+        self.power_ups.append(power_up)
+        if self.entity_store is not None:
+            self.entity_store.add(power_up, KIND_POWERUP)
+    
+    def remove_power_up(self, power_up):
+        """Quitar un power-up de la lista y del almacén"""
+        self.power_ups.remove(power_up)
+        if power_up._store is not None:
+            self.entity_store.remove(power_up)
     
     def unlock_story_fragment(self):
         """Desbloquear fragmentos de historia aleatoriamente"""
@@ -181,7 +265,7 @@ class GameManager:
         if not available_types:
             return
         
-        fragment_type = random.choice(available_types)
+        fragment_type = RNG.stream(STREAM_NARRATIVE).choice(available_types)
         fragments = all_fragments[fragment_type]
         current_fragments = self.narrative_system.story_fragments.get(fragment_type, [])
         
@@ -217,7 +301,7 @@ class GameManager:
     
     def handle_enemy_destruction(self, enemy):
         """Manejar la destrucción de un enemigo"""
-        if isinstance(enemy, BossFinalAgent):
+        if enemy.bucket == ENEMY_BOSS:
             self.score += 1000
             self.victory = True
             # NUEVO: Iniciar el delay de input al activar la victoria
@@ -238,15 +322,15 @@ class GameManager:
             
             # Chance de generar power-up
             drop_chance = 0.15
-            if random.random() < drop_chance:
+            if self.prng.random() < drop_chance:
                 power_type = self.monte_carlo_powerup()
                 if power_type:
                     power_up = PowerUp(enemy.x, enemy.y, power_type)
-                    self.power_ups.append(power_up)
+                    self.add_power_up(power_up)
             
             # Mayor chance de fragmento si se tienen oleadas perfectas
             fragment_chance = 0.15 if self.player.perfect_runs > 0 else 0.1
-            if random.random() < fragment_chance:
+            if RNG.stream(STREAM_NARRATIVE).random() < fragment_chance:
                 self.unlock_story_fragment()
     
     def handle_player_damage(self, damage_amount):
@@ -293,24 +377,33 @@ class GameManager:
             self.game_over_input_delay = self.input_delay_duration
             self.narrative_system.queue_message("colony_destroyed")
 
+    def _count_boss_drones(self):
+        """Drones invocados por el jefe que siguen vivos (contador de add/remove_enemy, O(1))"""
+        if not self.enemies.get_bucket(ENEMY_BOSS):
+            return 0
+        return self.summoned_alive
+    
+    def get_entity_counts(self):
+        """Número de entidades vivas por categoría (contador del modo estrés)"""
+        counts = {
+            "drones": len(self.enemies.get_bucket(ENEMY_DRONE)),
+            "markov": len(self.enemies.get_bucket(ENEMY_MARKOV)),
+            "bosses": len(self.enemies.get_bucket(ENEMY_BOSS)),
+            "power_ups": len(self.power_ups),
+            "projectiles": len(self.projectiles)
+        }
+        counts["total"] = sum(counts.values())
+        return counts
+    
     def all_enemies_spawned(self):
         """Verificar si se han generado todos los enemigos de la oleada actual"""
-        if not self.wave_system.current_wave:
-            return True
-        wave = self.wave_system.current_wave
-        for enemy_type, total in wave["enemies"]:
-            if self.enemies_spawned.get(enemy_type, 0) < total:
-                return False
-        return True
+        return self.wave_system.all_spawned()
     
     def update(self, dt):
         """Actualizar el estado del juego"""
-        # NUEVO: Actualizar contadores de delay de input
-        if self.victory and self.victory_input_delay > 0:
-            self.victory_input_delay -= 1
-        
-        if self.game_over and self.game_over_input_delay > 0:
-            self.game_over_input_delay -= 1
+        # Temporizadores de pantalla (delays de input y transición entre oleadas)
+        if not self.paused:
+            self.timers.advance()
         
         if self.game_over or self.victory or self.paused:
             return
@@ -328,12 +421,10 @@ class GameManager:
 
         # Transición entre oleadas
         if self.showing_wave_transition:
-            self.wave_transition_timer -= 1
-            if self.wave_transition_timer <= 0:
-                self.showing_wave_transition = False
             return  # Pausar todo mientras se muestra el mensaje
 
-        # Actualizar jugador y sistema narrativo
+        # Actualizar jugador y sistema narrativo (escudo, tiempo lento y mensajes)
+        self.sim_timers.advance()
         self.player.update()
         self.narrative_system.update(dt)
 
@@ -353,105 +444,97 @@ class GameManager:
                 # NUEVO: Iniciar el delay de input al activar la victoria
                 self.victory_input_delay = self.input_delay_duration
             else:
-                self.enemies_spawned = {}
                 self.showing_wave_transition = True
-                self.wave_transition_timer = self.transition_duration
+                self.timers.schedule(self.transition_duration, self._end_wave_transition)
                 wave_info = self.wave_system.get_current_wave_info()
                 self.next_wave_name = wave_info["name"] if wave_info else f"Oleada {self.wave_system.wave_number}"
             return  # Esperar transición
 
+        # Reloj de simulación: el tiempo lento se reparte con acumuladores fraccionales
+        clock = self.clock
+        clock.advance()
+        self.budget.advance()
+        clock.slow_time = self.player.slow_time
+
         # Factor de tiempo lento más agresivo
-        time_factor = 0.25 if self.player.slow_time else 1.0
+        time_factor = clock.scale(SLOW_TIME_SCALE)
 
         # Spawnear enemigos
         self.spawn_enemies()
 
-        # Actualizar enemigos
-        for enemy in self.enemies[:]:
-            if isinstance(enemy, MarkovEnemy):
-                # Aplicar factor de tiempo a MarkovEnemy
-                if self.player.slow_time:
-                    # Llamar update varias veces con menos frecuencia
-                    if pygame.time.get_ticks() % 4 == 0:  # Solo actualizar cada 4 frames
-                        enemy.update(self.player)
-                else:
-                    enemy.update(self.player)
-            elif isinstance(enemy, BossFinalAgent):
-                # Aplicar factor de tiempo al jefe
-                if self.player.slow_time:
-                    if pygame.time.get_ticks() % 3 == 0:  # Solo actualizar cada 3 frames
-                        enemy.think_and_act(self.player, self)
-                else:
-                    enemy.think_and_act(self.player, self)
+        # Actualizar enemigos (cada tipo desde su propio contenedor)
+        store = self.entity_store
+        drones = self.enemies.get_bucket(ENEMY_DRONE)
+        markovs = self.enemies.get_bucket(ENEMY_MARKOV)
+        bosses = self.enemies.get_bucket(ENEMY_BOSS)
+
+        # Aplicar factor de tiempo a MarkovEnemy: con slow time avanza 1 de cada 4 ticks
+        markov_timers = self.scheduler.wheel(ENEMY_MARKOV)
+        for _ in range(clock.steps(ENEMY_MARKOV, MarkovEnemy.slow_time_scale)):
+            markov_timers.advance()
+            MarkovEnemy.step_transitions(self.markov_transitions)
+            if store is not None:
+                MarkovEnemy.step_batch(store, markov_timers)
             else:
-                # DroneEnemy y otros
-                if self.player.slow_time:
-                    if pygame.time.get_ticks() % 4 == 0:
-                        enemy.update()
-                else:
+                for enemy in markovs:
+                    enemy.update(self.player)
+
+        # Aplicar factor de tiempo al jefe: con slow time avanza 1 de cada 3 ticks
+        boss_timers = self.scheduler.wheel(ENEMY_BOSS)
+        for _ in range(clock.steps(ENEMY_BOSS, BossFinalAgent.slow_time_scale)):
+            boss_timers.advance()
+            for boss in bosses:
+                boss.think_and_act(self.player, self)
+
+        drone_steps = clock.steps(ENEMY_DRONE, DroneEnemy.slow_time_scale)
+        if store is not None:
+            # Caminata de drones, descenso y línea de colonias en pasadas vectorizadas
+            for _ in range(drone_steps):
+                store.step_random_walk(PRNG)
+            store.advance(1.0 * time_factor, KIND_DRONE, KIND_MARKOV)
+            for enemy in store.beyond(SCREEN_HEIGHT - 100, KIND_DRONE, KIND_MARKOV):
+                self.remove_enemy(enemy)
+                self.damage_colony(enemy.colony_damage)
+        else:
+            for _ in range(drone_steps):
+                for enemy in drones:
                     enemy.update()
 
             # Movimiento vertical con factor de tiempo más pronunciado
-            if not isinstance(enemy, BossFinalAgent):
-                enemy.y += 1.0 * time_factor  # Aumentamos la velocidad base
+            for bucket in (drones, markovs):
+                for enemy in bucket:
+                    enemy.y += 1.0 * time_factor  # Aumentamos la velocidad base
 
-            if enemy.y > SCREEN_HEIGHT - 100 and not isinstance(enemy, BossFinalAgent):
-                self.enemies.remove(enemy)
-                if isinstance(enemy, MarkovEnemy):
-                    self.damage_colony(15)
-                else:
-                    self.damage_colony(10)
+                    if enemy.y > SCREEN_HEIGHT - 100:
+                        self.remove_enemy(enemy)
+                        self.damage_colony(enemy.colony_damage)
+
+        # Actualizar todos los proyectiles (los hostiles se ralentizan con slow time)
+        self.projectiles.update(self.player, clock)
 
         # Actualizar power-ups con factor de tiempo
-        for power_up in self.power_ups[:]:
-            # Solo actualizar power-ups si no hay slow time activo, o hacerlo más lento
-            if self.player.slow_time:
-                if pygame.time.get_ticks() % 3 == 0:
+        powerup_steps = clock.steps("powerups", PowerUp.slow_time_scale)
+        if store is not None:
+            for _ in range(powerup_steps):
+                store.advance_by_speed(KIND_POWERUP)
+            for power_up in store.beyond(SCREEN_HEIGHT, KIND_POWERUP):
+                self.remove_power_up(power_up)
+        else:
+            for power_up in self.power_ups:
+                # Solo actualizar power-ups si no hay slow time activo, o hacerlo más lento
+                for _ in range(powerup_steps):
                     power_up.update()
-            else:
-                power_up.update()
-                
-            if power_up.y > SCREEN_HEIGHT:
-                self.power_ups.remove(power_up)
-
-        # Drones del jefe (aplicar factor de tiempo)
-        for enemy in self.enemies:
-            if isinstance(enemy, BossFinalAgent):
-                boss = enemy
-                drones_to_remove = []
-                bullets_to_remove = []
-
-                for drone in boss.spawned_drones[:]:
-                    # Movimiento de drones más lento durante slow time
-                    drone_speed = 0.5 * time_factor
-                    drone.y += drone_speed
                     
-                    if drone.y > SCREEN_HEIGHT - 100:
-                        boss.spawned_drones.remove(drone)
-                        self.damage_colony(8)
-
-                for drone in boss.spawned_drones:
-                    for bullet in self.player.bullets:
-                        if hasattr(drone, "rect") and hasattr(bullet, "rect"):
-                            if drone.rect.colliderect(bullet.rect):
-                                drones_to_remove.append(drone)
-                                bullets_to_remove.append(bullet)
-
-                for drone in drones_to_remove:
-                    if drone in boss.spawned_drones:
-                        boss.spawned_drones.remove(drone)
-                        powerup_type = self.monte_carlo_powerup()
-                        if powerup_type:
-                            powerup = PowerUp(drone.x, drone.y, powerup_type)
-                            self.power_ups.append(powerup)
-
-                for bullet in bullets_to_remove:
-                    if bullet in self.player.bullets:
-                        self.player.bullets.remove(bullet)
+                if power_up.y > SCREEN_HEIGHT:
+                    self.remove_power_up(power_up)
 
         # Verificar colisiones
         self.collision_system.check_all_collisions()
 
+        # Compactar las listas una sola vez al final del tick
+        self.enemies.compact()
+        self.power_ups.compact()
+
     
     def handle_events(self, events):
         """Manejar eventos del juego - MODIFICADO para evitar input accidental"""
@@ -488,7 +571,7 @@ class GameManager:
     
     def restart_game(self):
         """Reiniciar el juego"""
-        self.__init__(self.screen)
+        self.__init__(self.screen, self.endless, self.seed)
     
     def draw_background(self):
         """El fondo ahora se maneja desde el archivo principal con scroll infinito"""
@@ -548,6 +631,11 @@ class GameManager:
             wave_text = self.small_font.render(wave_name, True, YELLOW)
             self.screen.blit(wave_text, (SCREEN_WIDTH // 2 - wave_text.get_width() // 2, 90))
         
+        # Contador de entidades en el modo infinito
+        if self.endless:
+            count_text = self.tiny_font.render(f"Entidades: {self.get_entity_counts()['total']}", True, WHITE)
+            self.screen.blit(count_text, (10, 115))
+        
         # Power-ups activos con efecto visual mejorado
         power_y = 10
         if self.player.shield:
@@ -581,10 +669,9 @@ class GameManager:
                 self.screen.blit(warning_text, warning_rect)
         
         # Barra de vida del jefe si está presente
-        for enemy in self.enemies:
-            if isinstance(enemy, BossFinalAgent):
-                enemy._draw_health_bar(self.screen)
-                enemy._draw_status_text(self.screen)
+        for boss in self.enemies.get_bucket(ENEMY_BOSS):
+            boss._draw_health_bar(self.screen)
+            boss._draw_status_text(self.screen)
         # Mostrar transición de oleada
         if self.showing_wave_transition:
             transition_text = self.font.render(f"Iniciando: {self.next_wave_name}", True, CYAN)
@@ -695,8 +782,13 @@ class GameManager:
         if not (self.game_over or self.victory):
             self.player.draw(self.screen)
             
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
+            if len(self.enemies) > FAST_SPRITE_THRESHOLD:
+                self._draw_enemies_batched()
+            else:
+                for enemy in self.enemies:
+                    enemy.draw(self.screen)
+            
+            self.projectiles.draw(self.screen)
             
             for power_up in self.power_ups:
                 power_up.draw(self.screen)
@@ -713,17 +805,45 @@ class GameManager:
         elif self.victory:
             self.draw_victory()
     
+    def _draw_enemies_batched(self):
+        """Dibujar drones y Markov en un solo blits() con sprites opacos de colorkey"""
+        if self.entity_store is not None:
+            # Centros leídos del almacén en una pasada, sin tocar cada descriptor
+            enemies, centers_x, centers_y = self.entity_store.centers(KIND_DRONE, KIND_MARKOV)
+        else:
+            enemies = [enemy for kind in (ENEMY_DRONE, ENEMY_MARKOV) for enemy in self.enemies.get_bucket(kind)]
+            centers_x = [enemy.x + enemy.width // 2 for enemy in enemies]
+            centers_y = [enemy.y + enemy.height // 2 for enemy in enemies]
+        
+        batch = []
+        for enemy, center_x, center_y in zip(enemies, centers_x, centers_y):
+            image = enemy.current_sprite()
+            if image is None:
+                enemy.draw(self.screen)
+                continue
+            width, height = image.get_size()
+            batch.append((get_fast_sprite(image), (center_x - width // 2, center_y - height // 2)))
+        self.screen.blits(batch, False)
+        for boss in self.enemies.get_bucket(ENEMY_BOSS):
+            boss.draw(self.screen)
+    
     def get_game_state(self):
-        """Obtener el estado actual del juego para otros sistemas"""
+        """
+        Obtener el estado actual del juego para otros sistemas (se llama en cada tick).
+        Los contadores de entidades y las métricas del presupuesto no se incluyen: se
+        piden bajo demanda con get_entity_counts() y budget.get_metrics().
+        """
         return {
             'player': self.player,
             'enemies': self.enemies,
             'power_ups': self.power_ups,
+            'projectiles': self.projectiles,
             'score': self.score,
             'wave_number': self.wave_system.wave_number,
             'fragments_collected': self.narrative_system.fragments_collected,
             'game_over': self.game_over,
             'victory': self.victory,
             'paused': self.paused,
-            'colony_health': self.colony_health
+            'colony_health': self.colony_health,
+            'entity_store': self.entity_store
             }
\ No newline at end of file
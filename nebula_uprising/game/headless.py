@@ -0,0 +1,123 @@
+"""
+Simulación Headless - Nebula Uprising
+Juega partidas completas de GameManager sin ventana, sin audio y sin ritmo de
+fotogramas, con la entrada dada por programa, y devuelve un resumen de cada partida
+"""
+
+import time
+from config.settings import FPS, RNG_SEED, HEADLESS_MAX_TICKS
+from game.game_manager import GameManager
+
+# Acciones que una fuente de entrada puede pedir en cada tick
+ACTION_LEFT = "left"
+ACTION_RIGHT = "right"
+ACTION_SHOOT = "shoot"
+
+# Resultado de una partida
+OUTCOME_VICTORY = "victory"
+OUTCOME_DEFEAT = "defeat"
+OUTCOME_TIMEOUT = "timeout"   # Se alcanzó el tope de ticks sin terminar
+
+class IdleInput:
+    """Fuente de entrada sin acciones (la partida acaba por inactividad)"""
+
+    def __call__(self, game):
+        return ()
+
+class ScriptedInput:
+    """
+    Fuente de entrada que reproduce una secuencia fija: el elemento i son las
+    acciones del tick i. Con `loop` la secuencia se repite al terminar.
+    """
+
+    def __init__(self, script, loop=True):
+        self.script = [tuple(actions) for actions in script]
+        self.loop = loop
+        self.tick = 0
+
+    def __call__(self, game):
+        if not self.script or (not self.loop and self.tick >= len(self.script)):
+            return ()
+        actions = self.script[self.tick % len(self.script)]
+        self.tick += 1
+        return actions
+
+def apply_actions(game, actions):
+    """
+    Aplicar las acciones de un tick con las mismas reglas que el teclado
+    (sin efecto en las pantallas finales ni en pausa).
+
+    Raises:
+        ValueError: si una acción no es ACTION_LEFT, ACTION_RIGHT ni ACTION_SHOOT
+    """
+    if game.game_over or game.victory or game.paused:
+        return
+    player = game.player
+    for action in actions:
+        if action == ACTION_LEFT:
+            player.move_left()
+        elif action == ACTION_RIGHT:
+            player.move_right()
+        elif action == ACTION_SHOOT:
+            player.shoot()
+        else:
+            raise ValueError(f"Acción desconocida {action!r}")
+
+def summarize(game, ticks, elapsed):
+    """Resumen de una partida terminada (o cortada por el tope de ticks)"""
+    if game.victory:
+        outcome = OUTCOME_VICTORY
+    elif game.game_over:
+        outcome = OUTCOME_DEFEAT
+    else:
+        outcome = OUTCOME_TIMEOUT
+    game_seconds = ticks / FPS
+    return {
+        'seed': game.seed,
+        'outcome': outcome,
+        'score': game.score,
+        'colony_health': game.colony_health,
+        'player_health': game.player.health,
+        'waves_reached': game.wave_system.wave_number,
+        'fragments_collected': game.narrative_system.fragments_collected,
+        'ticks': ticks,
+        'game_seconds': game_seconds,
+        'elapsed': elapsed,
+        'speedup': game_seconds / elapsed if elapsed > 0 else float("inf")
+    }
+
+def run_headless(input_source=None, seed=RNG_SEED, endless=False, max_ticks=HEADLESS_MAX_TICKS):
+    """
+    Jugar una partida sin pantalla, tan rápido como permita la CPU.
+    No necesita pygame.init(), ventana ni mezclador de audio; los sprites se cargan
+    sin convertir porque solo se usan para las hitboxes y máscaras de colisión.
+
+    Args:
+        input_source: Función game -> acciones del tick (por defecto IdleInput)
+        seed: Semilla del registro de generadores
+        endless: Modo infinito / estrés
+        max_ticks: Tope de ticks de la partida
+
+    Returns:
+        dict: resumen (ver summarize)
+    """
+    if input_source is None:
+        input_source = IdleInput()
+    game = GameManager(None, endless, seed)
+    dt = 1 / FPS
+    ticks = 0
+    start = time.perf_counter()
+    while ticks < max_ticks and not (game.game_over or game.victory):
+        apply_actions(game, input_source(game))
+        game.update(dt)
+        ticks += 1
+    return summarize(game, ticks, time.perf_counter() - start)
+
+def run_batch(seeds, make_input=IdleInput, endless=False, max_ticks=HEADLESS_MAX_TICKS):
+    """
+    Jugar una partida por semilla, en orden, con una fuente de entrada nueva en cada una.
+
+    Returns:
+        list: resúmenes en el orden de las semillas
+    """
+    return [run_headless(make_input(), seed, endless, max_ticks) for seed in seeds]
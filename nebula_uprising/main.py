@@ -5,10 +5,14 @@ Archivo principal con interfaz gráfica mejorada usando imágenes PNG
 
 import pygame
 import sys
-import random
 import os
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, RNG_SEED
 from game.game_manager import GameManager
+from game.headless import run_batch, IdleInput
+from game.autopilot import AutopilotInput
+from utils.rng_registry import RNG, STREAM_FX
+
+FX_RNG = RNG.stream(STREAM_FX)
 
 class SoundManager:
     def __init__(self):
@@ -101,12 +105,12 @@ class StaticBackgroundWithStars:
         # Generar estrellas iniciales
         for _ in range(num_stars):
             star = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'size': random.choice([1, 1, 2, 2, 3]),  # Más estrellas pequeñas
-                'brightness': random.randint(150, 255),
-                'twinkle_timer': random.randint(0, 120),
-                'twinkle_speed': random.uniform(0.5, 2.0)
+                'x': FX_RNG.randint(0, SCREEN_WIDTH),
+                'y': FX_RNG.randint(0, SCREEN_HEIGHT),
+                'size': FX_RNG.choice([1, 1, 2, 2, 3]),  # Más estrellas pequeñas
+                'brightness': FX_RNG.randint(150, 255),
+                'twinkle_timer': FX_RNG.randint(0, 120),
+                'twinkle_speed': FX_RNG.uniform(0.5, 2.0)
             }
             self.stars.append(star)
     
@@ -119,15 +123,15 @@ class StaticBackgroundWithStars:
             # Si la estrella sale de la pantalla, reposicionarla arriba
             if star['y'] > SCREEN_HEIGHT:
                 star['y'] = -5
-                star['x'] = random.randint(0, SCREEN_WIDTH)
-                star['size'] = random.choice([1, 1, 2, 2, 3])
-                star['brightness'] = random.randint(150, 255)
+                star['x'] = FX_RNG.randint(0, SCREEN_WIDTH)
+                star['size'] = FX_RNG.choice([1, 1, 2, 2, 3])
+                star['brightness'] = FX_RNG.randint(150, 255)
             
             # Efecto de parpadeo
             star['twinkle_timer'] += star['twinkle_speed']
             if star['twinkle_timer'] > 120:
                 star['twinkle_timer'] = 0
-                star['brightness'] = random.randint(150, 255)
+                star['brightness'] = FX_RNG.randint(150, 255)
     
     def draw(self, screen):
         """Dibujar el fondo estático y las estrellas animadas"""
@@ -423,7 +427,10 @@ class ImprovedMenuScreen:
         self.button_hover_effects = {'start': 0, 'info': 0}
 
 class NebulaUprisingGame:
-    def __init__(self):
+    def __init__(self, endless=False, seed=RNG_SEED):
+        self.endless = endless  # Modo infinito / estrés
+        self.seed = seed  # Semilla de cada partida (registro de generadores)
+        
         # Inicializar Pygame
         pygame.init()
         
@@ -609,7 +616,7 @@ class NebulaUprisingGame:
         # Restaurar velocidad normal de estrellas
         self.game_background.set_star_speed(40)
         # Crear GameManager normalmente
-        self.game_manager = GameManager(self.screen)
+        self.game_manager = GameManager(self.screen, self.endless, self.seed)
         # Asignar el sound_manager después de crear el GameManager
         self.game_manager.sound_manager = self.sound_manager
         self.menu_screen.game_started = False
@@ -628,9 +635,28 @@ class NebulaUprisingGame:
         except:
             pass
 
+def run_headless_cli(seed, runs, endless, autopilot=False):
+    """
+    Simular `runs` partidas sin ventana (semillas consecutivas) e imprimir sus resúmenes;
+    con `autopilot` juega AutopilotInput en lugar de un jugador inactivo
+    """
+    make_input = AutopilotInput if autopilot else IdleInput
+    for summary in run_batch(range(seed, seed + runs), make_input, endless):
+        print(f"Semilla {summary['seed']}: {summary['outcome']} | puntos {summary['score']} | "
+              f"colonias {summary['colony_health']} | oleada {summary['waves_reached']} | "
+              f"{summary['ticks']} ticks ({summary['speedup']:.0f}x tiempo real)")
+
 def main():
-    """Función principal"""
-    game = NebulaUprisingGame()
+    """
+    Función principal (--endless inicia el modo infinito / estrés, --seed N fija la semilla,
+    --headless [--runs N] [--autopilot] simula partidas sin ventana)
+    """
+    seed = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else RNG_SEED
+    if "--headless" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1]) if "--runs" in sys.argv else 1
+        run_headless_cli(seed, runs, "--endless" in sys.argv, "--autopilot" in sys.argv)
+        return
+    game = NebulaUprisingGame(endless="--endless" in sys.argv, seed=seed)
     game.run()
 
 if __name__ == "__main__":
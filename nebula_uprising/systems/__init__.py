@@ -1,4 +1,7 @@
 from .menu import MenuScreen
 from .narrative import NarrativeSystem
 from .waves import WaveQueue
-from .collision import CollisionSystem
\ No newline at end of file
+from .collision import CollisionSystem
+from .projectile_manager import ProjectileManager
+from .clock import SimulationClock
+from .scheduler import Scheduler, TimerWheel
\ No newline at end of file
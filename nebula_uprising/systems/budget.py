@@ -0,0 +1,94 @@
+"""
+Presupuesto de Entidades - Nebula Uprising
+Limita cuántas entidades vivas puede haber por categoría y en total, y decide qué
+hacer al alcanzar el tope: aplazar, rechazar o expirar la más antigua
+"""
+
+from collections import deque
+from config.settings import *
+
+# Políticas al alcanzar un tope
+POLICY_DEFER = "defer"     # No crear ahora; se vuelve a intentar en el próximo tick
+POLICY_REJECT = "reject"   # Descartar la creación
+POLICY_EXPIRE = "expire"   # Retirar la entidad más avanzada para hacer sitio
+
+# Categorías propias del presupuesto (los proyectiles usan su tipo como categoría)
+BUDGET_ENEMIES = "enemies"
+BUDGET_POWER_UPS = "power_ups"
+
+class EntityBudget:
+    """
+    Gobernador de entidades: cada categoría registra un contador de entidades vivas,
+    un tope y una política. Cada intervención queda en las métricas.
+    """
+
+    def __init__(self, global_cap=ENTITY_BUDGET_GLOBAL_CAP):
+        self.global_cap = global_cap
+        self.counters = {}      # categoría -> función que devuelve el número de vivas
+        self.caps = {}
+        self.policies = {}
+        self.interventions = {}  # (categoría, política) -> veces
+        self.recent = deque(maxlen=64)  # Últimas intervenciones (tick, categoría, política, vivas)
+        self.listeners = []
+        self.tick = 0
+
+    def register(self, category, counter, cap, policy):
+        """Registrar una categoría con su contador de entidades vivas, tope y política"""
+        self.counters[category] = counter
+        self.caps[category] = cap
+        self.policies[category] = policy
+
+    def total(self):
+        """Entidades vivas de todas las categorías"""
+        return sum(counter() for counter in self.counters.values())
+
+    def allow(self, category):
+        """
+        Consultar si se puede crear una entidad de la categoría.
+        Si no se puede, registra la intervención y devuelve False; quien llama aplica la
+        política (ver policy()): con POLICY_EXPIRE debe retirar una entidad antes de crear.
+        """
+        live = self.counters[category]()
+        if live < self.caps[category] and self.total() < self.global_cap:
+            return True
+        self._intervene(category, live)
+        return False
+
+    def room(self, category):
+        """
+        Entidades de la categoría que aún caben sin pasar su tope ni el global.
+        Con 0 registra la intervención, igual que allow() al devolver False.
+        """
+        live = self.counters[category]()
+        room = min(self.caps[category] - live, self.global_cap - self.total())
+        if room > 0:
+            return room
+        self._intervene(category, live)
+        return 0
+
+    def policy(self, category):
+        """Política de la categoría"""
+        return self.policies[category]
+
+    def _intervene(self, category, live):
+        """Contabilizar una intervención y avisar a los oyentes"""
+        policy = self.policies[category]
+        key = (category, policy)
+        self.interventions[key] = self.interventions.get(key, 0) + 1
+        event = (self.tick, category, policy, live)
+        self.recent.append(event)
+        for listener in self.listeners:
+            listener(*event)
+
+    def advance(self):
+        """Avanzar el tick con el que se marcan las intervenciones"""
+        self.tick += 1
+
+    def get_metrics(self):
+        """Uso por categoría e intervenciones acumuladas"""
+        return {
+            'usage': {category: (counter(), self.caps[category]) for category, counter in self.counters.items()},
+            'total': (self.total(), self.global_cap),
+            'interventions': {f"{category}:{policy}": count
+                              for (category, policy), count in self.interventions.items()}
+        }
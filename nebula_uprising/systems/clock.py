@@ -0,0 +1,44 @@
+"""
+Reloj de Simulación - Nebula Uprising
+Cuenta ticks de simulación (no milisegundos de pared) y reparte el tiempo lento
+entre los sistemas mediante acumuladores fraccionales
+"""
+
+from config.settings import FPS
+
+class SimulationClock:
+    """Reloj determinista propiedad de GameManager"""
+
+    def __init__(self):
+        self.tick = 0
+        self.slow_time = False
+        self.accumulators = {}  # Fracción de paso pendiente por canal
+
+    def advance(self):
+        """Avanzar un tick de simulación"""
+        self.tick += 1
+
+    @property
+    def seconds(self):
+        """Tiempo simulado en segundos"""
+        return self.tick / FPS
+
+    def scale(self, slow_scale):
+        """Factor de tiempo de este tick para una entidad con la escala lenta dada"""
+        return slow_scale if self.slow_time else 1.0
+
+    def steps(self, channel, slow_scale):
+        """
+        Número de pasos enteros que le corresponden a un canal en este tick.
+        Con escala 0.25 el canal avanza exactamente un paso de cada cuatro ticks.
+        """
+        accumulated = self.accumulators.get(channel, 0.0) + self.scale(slow_scale)
+        steps = int(accumulated)
+        self.accumulators[channel] = accumulated - steps
+        return steps
+
+    def reset(self):
+        """Reiniciar el reloj"""
+        self.tick = 0
+        self.slow_time = False
+        self.accumulators.clear()
@@ -4,12 +4,32 @@ Maneja todas las detecciones y resoluciones de colisiones
 MODIFICADO para activar correctamente el delay de input en victoria
 """
 
+import numpy as np
 import pygame
-import random
+from config.settings import PIXEL_PERFECT_COLLISIONS, COLLISION_DIRECT_PAIRS, COLLISION_SWEPT_LIST_MAX
+from entities.base import get_solid_mask
+from entities.enemies import ENEMY_BOSS
+from entities.store import KIND_DRONE, KIND_MARKOV
+from entities.powerups import PowerUp
+from entities.projectiles import PLAYER_BULLET, ENEMY_BULLET, HOMING_MISSILE
+from systems.spatial_hash import SpatialHash
+from systems.budget import BUDGET_POWER_UPS
+from utils.math_utils import segment_rect_intersection
+from utils.rng_registry import RNG, STREAM_LOOT, STREAM_NARRATIVE
+
+LOOT_RNG = RNG.stream(STREAM_LOOT)
+NARRATIVE_RNG = RNG.stream(STREAM_NARRATIVE)
 
 class CollisionSystem:
     def __init__(self, game_instance):
         self.game = game_instance
+        
+        # Fase estrecha por píxeles (opcional) sobre los candidatos de la rejilla
+        self.pixel_perfect = PIXEL_PERFECT_COLLISIONS
+        
+        # Rejilla espacial de enemigos (fase amplia), reconstruida en cada tick. Contra el
+        # jugador, un solo objetivo, basta filtrar con collidelistall sin rejilla
+        self.enemy_grid = SpatialHash()
     
     def check_all_collisions(self):
         """Verificar todas las colisiones del juego"""
@@ -19,51 +39,297 @@ class CollisionSystem:
     
     def check_player_bullets_vs_enemies(self):
         """Verificar colisiones entre balas del jugador y enemigos"""
-        for bullet in self.game.player.bullets[:]:
-            for enemy in self.game.enemies[:]:
-                if bullet.rect.colliderect(enemy.rect):
-                    self.game.player.bullets.remove(bullet)
-                    self._handle_enemy_hit(enemy)
+        bullets = self.game.projectiles.get_bucket(PLAYER_BULLET)
+        enemies = self.game.enemies
+        if not bullets or not enemies:
+            return
+        
+        if len(bullets) * len(enemies) <= COLLISION_DIRECT_PAIRS:
+            self._direct_bullets_vs_enemies(bullets)
+            return
+        
+        candidates, bounds = self._enemy_bounds()
+        self.enemy_grid.rebuild(candidates, list(map(pygame.Rect, bounds.tolist())))
+        
+        # Del último al primero, como al recorrer la reserva: liberar solo mueve balas ya vistas
+        active = bullets.active
+        for index, rect in reversed(self._swept_rects(bullets)):
+            bullet = active[index]
+            target = None
+            for enemy in self.enemy_grid.query(rect):
+                # Los enemigos destruidos en este tick quedan marcados hasta la compactación
+                if enemy.alive and self._projectile_hits(bullet, enemy):
+                    target = enemy
+                    break
+            
+            if target is not None:
+                bullets.release(bullet)
+                self._handle_enemy_hit(target)
+    
+    def _direct_bullets_vs_enemies(self, bullets):
+        """
+        Misma resolución que la rejilla (enemigos en orden de _enemy_bounds) probando todos
+        los pares: con pocas entidades reconstruir la rejilla cuesta más que el filtro.
+        """
+        candidates, bounds = self._enemy_rects(margin=1)
+        if not bounds:
+            return
+        
+        # Solo las balas cuyo barrido cruza la franja vertical que ocupan los enemigos
+        active = bullets.active
+        rects = self._swept_rects(bullets, min(rect.top for rect in bounds), max(rect.bottom for rect in bounds))
+        for index, rect in reversed(rects):
+            bullet = active[index]
+            # collidelistall recorre los rectángulos en C y devuelve los índices en orden
+            target = None
+            for hit in rect.collidelistall(bounds):
+                enemy = candidates[hit]
+                if enemy.alive and self._projectile_hits(bullet, enemy):
+                    target = enemy
                     break
+            
+            if target is not None:
+                bullets.release(bullet)
+                self._handle_enemy_hit(target)
     
     def check_enemy_projectiles_vs_player(self):
-        """Verificar colisiones entre proyectiles enemigos y el jugador"""
+        """
+        Verificar colisiones entre proyectiles enemigos y el jugador.
+        Como antes de reunir los proyectiles en el gestor, cada tirador aplica a lo
+        sumo un impacto por tipo de proyectil y tick; los demás siguen en vuelo.
+        """
         if self.game.player.shield:
             return
         
-        for enemy in self.game.enemies:
-            # Verificar balas de enemigos regulares
-            if hasattr(enemy, 'bullets'):
-                for bullet in enemy.bullets[:]:
-                    if bullet.rect.colliderect(self.game.player.rect):
-                        enemy.bullets.remove(bullet)
-                        damage = self._get_enemy_damage(enemy)
-                        self._damage_player(damage)
-                        break
-            
-            # Verificar misiles del jefe
-            if hasattr(enemy, 'missiles'):
-                for missile in enemy.missiles[:]:
-                    if missile.rect.colliderect(self.game.player.rect):
-                        enemy.missiles.remove(missile)
-                        self._damage_player(20)  # Daño del misil
-                        break
+        # Solo los proyectiles cuyo barrido cruza la franja vertical del jugador
+        player = self.game.player
+        player_rect = self._bounds(player).inflate(2, 2)
+        projectiles = self.game.projectiles
+        entries = []
+        rects = []
+        for kind in (ENEMY_BULLET, HOMING_MISSILE):
+            bucket = projectiles.get_bucket(kind)
+            active = bucket.active
+            for index, rect in self._swept_rects(bucket, player_rect.top, player_rect.bottom):
+                entries.append((kind, active[index]))
+                rects.append(rect)
+        if not entries:
+            return
+        
+        hit_sources = set()
+        for index in player_rect.collidelistall(rects):
+            kind, projectile = entries[index]
+            source = (kind, projectile.owner)
+            if source not in hit_sources and self._projectile_hits(projectile, player):
+                hit_sources.add(source)
+                projectiles.get_bucket(kind).release(projectile)
+                self._damage_player(projectiles.damage[kind])
     
     def check_powerups_vs_player(self):
         """Verificar colisiones entre power-ups y el jugador"""
-        for power_up in self.game.power_ups[:]:
-            if power_up.rect.colliderect(self.game.player.rect):
-                self.game.power_ups.remove(power_up)
-                self._apply_powerup_effect(power_up)
+        power_ups = self.game.power_ups
+        if not power_ups:
+            return
+        
+        player = self.game.player
+        candidates = list(power_ups)
+        bounds = [self._bounds(power_up) for power_up in candidates]
+        collected = [candidates[index] for index in self._bounds(player).inflate(2, 2).collidelistall(bounds)
+                     if self._overlaps(candidates[index], player)]
+        if not collected:
+            return
+        
+        for power_up in collected:
+            self.game.remove_power_up(power_up)
+            self._apply_powerup_effect(power_up)
+    
+    def _bounds(self, entity):
+        """Rectángulo usado en la fase amplia (área visible si la fase estrecha está activa)"""
+        return entity.get_hitbox() if self.pixel_perfect else entity.rect
+    
+    def _enemy_bounds(self, margin=0):
+        """
+        Enemigos vivos y sus límites de fase amplia (agrandados `margin` por lado) en un
+        arreglo de filas x, y, ancho, alto, en el orden en que se resuelven los impactos.
+        Con el almacén y sin fase estrecha, los drones y Markov salen de sus columnas en
+        una pasada (orden de slot) y el jefe va al final.
+        """
+        enemies = self.game.enemies
+        store = self.game.entity_store
+        if store is None or self.pixel_perfect:
+            candidates = list(enemies)
+            others = candidates
+            bounds = np.empty((0, 4), dtype=np.int64)
+        else:
+            candidates, bounds = store.bounds(KIND_DRONE, KIND_MARKOV, margin=margin)
+            others = list(enemies.get_bucket(ENEMY_BOSS))
+            candidates += others
+        if others:
+            rows = [tuple(self._bounds(enemy).inflate(2 * margin, 2 * margin)) for enemy in others]
+            bounds = np.concatenate((bounds, np.array(rows, dtype=np.int64)))
+        return candidates, bounds
+    
+    def _enemy_rects(self, margin=0):
+        """
+        Como _enemy_bounds, pero con pygame.Rect leídos de las columnas como listas: para
+        los pocos enemigos de la prueba directa es más barato que las operaciones NumPy.
+        """
+        store = self.game.entity_store
+        if store is None or self.pixel_perfect:
+            candidates = list(self.game.enemies)
+            return candidates, [self._bounds(enemy).inflate(2 * margin, 2 * margin) for enemy in candidates]
+        
+        slots = store.slots_of(KIND_DRONE, KIND_MARKOV)
+        columns = store.columns
+        candidates = [store.entities[slot] for slot in slots.tolist()]
+        # int() trunca igual que Entity.rect
+        rects = [pygame.Rect(int(x) - margin, int(y) - margin, int(width) + 2 * margin, int(height) + 2 * margin)
+                 for x, y, width, height in zip(columns["x"][slots].tolist(), columns["y"][slots].tolist(),
+                                                columns["width"][slots].tolist(), columns["height"][slots].tolist())]
+        for boss in self.game.enemies.get_bucket(ENEMY_BOSS):
+            candidates.append(boss)
+            rects.append(self._bounds(boss).inflate(2 * margin, 2 * margin))
+        return candidates, rects
+    
+    def _swept_rects(self, pool, top=None, bottom=None):
+        """
+        Rectángulos de _swept_bounds como pygame.Rect, en pares (índice en `active`,
+        rectángulo). Con `top` y `bottom` solo salen los que entran en esa franja vertical:
+        los demás no pueden tocar nada de lo que hay en ella.
+        Con pocos proyectiles se calculan sobre las columnas leídas como listas: el coste
+        fijo de cada operación NumPy pesa más que el bucle.
+        """
+        active = pool.active
+        count = len(active)
+        if count > COLLISION_SWEPT_LIST_MAX:
+            bounds = self._swept_bounds(pool)
+            if top is None:
+                return list(enumerate(map(pygame.Rect, bounds.tolist())))
+            indices = ((bounds[:, 1] < bottom) & (bounds[:, 1] + bounds[:, 3] > top)).nonzero()[0]
+            return list(zip(indices.tolist(), map(pygame.Rect, bounds[indices].tolist())))
+        if not count:
+            return []
+        
+        width = active[0].width
+        height = active[0].height
+        columns = pool.columns
+        rects = []
+        for index, (x, y, prev_x, prev_y) in enumerate(zip(columns["x"][:count].tolist(), columns["y"][:count].tolist(),
+                                                           columns["prev_x"][:count].tolist(),
+                                                           columns["prev_y"][:count].tolist())):
+            # round() redondea al par, como np.round
+            back_y = round(prev_y - y)
+            rect_top = int(y) + min(back_y, 0)
+            rect_height = abs(back_y) + height
+            if top is not None and not (rect_top < bottom and rect_top + rect_height > top):
+                continue
+            back_x = round(prev_x - x)
+            rects.append((index, pygame.Rect(int(x) + min(back_x, 0), rect_top, abs(back_x) + width, rect_height)))
+        return rects
+    
+    def _swept_bounds(self, pool):
+        """
+        Rectángulos que cubren el desplazamiento completo de cada proyectil en vuelo de
+        una reserva en este tick (filas x, y, ancho, alto alineadas con `active`),
+        calculados sobre sus columnas. El área visible de un proyectil es su rectángulo,
+        así que no depende de la fase estrecha.
+        """
+        active = pool.active
+        x = pool.column("x")
+        y = pool.column("y")
+        # Mismo redondeo que Rect: posición truncada y desplazamiento redondeado al par
+        left = np.trunc(x)
+        top = np.trunc(y)
+        back_x = np.round(pool.column("prev_x") - x)
+        back_y = np.round(pool.column("prev_y") - y)
+        bounds = np.empty((len(active), 4), dtype=np.int64)
+        bounds[:, 0] = left + np.minimum(back_x, 0.0)
+        bounds[:, 1] = top + np.minimum(back_y, 0.0)
+        bounds[:, 2] = np.abs(back_x) + active[0].width
+        bounds[:, 3] = np.abs(back_y) + active[0].height
+        return bounds
+    
+    def _overlaps(self, a, b):
+        """Prueba de colisión entre dos candidatos: rectángulos y, opcionalmente, máscaras"""
+        if not self.pixel_perfect:
+            return a.rect.colliderect(b.rect)
+        
+        rect_a = a.get_hitbox()
+        rect_b = b.get_hitbox()
+        if not rect_a.colliderect(rect_b):
+            return False
+        
+        mask_a = a.get_mask()
+        if mask_a is None:
+            mask_a = get_solid_mask(rect_a.size)
+        mask_b = b.get_mask()
+        if mask_b is None:
+            mask_b = get_solid_mask(rect_b.size)
+        offset = (rect_b.x - rect_a.x, rect_b.y - rect_a.y)
+        return mask_a.overlap(mask_b, offset) is not None
+    
+    def _projectile_hits(self, projectile, target):
+        """
+        Colisión continua (swept AABB) entre un proyectil y un objetivo.
+        Evita que un proyectil rápido atraviese hitboxes delgadas entre dos ticks.
+        """
+        if self._overlaps(projectile, target):
+            return True
+        
+        dx = projectile.x - projectile.prev_x
+        dy = projectile.y - projectile.prev_y
+        if not dx and not dy:
+            return False
+        
+        # Minkowski: la esquina del proyectil recorre un segmento contra el objetivo expandido
+        rect = self._bounds(projectile)
+        target_rect = self._bounds(target)
+        x1 = rect.x
+        y1 = rect.y
+        x0 = x1 - dx
+        y0 = y1 - dy
+        t = segment_rect_intersection(x0, y0, x1, y1,
+                                      target_rect.left - rect.width, target_rect.top - rect.height,
+                                      target_rect.right, target_rect.bottom)
+        if t is None:
+            return False
+        if not self.pixel_perfect:
+            return True
+        
+        # Sub-pasos solo para este par: muestrear las máscaras a lo largo del tramo restante
+        projectile_mask = projectile.get_mask()
+        if projectile_mask is None:
+            projectile_mask = get_solid_mask(rect.size)
+        target_mask = target.get_mask()
+        if target_mask is None:
+            target_mask = get_solid_mask(target_rect.size)
+        
+        step = max(1, min(rect.width, rect.height))
+        steps = int(max(abs(dx), abs(dy)) * (1.0 - t) / step) + 1
+        for i in range(steps + 1):
+            fraction = t + (1.0 - t) * i / steps
+            offset = (int(x0 + dx * fraction) - target_rect.x, int(y0 + dy * fraction) - target_rect.y)
+            if target_mask.overlap(projectile_mask, offset) is not None:
+                return True
+        return False
+    
+    def _drop_powerup(self, x, y):
+        """Generar un power-up por Monte Carlo en la posición indicada"""
+        power_type = self.game.monte_carlo_powerup()
+        if power_type and self.game.budget.allow(BUDGET_POWER_UPS):
+            self.game.add_power_up(PowerUp(x, y, power_type))
     
     def _handle_enemy_hit(self, enemy):
-        """Manejar cuando un enemigo es golpeado - MODIFICADO para delay de victoria"""
-        from entities.enemies import BossFinalAgent
+        """
+        Manejar cuando un enemigo es golpeado - MODIFICADO para delay de victoria
         
-        if isinstance(enemy, BossFinalAgent):
+        Returns:
+            bool: True si el enemigo fue eliminado
+        """
+        if enemy.bucket == ENEMY_BOSS:
             enemy.health -= 5
             if enemy.health <= 0:
-                self.game.enemies.remove(enemy)
+                self.game.remove_enemy(enemy)
                 self.game.score += 1000
                 self.game.victory = True
                 
@@ -80,26 +346,25 @@ class CollisionSystem:
                 if self.game.all_fragments_collected:
                     self.game.narrative_system.add_story_fragment("final_revelation", 
                         "XARN FINAL: 'Comprenden ahora... Yo soy el futuro inevitable. Volveré.'")
+                return True
+            return False
+        elif enemy.summoned:
+            # Drones del jefe: sin puntos ni fragmentos, pero siempre pueden soltar power-up
+            self.game.remove_enemy(enemy)
+            self._drop_powerup(enemy.x, enemy.y)
+            return True
         else:
-            self.game.enemies.remove(enemy)
+            self.game.remove_enemy(enemy)
             self.game.score += 100
             
             # Chance de generar power-up
-            if random.random() < 0.3:
-                power_type = self.game.monte_carlo_powerup()
-                if power_type:
-                    from entities.powerups import PowerUp
-                    power_up = PowerUp(enemy.x, enemy.y, power_type)
-                    self.game.power_ups.append(power_up)
+            if LOOT_RNG.random() < 0.3:
+                self._drop_powerup(enemy.x, enemy.y)
             
             # Chance de obtener fragmento de historia
-            if random.random() < 0.1:
+            if NARRATIVE_RNG.random() < 0.1:
                 self.game.unlock_story_fragment()
-    
-    def _get_enemy_damage(self, enemy):
-        """Obtener el daño que causa un enemigo"""
-        from entities.enemies import MarkovEnemy
-        return 10 if isinstance(enemy, MarkovEnemy) else 15
+            return True
     
     def _damage_player(self, damage):
         """Aplicar daño al jugador - MODIFICADO para delay de game over"""
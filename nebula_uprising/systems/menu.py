@@ -2,10 +2,12 @@
 Sistema de Menú Principal - Nebula Uprising
 """
 
-import random
 import pygame
 from config.colors import *
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.rng_registry import RNG, STREAM_FX
+
+FX_RNG = RNG.stream(STREAM_FX)
 
 class MenuScreen:
     def __init__(self, screen):
@@ -25,8 +27,8 @@ class MenuScreen:
         
         # Animación
         self.animation_timer = 0
-        self.star_positions = [(random.randint(0, SCREEN_WIDTH), 
-                               random.randint(0, SCREEN_HEIGHT)) 
+        self.star_positions = [(FX_RNG.randint(0, SCREEN_WIDTH), 
+                               FX_RNG.randint(0, SCREEN_HEIGHT)) 
                               for _ in range(100)]
     
     def handle_events(self, events):
@@ -55,7 +57,7 @@ class MenuScreen:
             y += 1
             if y > SCREEN_HEIGHT:
                 y = 0
-                x = random.randint(0, SCREEN_WIDTH)
+                x = FX_RNG.randint(0, SCREEN_WIDTH)
             self.star_positions[i] = (x, y)
     
     def draw(self):
@@ -65,7 +67,7 @@ class MenuScreen:
         
         # Estrellas animadas
         for x, y in self.star_positions:
-            size = random.choice([1, 2])
+            size = FX_RNG.choice([1, 2])
             pygame.draw.circle(self.screen, WHITE, (int(x), int(y)), size)
         
         # Título con efecto de brillo
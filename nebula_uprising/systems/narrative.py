@@ -8,9 +8,15 @@ import math
 from collections import deque
 import os
 from config.colors import BLACK, CYAN, WHITE, GREEN, RED, PURPLE, YELLOW
+from entities.base import load_image
+
+# Imágenes de Echo ya escaladas (se cargan una vez por proceso)
+_ECHO_IMAGES = {}
 
 class NarrativeSystem:
-    def __init__(self):
+    def __init__(self, timers):
+        self.timers = timers  # Rueda de temporizadores de la simulación
+        self._message_timer = None
         self.story_fragments = {
             "kairon_history": [],
             "project_lyra": [],
@@ -79,17 +85,23 @@ class NarrativeSystem:
         
     def load_echo_images(self):
         """Cargar imágenes de Echo y cuadros de diálogo"""
+        if _ECHO_IMAGES:
+            self.echo_normal = _ECHO_IMAGES["normal"]
+            self.echo_problem = _ECHO_IMAGES["problem"]
+            self.dialog_box = _ECHO_IMAGES["dialog"]
+            return
+        
         ui_path = os.path.join("nebula_uprising", "assets", "UI")
         
         try:
             # Cargar imagen de Echo normal
-            self.echo_normal = pygame.image.load(os.path.join(ui_path, "Echo.png")).convert_alpha()
+            self.echo_normal = load_image(os.path.join(ui_path, "Echo.png"))
             
             # Cargar imagen de Echo problema (solo para alertas)
-            self.echo_problem = pygame.image.load(os.path.join(ui_path, "EchoProblema.png")).convert_alpha()
+            self.echo_problem = load_image(os.path.join(ui_path, "EchoProblema.png"))
             
             # Cargar cuadro de diálogo
-            self.dialog_box = pygame.image.load(os.path.join(ui_path, "Aviso2Echo.png")).convert_alpha()
+            self.dialog_box = load_image(os.path.join(ui_path, "Aviso2Echo.png"))
             
             # Escalar imágenes de Echo - MUY PEQUEÑO
             echo_scale = 0.08  # Mucho más pequeño
@@ -104,6 +116,7 @@ class NarrativeSystem:
             new_dialog_width = int(self.dialog_box.get_width() * dialog_scale)
             new_dialog_height = int(self.dialog_box.get_height() * dialog_scale)
             self.dialog_box = pygame.transform.scale(self.dialog_box, (new_dialog_width, new_dialog_height))
+            _ECHO_IMAGES.update(normal=self.echo_normal, problem=self.echo_problem, dialog=self.dialog_box)
             
             print(f"Echo images loaded successfully. Echo size: {new_echo_width}x{new_echo_height}")
             
@@ -195,18 +208,29 @@ class NarrativeSystem:
         # Actualizar posiciones dinámicamente
         self.update_positions()
         
-        if self.current_message:
-            self.message_timer -= 1
-            if self.message_timer <= 0:
-                self.current_message = None
-                self.current_message_type = "normal"
-        elif self.messages_queue:
+        # El mensaje actual lo retira su temporizador (_end_message)
+        if not self.current_message and self.messages_queue:
             message_data = self.messages_queue.popleft()
             self.current_message = message_data[0]
             self.current_message_type = message_data[1]
             self.message_timer = self.message_duration
             self.text_scroll_offset = 0
     
+    @property
+    def message_timer(self):
+        """Ticks que le quedan al mensaje actual"""
+        return self.timers.remaining(self._message_timer)
+    
+    @message_timer.setter
+    def message_timer(self, ticks):
+        self.timers.cancel(self._message_timer)
+        self._message_timer = self.timers.schedule(ticks, self._end_message) if ticks > 0 else None
+    
+    def _end_message(self):
+        """Retirar el mensaje actual al vencer su tiempo"""
+        self.current_message = None
+        self.current_message_type = "normal"
+    
     def update_positions(self):
         """Actualizar posiciones basadas en el tamaño actual de la pantalla"""
         screen = pygame.display.get_surface()
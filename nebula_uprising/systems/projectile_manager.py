@@ -0,0 +1,115 @@
+"""
+Gestor de Proyectiles - Nebula Uprising
+Almacena todos los proyectiles del juego en reservas contiguas por tipo
+"""
+
+import numpy as np
+from config.settings import *
+from entities.pool import ProjectilePool
+from entities.projectiles import Bullet, HomingMissile, PLAYER_BULLET, ENEMY_BULLET, HOMING_MISSILE
+from systems.budget import POLICY_REJECT, POLICY_EXPIRE
+
+class ProjectileManager:
+    """Gestor global de proyectiles con un contenedor por tipo"""
+
+    def __init__(self, budget=None):
+        self.buckets = {
+            PLAYER_BULLET: ProjectilePool(Bullet, PLAYER_BULLET_POOL_SIZE),
+            ENEMY_BULLET: ProjectilePool(Bullet, ENEMY_BULLET_POOL_SIZE),
+            HOMING_MISSILE: ProjectilePool(HomingMissile, MISSILE_POOL_SIZE)
+        }
+
+        # Daño que causa al jugador cada tipo de proyectil hostil
+        self.damage = {
+            ENEMY_BULLET: 10,
+            HOMING_MISSILE: 20
+        }
+
+        # Escala de slow time de cada tipo hostil: la de su tirador (Markov o jefe)
+        self.slow_time_scales = {
+            ENEMY_BULLET: SLOW_TIME_SCALE,
+            HOMING_MISSILE: SLOW_TIME_BOSS_SCALE
+        }
+
+        # Presupuesto: las balas del jugador se rechazan; las hostiles expiran la más avanzada
+        self.budget = budget
+        if budget is not None:
+            policies = {PLAYER_BULLET: POLICY_REJECT, ENEMY_BULLET: POLICY_EXPIRE, HOMING_MISSILE: POLICY_EXPIRE}
+            for kind, bucket in self.buckets.items():
+                budget.register(kind, bucket.__len__, bucket.capacity, policies[kind])
+
+    def fire(self, kind, *args):
+        """
+        Disparar un proyectil del tipo indicado.
+
+        Returns:
+            El proyectil creado, o None si la reserva de ese tipo está llena
+        """
+        budget = self.budget
+        if budget is not None and not budget.allow(kind):
+            if budget.policy(kind) != POLICY_EXPIRE or not self._expire(kind):
+                return None
+        return self.buckets[kind].acquire(*args)
+
+    def _expire(self, kind):
+        """Retirar el proyectil hostil más cercano a salir de la pantalla"""
+        bucket = self.buckets[kind]
+        if not bucket.active:
+            return False
+        bucket.release(bucket.active[int(np.argmax(bucket.column("y")))])
+        return True
+
+    def get_bucket(self, kind):
+        """Obtener la reserva de un tipo de proyectil"""
+        return self.buckets[kind]
+
+    def update(self, player, clock=None):
+        """
+        Actualizar todos los proyectiles en un recorrido por tipo.
+        Las balas avanzan en una pasada vectorizada sobre las columnas de su reserva;
+        los misiles siguen al jugador uno por uno.
+
+        Con slow time los proyectiles hostiles se mueven en cada tick una fracción de
+        su paso (la escala del reloj para su tipo), como cuando su tirador los
+        actualizaba uno de cada 4 (balas) o de cada 3 ticks (misiles).
+
+        Args:
+            player: Jugador, objetivo de los misiles teledirigidos
+            clock: SimulationClock del que sale el factor de velocidad de los hostiles
+        """
+        bullets = self.buckets[PLAYER_BULLET]
+        if bullets.active:
+            bullets.step_linear()
+            bullets.release_where(bullets.column("y") < 0)
+
+        scales = self.slow_time_scales
+        bullets = self.buckets[ENEMY_BULLET]
+        if bullets.active:
+            bullets.step_linear(clock.scale(scales[ENEMY_BULLET]) if clock is not None else 1.0)
+            bullets.release_where(bullets.column("y") > SCREEN_HEIGHT)
+
+        missiles = self.buckets[HOMING_MISSILE]
+        if missiles.active:
+            factor = clock.scale(scales[HOMING_MISSILE]) if clock is not None else 1.0
+            for missile in missiles:
+                missile.update(player, factor)
+                if missile.y > SCREEN_HEIGHT:
+                    missiles.release(missile)
+
+    def draw(self, screen):
+        """Dibujar todos los proyectiles"""
+        for bucket in self.buckets.values():
+            for projectile in bucket.active:
+                projectile.draw(screen)
+
+    def clear(self):
+        """Liberar todos los proyectiles en vuelo"""
+        for bucket in self.buckets.values():
+            bucket.clear()
+
+    def get_stats(self):
+        """Obtener estadísticas de cada reserva"""
+        return {kind: bucket.get_stats() for kind, bucket in self.buckets.items()}
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
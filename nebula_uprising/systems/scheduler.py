@@ -0,0 +1,143 @@
+"""
+Planificador de Temporizadores - Nebula Uprising
+Rueda de temporizadores jerárquica: los sistemas programan callbacks para un tick
+futuro y cada tick solo se procesan los temporizadores que vencen
+"""
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS   # Ranuras por nivel
+SLOT_MASK = SLOTS - 1
+LEVELS = 4               # Horizonte de 64^4 ticks (~77 horas a 60 FPS)
+
+class Timer:
+    """Temporizador programado en una rueda"""
+
+    __slots__ = ("due", "callback", "args", "active")
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+class TimerWheel:
+    """
+    Rueda jerárquica de 4 niveles x 64 ranuras.
+    Programar y cancelar es O(1); avanzar un tick solo toca la ranura que vence
+    (y, cada 64 ticks, reparte una ranura del nivel superior).
+    """
+
+    def __init__(self):
+        self.now = 0   # Último tick procesado
+        self.wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.overflow = []
+        self.count = 0
+
+    def schedule(self, delay, callback=None, *args):
+        """
+        Programar un callback dentro de `delay` ticks (mínimo 1).
+        Sin callback el temporizador sirve solo como plazo (ver remaining()).
+
+        Returns:
+            Timer: referencia para cancelar o consultar el temporizador
+        """
+        timer = Timer(self.now + max(1, int(delay)), callback, args)
+        self._insert(timer)
+        self.count += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancelar un temporizador (se descarta cuando llega su ranura)"""
+        if timer is not None and timer.active:
+            timer.active = False
+            self.count -= 1
+
+    def remaining(self, timer):
+        """Ticks que faltan para que venza un temporizador (0 si ya venció o no existe)"""
+        if timer is None or not timer.active:
+            return 0
+        return timer.due - self.now
+
+    def _insert(self, timer):
+        """Ubicar un temporizador en el nivel según su distancia al próximo tick"""
+        due = timer.due
+        delta = due - (self.now + 1)
+        for level in range(LEVELS):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                self.wheels[level][(due >> (SLOT_BITS * level)) & SLOT_MASK].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def _cascade(self, level, index):
+        """Repartir una ranura de un nivel superior hacia los niveles inferiores"""
+        slot = self.wheels[level][index]
+        self.wheels[level][index] = []
+        for timer in slot:
+            if timer.active:
+                self._insert(timer)
+
+    def advance(self):
+        """Avanzar un tick y ejecutar los callbacks de los temporizadores que vencen"""
+        tick = self.now + 1
+
+        # Al completar una vuelta de un nivel se reparte la ranura correspondiente del siguiente
+        level = 1
+        while level < LEVELS and (tick >> (SLOT_BITS * (level - 1))) & SLOT_MASK == 0:
+            self._cascade(level, (tick >> (SLOT_BITS * level)) & SLOT_MASK)
+            level += 1
+        if level == LEVELS and tick & ((1 << (SLOT_BITS * LEVELS)) - 1) == 0:
+            overflow = self.overflow
+            self.overflow = []
+            for timer in overflow:
+                if timer.active:
+                    self._insert(timer)
+
+        self.now = tick
+        index = tick & SLOT_MASK
+        expired = self.wheels[0][index]
+        if not expired:
+            return
+        self.wheels[0][index] = []
+
+        for timer in expired:
+            if not timer.active:
+                continue
+            timer.active = False
+            self.count -= 1
+            if timer.callback is not None:
+                timer.callback(*timer.args)
+
+    def pending(self):
+        """Temporizadores activos ordenados por vencimiento (para depuración)"""
+        timers = [timer for wheel in self.wheels for slot in wheel for timer in slot if timer.active]
+        timers.extend(timer for timer in self.overflow if timer.active)
+        timers.sort(key=lambda timer: timer.due)
+        return [(timer.due, getattr(timer.callback, "__qualname__", None)) for timer in timers]
+
+    def __len__(self):
+        return self.count
+
+class Scheduler:
+    """
+    Planificador central: una rueda por dominio de tiempo.
+    Cada dominio avanza al ritmo del sistema al que pertenece (ticks de pantalla,
+    ticks de simulación o pasos de un tipo de enemigo con tiempo lento).
+    """
+
+    def __init__(self):
+        self.wheels = {}
+
+    def wheel(self, domain):
+        """Obtener (o crear) la rueda de un dominio"""
+        wheel = self.wheels.get(domain)
+        if wheel is None:
+            wheel = TimerWheel()
+            self.wheels[domain] = wheel
+        return wheel
+
+    def pending(self):
+        """Temporizadores pendientes de todos los dominios (para depuración)"""
+        return {domain: wheel.pending() for domain, wheel in self.wheels.items()}
+
+    def __len__(self):
+        return sum(len(wheel) for wheel in self.wheels.values())
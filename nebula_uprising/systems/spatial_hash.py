@@ -0,0 +1,149 @@
+"""
+Rejilla Espacial - Nebula Uprising
+Fase amplia (broadphase) de colisiones mediante un hash espacial uniforme
+"""
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_CELL_SIZE, COLLISION_CELL_FACTOR
+
+class SpatialHash:
+    """
+    Rejilla uniforme del tamaño del área de juego para filtrar candidatos de colisión.
+    Las celdas se conservan entre ticks (solo se vacían las usadas) y su tamaño se
+    ajusta al de las entidades, de modo que cada una ocupa pocas celdas.
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, cell_size=COLLISION_CELL_SIZE):
+        self.width = width
+        self.height = height
+        self.cell_size = None
+        self.cells = []
+        self.used_cells = []
+        self.order = {}  # id(objeto) -> orden de inserción, para fusionar varias celdas
+        self.count = 0
+        self.resize(cell_size)
+
+    def resize(self, cell_size):
+        """Cambiar el tamaño de celda (vacía la rejilla; sin efecto si no cambia)"""
+        cell_size = max(1, int(cell_size))
+        if cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        self.cols = max(1, -(-self.width // cell_size))
+        self.rows = max(1, -(-self.height // cell_size))
+
+        # Celdas en un arreglo plano (fila * columnas + columna)
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.used_cells = []
+        self.order.clear()
+        self.count = 0
+
+    def fit(self, extent):
+        """
+        Ajustar la celda a la extensión típica de las entidades: la potencia de 2 más
+        cercana por encima de COLLISION_CELL_FACTOR × extensión. Al redondear a potencias
+        de 2 la rejilla solo se rehace cuando el tamaño de las entidades cambia de verdad.
+        """
+        target = max(1.0, extent * COLLISION_CELL_FACTOR)
+        size = 1
+        while size < target:
+            size *= 2
+        self.resize(size)
+
+    def clear(self):
+        """Vaciar solo las celdas ocupadas en el tick anterior"""
+        cells = self.cells
+        for index in self.used_cells:
+            cells[index].clear()
+        self.used_cells.clear()
+        self.order.clear()
+        self.count = 0
+
+    def _span(self, rect):
+        """Rango de celdas que cubre un rectángulo (las entidades fuera de pantalla caen en el borde)"""
+        size = self.cell_size
+        col0 = rect.left // size
+        col1 = (rect.right - 1) // size
+        row0 = rect.top // size
+        row1 = (rect.bottom - 1) // size
+        if 0 <= col0 <= col1 < self.cols and 0 <= row0 <= row1 < self.rows:
+            return col0, col1, row0, row1
+
+        # Rectángulo fuera de la rejilla o vacío: recortar al borde
+        last_col = self.cols - 1
+        last_row = self.rows - 1
+        col0 = min(max(col0, 0), last_col)
+        col1 = min(max(col1, col0), last_col)
+        row0 = min(max(row0, 0), last_row)
+        row1 = min(max(row1, row0), last_row)
+        return col0, col1, row0, row1
+
+    def insert(self, obj, rect=None):
+        """Registrar un objeto en todas las celdas que toca su rectángulo"""
+        if rect is None:
+            rect = obj.rect
+        self.order[id(obj)] = self.count
+        self.count += 1
+
+        col0, col1, row0, row1 = self._span(rect)
+        cells = self.cells
+        used = self.used_cells
+        for row in range(row0, row1 + 1):
+            base = row * self.cols
+            for index in range(base + col0, base + col1 + 1):
+                cell = cells[index]
+                if not cell:
+                    used.append(index)
+                cell.append(obj)
+
+    def rebuild(self, objects, rects=None):
+        """
+        Reconstruir la rejilla completa con una colección de objetos (y, opcionalmente,
+        sus rectángulos). Antes de insertar, la celda se ajusta a su extensión media.
+        """
+        if rects is None:
+            rects = [obj.rect for obj in objects]
+        self.clear()
+        if rects:
+            self.fit(sum(max(rect.width, rect.height) for rect in rects) / len(rects))
+        insert = self.insert
+        for obj, rect in zip(objects, rects):
+            insert(obj, rect)
+
+    def query(self, rect):
+        """
+        Obtener los candidatos que comparten celda con el rectángulo.
+        Se devuelven en orden de inserción para conservar el orden de resolución.
+        Si solo hay una celda con candidatos se devuelve esa misma lista, sin copiarla:
+        el resultado es de solo lectura y vale hasta la siguiente reconstrucción.
+        """
+        col0, col1, row0, row1 = self._span(rect)
+        cells = self.cells
+
+        # Caso común: el rectángulo cabe en una sola celda
+        if col0 == col1 and row0 == row1:
+            return cells[row0 * self.cols + col0]
+
+        found = None
+        merged = None
+        for row in range(row0, row1 + 1):
+            base = row * self.cols
+            for index in range(base + col0, base + col1 + 1):
+                cell = cells[index]
+                if not cell:
+                    continue
+                if found is None:
+                    found = cell
+                elif merged is None:
+                    merged = found + cell
+                else:
+                    merged += cell
+        if merged is None:
+            return found if found is not None else ()
+
+        # Varias celdas: quitar duplicados y restaurar el orden de inserción
+        order = self.order
+        unique = {order[id(obj)]: obj for obj in merged}
+        return [unique[index] for index in sorted(unique)]
+
+    def __len__(self):
+        return self.count
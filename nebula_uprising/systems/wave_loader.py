@@ -0,0 +1,222 @@
+"""
+Cargador de Oleadas - Nebula Uprising
+Lee las definiciones de oleadas desde un directorio de archivos JSON/TOML, las valida
+y guarda el resultado compilado en una caché JSON indexada por el hash de los archivos
+"""
+
+import hashlib
+import json
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: solo JSON
+    tomllib = None
+
+CACHE_VERSION = 2
+ENEMY_TYPES = ("drone", "markov", "boss")
+WAVE_EXTENSIONS = (".json", ".toml")
+
+def compile_schedule(wave):
+    """
+    Compilar una oleada en su calendario de apariciones.
+    Cada `spawn_rate` ticks de spawn aparece un enemigo de cada tipo que aún tenga
+    cupo; las oleadas de jefe (spawn_rate < 0) lo generan en el tick 0.
+
+    Returns:
+        list: eventos (tick, orden, tipo) ya ordenados
+    """
+    rate = wave["spawn_rate"]
+    counts = [(enemy_type, count) for enemy_type, count in wave["enemies"] if count > 0]
+    schedule = []
+    rounds = max((count for _, count in counts), default=0)
+    for round_index in range(rounds):
+        tick = round_index * rate + rate if rate > 0 else 0
+        for enemy_type, count in counts:
+            if round_index < count:
+                schedule.append((tick, len(schedule), enemy_type))
+    return schedule
+
+def validate_wave(data, source):
+    """
+    Validar y normalizar la definición de una oleada.
+
+    Raises:
+        ValueError: si falta un campo o tiene un tipo o valor inválido
+    """
+    def fail(message):
+        raise ValueError(f"Oleada inválida en {source}: {message}")
+
+    if not isinstance(data, dict):
+        fail("se esperaba un objeto")
+    unknown = set(data) - {"name", "enemies", "spawn_rate", "duration", "narrative"}
+    if unknown:
+        fail(f"campos desconocidos {sorted(unknown)}")
+
+    name = data.get("name")
+    if not isinstance(name, str) or not name:
+        fail("'name' debe ser un texto no vacío")
+
+    spawn_rate = data.get("spawn_rate")
+    if isinstance(spawn_rate, bool) or not isinstance(spawn_rate, (int, float)):
+        fail("'spawn_rate' debe ser numérico")
+    if spawn_rate <= 0 and spawn_rate != -1:
+        fail("'spawn_rate' debe ser positivo (o -1 para el jefe)")
+
+    duration = data.get("duration", -1)
+    if isinstance(duration, bool) or not isinstance(duration, int):
+        fail("'duration' debe ser entero")
+
+    narrative = data.get("narrative")
+    if narrative is not None and not isinstance(narrative, str):
+        fail("'narrative' debe ser texto o null")
+
+    enemies = data.get("enemies")
+    if not isinstance(enemies, list) or not enemies:
+        fail("'enemies' debe ser una lista no vacía")
+    parsed = []
+    for entry in enemies:
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+            fail(f"enemigo {entry!r} debe ser [tipo, cantidad]")
+        enemy_type, count = entry
+        if enemy_type not in ENEMY_TYPES:
+            fail(f"tipo de enemigo desconocido {enemy_type!r}")
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            fail(f"cantidad inválida para {enemy_type!r}")
+        parsed.append((enemy_type, count))
+
+    return {
+        "enemies": parsed,
+        "duration": duration,
+        "spawn_rate": spawn_rate,
+        "narrative": narrative,
+        "name": name
+    }
+
+def _compiler_digest():
+    """
+    Hash del código de este módulo (validación y compilación de calendarios).
+    Forma parte de la clave de la caché: un cambio en el compilador invalida los
+    calendarios guardados aunque los archivos de oleadas no hayan cambiado.
+    """
+    with open(__file__, "rb") as file:
+        return hashlib.sha256(file.read()).digest()
+
+def _wave_files(directory):
+    """Archivos de oleadas del directorio en orden de nombre"""
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith(WAVE_EXTENSIONS))
+
+def _parse_file(path, raw):
+    """Interpretar un archivo: una oleada, o varias bajo la clave 'waves'"""
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError(f"No se puede leer {path}: TOML requiere Python 3.11+")
+        data = tomllib.loads(raw.decode("utf-8"))
+    else:
+        data = json.loads(raw)
+
+    if isinstance(data, dict) and "waves" in data:
+        entries = data["waves"]
+        if not isinstance(entries, list):
+            raise ValueError(f"Oleada inválida en {path}: 'waves' debe ser una lista")
+        return [validate_wave(entry, f"{path}[{index}]") for index, entry in enumerate(entries)]
+    return [validate_wave(data, path)]
+
+def default_cache_dir():
+    """
+    Directorio de cachés del usuario (fuera de los assets que se distribuyen):
+    $XDG_CACHE_HOME/nebula_uprising/waves o ~/.cache/nebula_uprising/waves
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "nebula_uprising", "waves")
+
+def _read_cache(path, key):
+    """
+    Leer una caché de oleadas compilada. Los datos se vuelven a validar: un archivo
+    alterado o de otra versión se trata igual que uno inexistente.
+
+    Raises:
+        ValueError: si el archivo no corresponde a la clave o su contenido es inválido
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if not isinstance(data, dict) or data.get("key") != key or not isinstance(data.get("waves"), list):
+        raise ValueError(f"Caché de oleadas inválida: {path}")
+
+    compiled = []
+    for index, entry in enumerate(data["waves"]):
+        if not isinstance(entry, dict) or not isinstance(entry.get("schedule"), list):
+            raise ValueError(f"Caché de oleadas inválida: {path}[{index}]")
+        wave = validate_wave(entry.get("wave"), f"{path}[{index}]")
+        schedule = []
+        for event in entry["schedule"]:
+            if (not isinstance(event, list) or len(event) != 3 or event[2] not in ENEMY_TYPES
+                    or not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in event[:2])):
+                raise ValueError(f"Evento inválido en la caché {path}[{index}]: {event!r}")
+            schedule.append(tuple(event))
+        compiled.append((wave, schedule))
+    return compiled
+
+def _write_cache(path, key, compiled):
+    """Guardar las oleadas compiladas de forma atómica (archivo temporal + reemplazo)"""
+    data = {
+        "key": key,
+        "waves": [{"wave": wave, "schedule": schedule} for wave, schedule in compiled]
+    }
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+def load_waves(directory, use_cache=True, cache_dir=None):
+    """
+    Cargar las oleadas de un directorio.
+    El resultado (oleadas validadas y su calendario compilado) se guarda como JSON en
+    `cache_dir` (por defecto default_cache_dir(), nunca junto a los assets) con el hash
+    de los archivos como clave, de modo que un directorio sin cambios no se vuelve a
+    leer ni validar. Cualquier error al leer la caché recompila las oleadas.
+
+    Returns:
+        list: pares (oleada, calendario) en orden de archivo
+    """
+    files = _wave_files(directory)
+    contents = []
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    digest.update(_compiler_digest())
+    for path in files:
+        with open(path, "rb") as file:
+            raw = file.read()
+        contents.append((path, raw))
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(raw).digest())
+    key = digest.hexdigest()
+
+    # Un prefijo por directorio de oleadas para no pisar las cachés de otros directorios
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    prefix = "waves-" + hashlib.sha256(os.path.abspath(directory).encode("utf-8")).hexdigest()[:8] + "-"
+    cache_path = os.path.join(cache_dir, f"{prefix}{key[:16]}.json")
+    if use_cache and os.path.exists(cache_path):
+        try:
+            return _read_cache(cache_path, key)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Caché de oleadas descartada, se recompila: {e}")
+
+    compiled = []
+    for path, raw in contents:
+        for wave in _parse_file(path, raw):
+            compiled.append((wave, compile_schedule(wave)))
+
+    if use_cache:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            _write_cache(cache_path, key, compiled)
+            # Descartar cachés de versiones anteriores de los archivos de este directorio
+            for name in os.listdir(cache_dir):
+                stale = os.path.join(cache_dir, name)
+                if name.startswith(prefix) and stale != cache_path:
+                    os.remove(stale)
+        except OSError as e:
+            print(f"No se pudo guardar la caché de oleadas: {e}")
+    return compiled
@@ -3,68 +3,138 @@ Sistema de Oleadas - Nebula Uprising
 Maneja la progresión de oleadas y spawn de enemigos
 """
 
+import heapq
+import json
 from collections import deque
+from config.settings import *
+from systems.wave_loader import load_waves, validate_wave, compile_schedule
+from utils.random_loader import create_prng
+from utils.rng_registry import RNG, STREAM_SPAWN
+
+# Zona de aparición por tipo de enemigo: (x_min, x_max, y_min, y_max)
+SPAWN_RNG = RNG.stream(STREAM_SPAWN)
+
+SPAWN_AREAS = {
+    "drone": (0, SCREEN_WIDTH - DRONE_SIZE, 50, 150),
+    "markov": (0, SCREEN_WIDTH - MARKOV_SIZE, 50, 150),
+    "boss": (SCREEN_WIDTH // 2 - BOSS_WIDTH // 2, SCREEN_WIDTH // 2 - BOSS_WIDTH // 2, 50, 50)
+}
+
+def place_spawns(schedule):
+    """
+    Convertir un calendario compilado en la línea de tiempo de la oleada,
+    sorteando la posición de cada aparición dentro de la zona de su tipo.
+
+    Returns:
+        list: montículo de eventos (tick, orden, tipo, x, y)
+    """
+    timeline = []
+    for tick, order, enemy_type in schedule:
+        x_min, x_max, y_min, y_max = SPAWN_AREAS[enemy_type]
+        timeline.append((tick, order, enemy_type,
+                         SPAWN_RNG.randint(x_min, x_max), SPAWN_RNG.randint(y_min, y_max)))
+    # El calendario ya viene ordenado, así que la lista ya cumple la propiedad de montículo
+    return timeline
+
+def generate_endless_wave(prng, number):
+    """
+    Generar la oleada infinita número `number` (desde 1) con el generador sembrado.
+    El total crece geométricamente hasta ENDLESS_MAX_WAVE_ENEMIES y las apariciones
+    se reparten en ENDLESS_SPAWN_WINDOW ticks (varias por tick si hace falta).
+    """
+    total = min(ENDLESS_MAX_WAVE_ENEMIES, int(ENDLESS_BASE_ENEMIES * ENDLESS_GROWTH ** (number - 1)))
+    markov_share = 0.2 + 0.3 * prng.next()
+    markovs = int(total * markov_share)
+    drones = total - markovs
+    return validate_wave({
+        "enemies": [["drone", drones], ["markov", markovs]],
+        "duration": -1,
+        "spawn_rate": ENDLESS_SPAWN_WINDOW / max(drones, markovs, 1),
+        "narrative": None,
+        "name": f"Oleada Infinita {number}"
+    }, f"modo infinito #{number}")
 
 class WaveQueue:
-    def __init__(self):
+    def __init__(self, waves_dir=WAVES_DIR, endless=False, seed=ENDLESS_SEED):
+        self.waves_dir = waves_dir
+        self.endless = endless
+        self.endless_prng = create_prng(seed, PRNG_BACKEND)
         self.waves = deque()
+        self.schedules = deque()  # Calendario compilado de cada oleada pendiente
         self.current_wave = None
         self.wave_timer = 0
         self.wave_number = 0
         self.narrative_triggered = {}
         
-        # Definir oleadas con contexto narrativo
-        self.define_waves()
+        # Línea de tiempo compilada de la oleada actual
+        self.timeline = []
+        self.spawn_time = 0.0  # Ticks de spawn transcurridos (más lentos con slow time)
+        
+        # Definir oleadas con contexto narrativo (el modo infinito las genera al vuelo)
+        if not self.endless:
+            self.define_waves()
     
     def define_waves(self):
-        """Definir todas las oleadas del juego"""
-        # Oleada 1: Reconocimiento XARN
-        wave1 = {
-            "enemies": [("drone", 50)],
-            "duration": 3600,
-            "spawn_rate": 50,
-            "narrative": "first_wave",
-            "name": "Reconocimiento XARN"
-        }
-
-        # Oleada 2: Drones Adaptativos
-        wave2 = {
-            "enemies": [("drone", 40), ("markov",20 )],
-            "duration": 3600,
-            "spawn_rate": 50,
-            "narrative": "markov_enemy",
-            "name": "Protocolo Adaptativo"
-        }
-        
-        # Oleada 3: Asalto Coordinado
-        wave3 = {
-            "enemies": [("drone", 25), ("markov", 29)],
-            "duration": 3600,
-            "spawn_rate": 30,
-            "narrative": None,
-            "name": "Asalto Coordinado"
-        }
-        
-        # Oleada 4: Núcleo XARN
-        wave4 = {
-            "enemies": [("boss", 1)],
-            "duration": -1,
-            "spawn_rate": -1,
-            "narrative": "boss_spawn",
-            "name": "NÚCLEO XARN DETECTADO"
-        }
-        
-        self.waves.extend([wave1, wave2, wave3, wave4])
+        """Cargar todas las oleadas del juego desde el directorio de datos"""
+        for wave, schedule in load_waves(self.waves_dir):
+            self.waves.append(wave)
+            self.schedules.append(schedule)
     
     def get_next_wave(self):
         """Obtener la siguiente oleada"""
+        if not self.waves and self.endless:
+            wave = generate_endless_wave(self.endless_prng, self.wave_number + 1)
+            self.waves.append(wave)
+            self.schedules.append(compile_schedule(wave))
         if self.waves:
             self.current_wave = self.waves.popleft()
             self.wave_number += 1
             self.wave_timer = 0
+            self.timeline = place_spawns(self.schedules.popleft())
+            self.spawn_time = 0.0
             return True
         return False
     
+    def pop_due_spawns(self, amount=1.0, limit=None):
+        """
+        Avanzar el reloj de spawn y extraer los eventos que vencen.
+
+        Args:
+            amount: Ticks de spawn de este frame (menos de 1 con tiempo lento)
+            limit: Máximo de eventos a extraer; los demás siguen vencidos en la línea de tiempo
+
+        Returns:
+            list: tuplas (tipo, x, y) de los enemigos a generar
+        """
+        self.spawn_time += amount
+        timeline = self.timeline
+        due = []
+        if limit is None:
+            limit = len(timeline)
+        while timeline and timeline[0][0] <= self.spawn_time and len(due) < limit:
+            _, _, enemy_type, x, y = heapq.heappop(timeline)
+            due.append((enemy_type, x, y))
+        return due
+    
+    def all_spawned(self):
+        """Verificar si ya se generaron todos los enemigos de la oleada actual"""
+        return not self.timeline
+    
+    def save_timeline(self, path):
+        """Guardar la línea de tiempo pendiente en un archivo JSON"""
+        events = [[tick, enemy_type, x, y] for tick, _, enemy_type, x, y in sorted(self.timeline)]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"events": events}, file)
+    
+    def load_timeline(self, path):
+        """Reemplazar la línea de tiempo de la oleada actual por una guardada en JSON"""
+        with open(path, encoding="utf-8") as file:
+            events = json.load(file)["events"]
+        self.timeline = [(tick, order, enemy_type, x, y)
+                         for order, (tick, enemy_type, x, y) in enumerate(events)]
+        heapq.heapify(self.timeline)
+        self.spawn_time = 0.0
+    
     def update(self):
         """Actualizar el sistema de oleadas"""
         if self.current_wave and self.current_wave["duration"] > 0:
@@ -94,8 +164,13 @@ class WaveQueue:
     def reset(self):
         """Reiniciar el sistema de oleadas"""
         self.waves.clear()
+        self.schedules.clear()
         self.current_wave = None
         self.wave_timer = 0
         self.wave_number = 0
         self.narrative_triggered.clear()
-        self.define_waves()
\ No newline at end of file
+        self.timeline = []
+        self.spawn_time = 0.0
+        self.endless_prng = create_prng(self.endless_prng.seed, PRNG_BACKEND)
+        if not self.endless:
+            self.define_waves()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Muestreador por método alias (Walker/Vose) para distribuciones discretas
+"""
+
+import numpy as np
+
+class AliasSampler:
+    """
+    Tabla alias construida una sola vez por distribución.
+    Cada muestra cuesta un uniforme y una comparación, sin importar el número de resultados.
+    """
+
+    def __init__(self, outcomes, probabilities, uniform, uniform_block=None):
+        """
+        Construir la tabla alias (método de Vose).
+
+        Args:
+            outcomes: Resultados posibles
+            probabilities: Peso de cada resultado (se normalizan)
+            uniform: Fuente de uniformes en [0,1) (obligatoria), p. ej. PseudoRandom.next o un flujo del registro
+            uniform_block: Fuente opcional de n uniformes en un arreglo para muestras en bloque
+        """
+        if not outcomes or len(outcomes) != len(probabilities):
+            raise ValueError("Se necesita una probabilidad por cada resultado")
+        total = float(sum(probabilities))
+        if total <= 0 or any(p < 0 for p in probabilities):
+            raise ValueError("Las probabilidades deben ser no negativas y sumar más de 0")
+
+        self.outcomes = list(outcomes)
+        self.uniform = uniform
+        self.uniform_block = uniform_block
+
+        size = len(self.outcomes)
+        scaled = [p * size / total for p in probabilities]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Lo que queda en cualquiera de las listas tiene probabilidad 1 por redondeo
+
+        self.size = size
+        self.prob = prob
+        self.alias = alias
+        self._prob_array = np.array(prob)
+        self._alias_array = np.array(alias)
+        self._outcome_array = np.array(self.outcomes, dtype=object)
+
+    def index_of(self, u):
+        """Índice del resultado para un uniforme dado (columna = parte entera, moneda = fracción)"""
+        scaled = u * self.size
+        column = min(int(scaled), self.size - 1)
+        return column if scaled - column < self.prob[column] else self.alias[column]
+
+    def sample(self):
+        """Una muestra en O(1)"""
+        return self.outcomes[self.index_of(self.uniform())]
+
+    def indices_of(self, uniforms):
+        """Índices de resultado para un arreglo de uniformes (vectorizado)"""
+        scaled = np.asarray(uniforms, dtype=np.float64) * self.size
+        columns = np.minimum(scaled.astype(np.int64), self.size - 1)
+        keep = (scaled - columns) < self._prob_array[columns]
+        return np.where(keep, columns, self._alias_array[columns])
+
+    def sample_many(self, count):
+        """
+        `count` muestras en bloque, consumiendo los mismos uniformes que `count` llamadas a sample().
+
+        Returns:
+            np.ndarray: resultados (dtype object)
+        """
+        if self.uniform_block is not None:
+            uniforms = self.uniform_block(count)
+        else:
+            uniforms = np.fromiter((self.uniform() for _ in range(count)), dtype=np.float64, count=count)
+        return self._outcome_array[self.indices_of(uniforms)]
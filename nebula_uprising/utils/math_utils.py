@@ -4,8 +4,16 @@ Funciones auxiliares para cálculos matemáticos
 """
 
 import math
-import random
+import bisect
 import numpy as np
+from utils.alias_sampler import AliasSampler
+from utils.rng_registry import RNG, STREAM_SPAWN, STREAM_AI, STREAM_LOOT, STREAM_FX
+
+# Flujos del registro de la partida (ninguna función usa el módulo random global)
+SPAWN_RNG = RNG.stream(STREAM_SPAWN)
+AI_RNG = RNG.stream(STREAM_AI)
+LOOT_RNG = RNG.stream(STREAM_LOOT)
+FX_RNG = RNG.stream(STREAM_FX)
 
 def calculate_distance(x1, y1, x2, y2):
     """Calcular la distancia euclidiana entre dos puntos"""
@@ -26,6 +34,31 @@ def point_in_circle(px, py, cx, cy, radius):
     """Verificar si un punto está dentro de un círculo"""
     return calculate_distance(px, py, cx, cy) <= radius
 
+def segment_rect_intersection(x0, y0, x1, y1, left, top, right, bottom):
+    """
+    Intersección de un segmento con un rectángulo alineado a los ejes (método de slabs).
+    Devuelve la fracción t en [0, 1] del primer contacto, o None si no se cruzan.
+    """
+    t_enter = 0.0
+    t_exit = 1.0
+    
+    for start, delta, low, high in ((x0, x1 - x0, left, right), (y0, y1 - y0, top, bottom)):
+        if delta == 0:
+            if start <= low or start >= high:
+                return None
+            continue
+        
+        t0 = (low - start) / delta
+        t1 = (high - start) / delta
+        if t0 > t1:
+            t0, t1 = t1, t0
+        t_enter = max(t_enter, t0)
+        t_exit = min(t_exit, t1)
+        if t_enter >= t_exit:
+            return None
+    
+    return t_enter
+
 def clamp(value, min_value, max_value):
     """Limitar un valor entre un mínimo y máximo"""
     return max(min_value, min(value, max_value))
@@ -34,25 +67,29 @@ def lerp(start, end, t):
     """Interpolación lineal entre dos valores"""
     return start + (end - start) * t
 
-def random_point_in_circle(center_x, center_y, radius):
-    """Generar un punto aleatorio dentro de un círculo"""
-    angle = random.uniform(0, 2 * math.pi)
-    r = random.uniform(0, radius)
+def random_point_in_circle(center_x, center_y, radius, rng=SPAWN_RNG):
+    """Generar un punto aleatorio dentro de un círculo (por defecto con el flujo de apariciones)"""
+    angle = rng.uniform(0, 2 * math.pi)
+    r = rng.uniform(0, radius)
     x = center_x + r * math.cos(angle)
     y = center_y + r * math.sin(angle)
     return x, y
 
+_ALIAS_SAMPLERS = {}
+
 def monte_carlo_choice(probabilities):
-    """Hacer una elección usando Monte Carlo con probabilidades dadas"""
-    rand = random.random()
-    cumulative = 0
-    
-    for choice, prob in probabilities.items():
-        cumulative += prob
-        if rand <= cumulative:
-            return choice if choice != "none" else None
-    
-    return None
+    """
+    Hacer una elección usando Monte Carlo con probabilidades dadas (tabla alias cacheada).
+    Los uniformes salen del flujo de botín del registro, así que la secuencia se
+    reproduce con la semilla de la partida.
+    """
+    key = tuple(probabilities.items())
+    sampler = _ALIAS_SAMPLERS.get(key)
+    if sampler is None:
+        sampler = AliasSampler(list(probabilities), list(probabilities.values()), LOOT_RNG.next, LOOT_RNG.next_block)
+        _ALIAS_SAMPLERS[key] = sampler
+    choice = sampler.sample()
+    return choice if choice != "none" else None
 
 def smooth_step(edge0, edge1, x):
     """Función de suavizado hermite"""
@@ -99,14 +136,21 @@ ENEMY_TRANSITION_MATRIX = np.array([
     [0.1, 0.3, 0.6]   # Desde ATACAR
 ])
 
-def markov_state_transition(current_state_index, transition_matrix):
-    """Realizar transición de estado usando Cadenas de Markov"""
-    probabilities = transition_matrix[current_state_index]
-    return np.random.choice(len(probabilities), p=probabilities)
-
-def gaussian_random(mean=0, std_dev=1):
-    """Generar número aleatorio con distribución gaussiana"""
-    return random.gauss(mean, std_dev)
+def markov_state_transition(current_state_index, transition_matrix, rng=AI_RNG):
+    """
+    Realizar transición de estado usando Cadenas de Markov.
+    Un solo uniforme del flujo (por defecto el de IA) contra la fila acumulada.
+    """
+    cumulative = np.cumsum(transition_matrix[current_state_index])
+    cumulative /= cumulative[-1]
+    index = bisect.bisect_right(cumulative.tolist(), rng.next())
+    return min(index, len(cumulative) - 1)
+
+def gaussian_random(mean=0, std_dev=1, rng=FX_RNG):
+    """Generar número aleatorio con distribución gaussiana (Box-Muller sobre el flujo dado)"""
+    u1 = 1.0 - rng.next()  # En (0, 1]: evita log(0)
+    u2 = rng.next()
+    return mean + std_dev * math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
 
 def exponential_decay(initial_value, decay_rate, time):
     """Calcular decaimiento exponencial"""
@@ -0,0 +1,23 @@
+"""
+Pruebas estadísticas de generadores - Nebula Uprising
+Solo dependen de NumPy: las usan la evaluación del modelo y los benchmarks
+"""
+
+import numpy as np
+
+def uniformity_chi_square(samples, bins=10):
+    """
+    Chi-cuadrado de uniformidad en `bins` intervalos iguales de [0,1).
+    
+    Returns:
+        tuple: (conteos por intervalo, chi-cuadrado)
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    counts = np.bincount(np.minimum((samples * bins).astype(int), bins - 1), minlength=bins)
+    expected = len(samples) / bins
+    return counts.tolist(), float(((counts - expected)**2 / expected).sum())
+
+def serial_correlation(samples, lag=1):
+    """Correlación entre cada valor y el que está `lag` posiciones después."""
+    samples = np.asarray(samples, dtype=np.float64)
+    return float(np.corrcoef(samples[:-lag], samples[lag:])[0, 1])
@@ -1,4 +1,107 @@
-class PseudoRandom:
+from abc import ABC, abstractmethod
+import numpy as np
+
+# Coeficientes de salto por (multiplicador, incremento): A_k = a^k y C_k = c(a^(k-1) + ... + 1), mod 2^32
+_LEAP_TABLES = {}
+_MASK_32 = np.uint64(0xFFFFFFFF)
+
+def _leap_coefficients(multiplier, increment, n):
+    """
+    Coeficientes (A_k, C_k) de X_k = A_k * X_0 + C_k para k = 1..n.
+    Se construyen por duplicación: el paso k+L es el paso k aplicado tras el paso L,
+    así que A_{k+L} = A_k * A_L y C_{k+L} = A_k * C_L + C_k. Se guardan y solo crecen.
+    """
+    key = (multiplier, increment)
+    table = _LEAP_TABLES.get(key)
+    if table is None or len(table[0]) < n:
+        size = max(n, 1024 if table is None else 2 * len(table[0]))
+        # Índice 0 = identidad (A_0 = 1, C_0 = 0)
+        a = np.array([1, multiplier], dtype=np.uint64)
+        c = np.array([0, increment], dtype=np.uint64)
+        while len(a) <= size:
+            step = len(a) - 1
+            a_step, c_step = a[step], c[step]
+            # Los productos de dos valores < 2^32 caben en uint64; la suma también
+            a = np.concatenate((a, (a[1:] * a_step) & _MASK_32))
+            c = np.concatenate((c, (a[1:len(c)] * c_step + c[1:]) & _MASK_32))
+        table = (a[1:size + 1], c[1:size + 1])
+        _LEAP_TABLES[key] = table
+    return table[0][:n], table[1][:n]
+
+def lcg_block(multiplier, increment, state, n):
+    """
+    Los n estados siguientes de un LCG módulo 2^32 a partir de `state`, en un arreglo uint64.
+    Idénticos a n pasos escalares X_{k+1} = (a * X_k + c) mod 2^32.
+    """
+    a, c = _leap_coefficients(multiplier, increment, n)
+    return (a * np.uint64(state) + c) & _MASK_32
+
+def lcg_jump(multiplier, increment, n, modulus=2**32):
+    """
+    Coeficientes (A, C) del salto de n pasos, X_n = A * X_0 + C (mod m), en O(log n).
+    Exponenciación por cuadrados del mapa afín x -> a*x + c.
+    """
+    jump_a, jump_c = 1, 0
+    step_a, step_c = multiplier % modulus, increment % modulus
+    while n > 0:
+        if n & 1:
+            jump_a, jump_c = (step_a * jump_a) % modulus, (step_a * jump_c + step_c) % modulus
+        # Componer el paso consigo mismo: duplica su longitud
+        step_a, step_c = (step_a * step_a) % modulus, (step_a * step_c + step_c) % modulus
+        n >>= 1
+    return jump_a, jump_c
+
+class RandomSource(ABC):
+    """
+    Interfaz común de los generadores del juego: next() en [0,1), next_choice(),
+    next_block(n), advance(n) y split(k). Las subclases implementan al menos next();
+    split() solo existe en los generadores que garantizan subsecuencias disjuntas.
+    """
+
+    @abstractmethod
+    def next(self):
+        """Siguiente número pseudoaleatorio en [0,1)"""
+
+    def next_choice(self, choices):
+        """
+        Elegir un elemento aleatorio de una lista.
+        
+        Args:
+            choices: Lista de opciones para elegir
+            
+        Returns:
+            Elemento elegido de la lista
+        """
+        if not choices:
+            raise ValueError("La lista de opciones no puede estar vacía")
+            
+        rand = self.next()
+        index = int(rand * len(choices)) % len(choices)
+        return choices[index]
+
+    def next_block(self, n):
+        """n valores de next() en un arreglo float64"""
+        return np.fromiter((self.next() for _ in range(n)), dtype=np.float64, count=max(n, 0))
+
+    def advance(self, n):
+        """Saltar n valores de la secuencia"""
+        if n < 0:
+            raise ValueError("El salto debe ser no negativo")
+        for _ in range(n):
+            self.next()
+
+    def split(self, k):
+        """
+        k generadores con subsecuencias disjuntas. Sembrar generadores nuevos con
+        valores de este no garantiza que no se solapen, así que solo lo ofrecen los
+        generadores con salto propio (LCG, PCG64, xorshift).
+
+        Raises:
+            NotImplementedError: si el generador no sabe saltar en su secuencia
+        """
+        raise NotImplementedError(f"{type(self).__name__} no garantiza subsecuencias disjuntas")
+
+class PseudoRandom(RandomSource):
     """
     Generador de números pseudoaleatorios usando el Método Congruencial Lineal (LCG).
     """
@@ -32,19 +135,198 @@ class PseudoRandom:
         # Normalizar al rango [0,1)
         return self.current / self.modulus
 
-    def next_choice(self, choices):
+    def advance(self, n):
         """
-        Elegir un elemento aleatorio de una lista.
-        
-        Args:
-            choices: Lista de opciones para elegir
-            
+        Saltar n pasos de la secuencia en O(log n), como n llamadas a next() sin generarlas.
+        """
+        if n < 0:
+            raise ValueError("El salto debe ser no negativo")
+        jump_a, jump_c = lcg_jump(self.multiplier, self.increment, n, self.modulus)
+        self.current = (jump_a * self.current + jump_c) % self.modulus
+
+    def split(self, k):
+        """
+        Repartir el periodo en k subsecuencias disjuntas de igual longitud.
+        La subsecuencia i empieza i * stride pasos después del estado actual, así que
+        la 0 coincide con este generador: conviene dejar de usarlo tras repartir.
+        El salto es impar: con un salto potencia de 2 las subsecuencias serían la misma
+        secuencia desplazada una constante (a^(2^j) = 1 mod 2^32 para j grande).
+
         Returns:
-            Elemento elegido de la lista
+            list: k generadores PseudoRandom independientes
         """
-        if not choices:
-            raise ValueError("La lista de opciones no puede estar vacía")
-            
-        rand = self.next()
-        index = int(rand * len(choices)) % len(choices)
-        return choices[index]
\ No newline at end of file
+        if k <= 0:
+            raise ValueError("El número de subsecuencias debe ser positivo")
+        stride = (self.modulus // k - 1) | 1
+        streams = []
+        for index in range(k):
+            stream = PseudoRandom(seed=self.current)
+            stream.multiplier, stream.increment, stream.modulus = self.multiplier, self.increment, self.modulus
+            stream.advance(index * stride)
+            streams.append(stream)
+        return streams
+
+    def next_block(self, n):
+        """
+        Generar n números normalizados [0,1) de una vez.
+        Es la misma secuencia que n llamadas a next() y deja el estado en el mismo punto.
+
+        Returns:
+            np.ndarray: n valores float64
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.float64)
+        if self.modulus != 2**32:
+            return super().next_block(n)
+
+        states = lcg_block(self.multiplier, self.increment, self.current, n)
+        self.current = int(states[-1])
+        # Dividir por una potencia de 2 es exacto: mismo valor que current / modulus
+        return states / float(self.modulus)
+
+class PCG64Random(RandomSource):
+    """
+    PCG64 de NumPy detrás de la misma interfaz. Mejor calidad estadística que el LCG;
+    cada valor consume una salida de 64 bits, así que next_block(n) y n llamadas
+    a next() dan la misma secuencia.
+    """
+
+    def __init__(self, seed=12345):
+        self.seed = seed
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+
+    def next(self):
+        return float(self.generator.random())
+
+    def next_block(self, n):
+        return self.generator.random(max(n, 0))
+
+    def advance(self, n):
+        if n < 0:
+            raise ValueError("El salto debe ser no negativo")
+        self.generator.bit_generator.advance(n)
+
+    def split(self, k):
+        """k generadores separados por saltos de ~2^127 valores (jumped)"""
+        if k <= 0:
+            raise ValueError("El número de subsecuencias debe ser positivo")
+        streams = []
+        for index in range(k):
+            stream = PCG64Random(seed=self.seed)
+            stream.generator = np.random.Generator(self.generator.bit_generator.jumped(index))
+            streams.append(stream)
+        return streams
+
+def _gf2_apply(matrix, vector):
+    """Aplicar una matriz 64x64 sobre GF(2), guardada por columnas, a un vector de 64 bits"""
+    result = 0
+    index = 0
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+        vector >>= 1
+        index += 1
+    return result
+
+class XorShiftRandom(RandomSource):
+    """
+    Xorshift64* (Vigna): tres desplazamientos y una multiplicación por valor.
+    El estado (nunca 0) se deriva de la semilla con splitmix64.
+    La transición del estado es lineal sobre GF(2) con periodo 2^64 - 1, así que
+    saltar n pasos es aplicar la matriz T^n (potencias de 2 precalculadas).
+    """
+
+    MULTIPLIER = 0x2545F4914F6CDD1D
+    MASK_64 = 2**64 - 1
+    PERIOD = 2**64 - 1
+
+    # T^(2^i) por columnas, calculadas bajo demanda y compartidas por todas las instancias
+    _jump_powers = []
+
+    def __init__(self, seed=12345):
+        self.seed = seed
+        # splitmix64: semillas parecidas dan estados muy distintos
+        z = (seed + 0x9E3779B97F4A7C15) & self.MASK_64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & self.MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & self.MASK_64
+        self.current = (z ^ (z >> 31)) or 1
+
+    def next(self):
+        x = self.current
+        x ^= x >> 12
+        x ^= (x << 25) & self.MASK_64
+        x ^= x >> 27
+        self.current = x
+        # Los 53 bits altos del producto forman el double en [0,1)
+        return (((x * self.MULTIPLIER) & self.MASK_64) >> 11) / 2**53
+
+    @classmethod
+    def _step(cls, x):
+        """Transición del estado (sin la multiplicación de salida)"""
+        x ^= x >> 12
+        x ^= (x << 25) & cls.MASK_64
+        x ^= x >> 27
+        return x
+
+    @classmethod
+    def _jump_state(cls, state, n):
+        """Estado tras n pasos, en O(log n) productos matriz-vector"""
+        powers = cls._jump_powers
+        if not powers:
+            powers.append([cls._step(1 << bit) for bit in range(64)])
+        n %= cls.PERIOD
+        level = 0
+        while n:
+            if level == len(powers):
+                # T^(2^(i+1)) = T^(2^i) · T^(2^i), columna a columna
+                previous = powers[-1]
+                powers.append([_gf2_apply(previous, column) for column in previous])
+            if n & 1:
+                state = _gf2_apply(powers[level], state)
+            n >>= 1
+            level += 1
+        return state
+
+    def advance(self, n):
+        """Saltar n pasos de la secuencia en O(log n), como n llamadas a next() sin generarlas"""
+        if n < 0:
+            raise ValueError("El salto debe ser no negativo")
+        self.current = self._jump_state(self.current, n)
+
+    def split(self, k):
+        """
+        Repartir el periodo en k subsecuencias disjuntas de igual longitud; la i empieza
+        i * (2^64 - 1) // k pasos después del estado actual (la 0 coincide con este).
+
+        Returns:
+            list: k generadores XorShiftRandom independientes
+        """
+        if k <= 0:
+            raise ValueError("El número de subsecuencias debe ser positivo")
+        stride = self.PERIOD // k
+        streams = []
+        state = self.current
+        for _ in range(k):
+            stream = XorShiftRandom(seed=self.seed)
+            stream.current = state
+            streams.append(stream)
+            state = self._jump_state(state, stride)
+        return streams
+
+# Generadores disponibles por nombre (ver PRNG_BACKEND en config/settings.py)
+PRNG_BACKENDS = {
+    "lcg": PseudoRandom,
+    "pcg64": PCG64Random,
+    "xorshift": XorShiftRandom
+}
+
+def create_prng(seed, backend="lcg"):
+    """
+    Crear un generador del tipo indicado.
+
+    Raises:
+        ValueError: si el nombre no está en PRNG_BACKENDS
+    """
+    if backend not in PRNG_BACKENDS:
+        raise ValueError(f"Generador desconocido {backend!r}; opciones: {sorted(PRNG_BACKENDS)}")
+    return PRNG_BACKENDS[backend](seed=seed)
@@ -0,0 +1,129 @@
+"""
+Registro de Generadores - Nebula Uprising
+Un único generador por partida, sembrado una vez y repartido en flujos con nombre
+(apariciones, IA, botín, narrativa y efectos) que no se solapan entre sí
+"""
+
+import numpy as np
+from config.settings import RNG_SEED, RNG_PREFETCH, PRNG_BACKEND
+from utils.random_loader import create_prng
+
+# Flujos del registro; el orden fija qué subsecuencia recibe cada uno
+STREAM_SPAWN = "spawn"          # Posiciones de aparición e invocaciones del jefe
+STREAM_AI = "ai"                # Caminatas, objetivos y transiciones Markov, ráfagas del jefe
+STREAM_LOOT = "loot"            # Drops de power-ups y su tipo
+STREAM_NARRATIVE = "narrative"  # Fragmentos de historia
+STREAM_FX = "fx"                # Efectos visuales (estrellas del fondo y del menú)
+STREAM_NAMES = (STREAM_SPAWN, STREAM_AI, STREAM_LOOT, STREAM_NARRATIVE, STREAM_FX)
+
+class RandomStream:
+    """
+    Flujo con nombre. Precarga valores del generador en bloques (next_block) y los
+    entrega uno a uno; la secuencia es la misma que llamando a next() del generador.
+    Ofrece además los atajos de `random` que usa el juego (randint, choice, uniform).
+    """
+
+    def __init__(self, name, prefetch=RNG_PREFETCH):
+        self.name = name
+        self.prefetch_size = prefetch
+        self.generator = None
+        self._buffer = []
+        self._index = 0
+
+    def attach(self, generator):
+        """Asignar el generador del flujo, descartar lo precargado y precargar el primer bloque"""
+        self.generator = generator
+        self._buffer = []
+        self._index = 0
+        self.prefetch(self.prefetch_size)
+
+    def prefetch(self, n):
+        """Asegurar al menos n valores precargados (se piden al generador con next_block)"""
+        remaining = self._buffer[self._index:]
+        if len(remaining) < n:
+            remaining += self.generator.next_block(max(n - len(remaining), self.prefetch_size)).tolist()
+        self._buffer = remaining
+        self._index = 0
+
+    def next(self):
+        """Siguiente uniforme en [0,1)"""
+        if self._index >= len(self._buffer):
+            self._buffer = self.generator.next_block(self.prefetch_size).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    random = next
+
+    def peek(self, n):
+        """Los próximos n uniformes en un arreglo, sin consumirlos (quedan precargados)"""
+        self.prefetch(n)
+        return np.array(self._buffer[:n], dtype=np.float64)
+
+    def skip(self, n):
+        """Consumir n uniformes sin usarlos (normalmente los ya vistos con peek)"""
+        self.prefetch(n)
+        self._index += n
+
+    def next_block(self, n):
+        """n uniformes en un arreglo: primero lo precargado y el resto directo del generador"""
+        taken = self._buffer[self._index:self._index + n]
+        self._index += len(taken)
+        if len(taken) == n:
+            return np.array(taken, dtype=np.float64)
+        return np.concatenate((np.array(taken, dtype=np.float64), self.generator.next_block(n - len(taken))))
+
+    def next_choice(self, choices):
+        """Elegir un elemento (misma regla que PseudoRandom.next_choice)"""
+        if not choices:
+            raise ValueError("La lista de opciones no puede estar vacía")
+        return choices[int(self.next() * len(choices)) % len(choices)]
+
+    choice = next_choice
+
+    def randint(self, low, high):
+        """Entero en [low, high], ambos incluidos"""
+        return low + min(int(self.next() * (high - low + 1)), high - low)
+
+    def uniform(self, low, high):
+        """Real en [low, high)"""
+        return low + (high - low) * self.next()
+
+class RNGRegistry:
+    """
+    Registro de flujos sembrado desde una sola semilla. Cada flujo recibe una
+    subsecuencia disjunta del generador raíz (split), así que consumir más de un
+    flujo no altera a los demás.
+    """
+
+    def __init__(self, seed=RNG_SEED, backend=PRNG_BACKEND, prefetch=RNG_PREFETCH):
+        self.streams = {name: RandomStream(name, prefetch) for name in STREAM_NAMES}
+        self.seed = None
+        self.backend = backend
+        self.reseed(seed)
+
+    def reseed(self, seed, backend=None):
+        """
+        Volver a sembrar todos los flujos. Los objetos RandomStream se conservan,
+        así que las referencias guardadas en los módulos siguen siendo válidas.
+        """
+        self.seed = seed
+        self.backend = backend or self.backend
+        generators = create_prng(seed, self.backend).split(len(STREAM_NAMES))
+        for name, generator in zip(STREAM_NAMES, generators):
+            self.streams[name].attach(generator)
+
+    def stream(self, name):
+        """
+        Flujo por nombre.
+
+        Raises:
+            ValueError: si el flujo no existe
+        """
+        if name not in self.streams:
+            raise ValueError(f"Flujo aleatorio desconocido {name!r}; opciones: {list(STREAM_NAMES)}")
+        return self.streams[name]
+
+# Registro global de la partida (GameManager lo vuelve a sembrar al iniciar cada partida)
+RNG = RNGRegistry()